@@ -11,16 +11,16 @@ def debug_config():
     """Debug the configuration object"""
     config = get_config()
     print(f"Config type: {type(config)}")
-    print(f"Config attributes: {dir(config)}")
-    print(f"Environment: {getattr(config, 'environment', 'NOT FOUND')}")
-    print(f"Log level: {getattr(config, 'log_level', 'NOT FOUND')}")
-    print(f"Max workers: {getattr(config, 'max_workers', 'NOT FOUND')}")
-    print(f"Timeout seconds: {getattr(config, 'timeout_seconds', 'NOT FOUND')}")
     
-    # Check all attributes
-    for attr in ['environment', 'debug', 'log_level', 'enable_monitoring', 'max_workers', 'timeout_seconds', 'enable_validation', 'validation_timeout']:
-        value = getattr(config, attr, 'NOT FOUND')
+    # AppConfig is a pydantic model; dump its fields in one pass rather than
+    # probing attribute names one at a time
+    if hasattr(config, "model_dump"):
+        data = config.model_dump()
+    else:
+        data = dict(vars(config))
+    
+    for attr, value in data.items():
         print(f"{attr}: {value} (type: {type(value)})")
 
 if __name__ == "__main__":
-    debug_config()
\ No newline at end of file
+    debug_config()
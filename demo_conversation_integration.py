@@ -6,11 +6,29 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath('.'))
 
-from src.core.config import get_config
 from src.core.memory.manager import MemoryManager
 from src.core.validation_gates.manager import ValidationGates
 from src.integration_layer.manager import IntegrationLayer
-from datetime import datetime
+
+
+# Constant part of every profiling target; the nested methodology is shared
+# read-only across requests (tuples, never mutated downstream)
+_BASE_TARGET = {
+    "target_framework": "universal",  # Generic framework for initial analysis
+    "expected_concept": "agent_configuration",
+    "required_methodology": {
+        "steps": ("analyze", "design", "validate"),
+        "validation_gates": ("tech_implementation_check", "behavior_consistency_check", "semantic_accuracy_check")
+    }
+}
+
+
+# Example user requests that would trigger the backroom analysis
+_SAMPLE_REQUESTS = (
+    "I need to set up a system where multiple AI agents can collaborate on research tasks",
+    "Create an agent configuration for automating my software development workflow",
+    "Design a multi-agent system that can handle customer service inquiries"
+)
 
 
 class ConversationDrivenProfiler:
@@ -18,9 +36,21 @@ class ConversationDrivenProfiler:
     A minimal implementation that demonstrates how the three-pillar system
     operates as a backroom during user conversations
     """
+    __slots__ = ("memory_manager", "validation_gates", "integration_layer")
     
     def __init__(self):
-        self.config = get_config()
+        # The pillar stack is built on the first analysis request
+        self.memory_manager = None
+        self.validation_gates = None
+        self.integration_layer = None
+    
+    def _ensure_ready(self):
+        """
+        Construct the memory manager, validation gates and integration layer on first use
+        """
+        if self.integration_layer is not None:
+            return
+        
         self.memory_manager = MemoryManager()
         self.validation_gates = ValidationGates(memory_manager=self.memory_manager)
         
@@ -38,18 +68,12 @@ class ConversationDrivenProfiler:
         """
         Analyze a user's project description using the three-pillar backroom
         """
+        self._ensure_ready()
         print(f"\nAnalyzing project request: '{user_input}'")
         
         # Create a target for the integrated profiling
-        target = {
-            "user_intent": user_input,
-            "target_framework": "universal",  # Generic framework for initial analysis
-            "expected_concept": "agent_configuration",
-            "required_methodology": {
-                "steps": ["analyze", "design", "validate"],
-                "validation_gates": ["tech_implementation_check", "behavior_consistency_check", "semantic_accuracy_check"]
-            }
-        }
+        target = _BASE_TARGET.copy()
+        target["user_intent"] = user_input
         
         # Execute integrated profiling using the three-pillar system
         results = self.integration_layer.execute_integrated_profiling(target)
@@ -63,37 +87,45 @@ class ConversationDrivenProfiler:
         """
         Generate a user-friendly summary of the three-pillar analysis
         """
-        print(f"\n--- Analysis Summary for: '{original_request}' ---")
+        # Build the whole summary and emit it with a single write
+        lines = [f"\n--- Analysis Summary for: '{original_request}' ---"]
         
         # Technical pillar analysis
         tech_results = results.get("technical_pillar", {})
-        print(f"\nTechnical Analysis:")
+        lines.append("\nTechnical Analysis:")
         if "validation_tests" in tech_results:
-            passed_tests = [test for test in tech_results["validation_tests"] if test.get("status") == "pass"]
-            failed_tests = [test for test in tech_results["validation_tests"] if test.get("status") == "fail"]
-            print(f"  - Passed: {len(passed_tests)} tests")
-            print(f"  - Failed: {len(failed_tests)} tests")
+            passed_count = failed_count = 0
+            for test in tech_results["validation_tests"]:
+                status = test.get("status")
+                if status == "pass":
+                    passed_count += 1
+                elif status == "fail":
+                    failed_count += 1
+            lines.append(f"  - Passed: {passed_count} tests")
+            lines.append(f"  - Failed: {failed_count} tests")
         
         # Behavioral pillar analysis  
         behav_results = results.get("behavioral_pillar", {})
-        print(f"\nBehavioral Analysis:")
+        lines.append("\nBehavioral Analysis:")
         if "behavioral_consistency" in behav_results:
             status = behav_results["behavioral_consistency"]["status"]
-            print(f"  - Consistency: {status}")
+            lines.append(f"  - Consistency: {status}")
         
         # Semantic pillar analysis
         sem_results = results.get("semantic_pillar", {})
-        print(f"\nSemantic Analysis:")
+        lines.append("\nSemantic Analysis:")
         if "semantic_bridge" in sem_results:
             success = sem_results["semantic_bridge"]["overall_success"]
             translation = sem_results["semantic_bridge"]["translation_result"]["translated_intent"]
-            print(f"  - Translation successful: {success}")
-            print(f"  - Interpretation: {translation[:100]}...")
+            lines.append(f"  - Translation successful: {success}")
+            lines.append(f"  - Interpretation: {translation[:100]}...")
         
         # Integration score
         integration_score = results.get("integration_score", 0)
-        print(f"\nOverall Integration Score: {integration_score:.2f}")
-        print(f"--- End Analysis Summary ---\n")
+        lines.append(f"\nOverall Integration Score: {integration_score:.2f}")
+        lines.append("--- End Analysis Summary ---\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_conversation_flow():
@@ -105,14 +137,7 @@ def demo_conversation_flow():
     # Initialize the system
     profiler = ConversationDrivenProfiler()
     
-    # Example user requests that would trigger the backroom analysis
-    sample_requests = [
-        "I need to set up a system where multiple AI agents can collaborate on research tasks",
-        "Create an agent configuration for automating my software development workflow",
-        "Design a multi-agent system that can handle customer service inquiries"
-    ]
-    
-    for i, request in enumerate(sample_requests, 1):
+    for i, request in enumerate(_SAMPLE_REQUESTS, 1):
         print(f"\n--- Sample Request {i} ---")
         results = profiler.analyze_project_request(request)
         
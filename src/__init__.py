@@ -3,16 +3,36 @@ Qwen Profiler - Multi-Pillar AI Agent Configuration System
 
 Main package initialization for the Qwen Profiler system.
 """
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
-# Import key components for easy access
-from .main import run
-from .core.config import ConfigManager, get_config, AppConfig
+# Key components are resolved lazily (PEP 562) so importing a subpackage does
+# not pull in the full pillar graph behind the application entry point
+_LAZY_IMPORTS = {
+    "run": ".main",
+    "ConfigManager": ".core.config",
+    "get_config": ".core.config",
+    "AppConfig": ".core.config",
+}
 
 __all__ = [
     "run",
     "ConfigManager", 
     "get_config",
     "AppConfig"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,13 +3,24 @@ Behavioral Pillar Package for Qwen Profiler
 
 Contains all cognitive framework and response formation components.
 """
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
-# Import key components for easy access
-from .behavioral_architect.manager import BehavioralArchitect, BehavioralPattern, BehavioralPatternType
-from .cognitive_validator.manager import CognitiveValidator, CognitivePatternType, CognitiveDriftType
-from .response_coordinator.manager import ResponseCoordinator, ResponseProtocol, ResponseQuality
+# Key components are resolved lazily (PEP 562) so only the submodule that is
+# actually used gets imported
+_LAZY_IMPORTS = {
+    "BehavioralArchitect": ".behavioral_architect.manager",
+    "BehavioralPattern": ".behavioral_architect.manager",
+    "BehavioralPatternType": ".behavioral_architect.manager",
+    "CognitiveValidator": ".cognitive_validator.manager",
+    "CognitivePatternType": ".cognitive_validator.manager",
+    "CognitiveDriftType": ".cognitive_validator.manager",
+    "ResponseCoordinator": ".response_coordinator.manager",
+    "ResponseProtocol": ".response_coordinator.manager",
+    "ResponseQuality": ".response_coordinator.manager",
+}
 
 __all__ = [
     "BehavioralArchitect",
@@ -21,4 +32,17 @@ __all__ = [
     "ResponseCoordinator",
     "ResponseProtocol",
     "ResponseQuality"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
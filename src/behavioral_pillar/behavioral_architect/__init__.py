@@ -3,13 +3,33 @@ Behavioral Architect Module
 
 Manages cognitive framework design, response methodology design, and behavioral pattern creation.
 """
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
-from .manager import BehavioralArchitect, BehavioralPattern, BehavioralPatternType
+# Key components are resolved lazily (PEP 562) on first attribute access
+_LAZY_IMPORTS = {
+    "BehavioralArchitect": ".manager",
+    "BehavioralPattern": ".manager",
+    "BehavioralPatternType": ".manager",
+}
 
 __all__ = [
     "BehavioralArchitect",
     "BehavioralPattern",
     "BehavioralPatternType"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,8 @@ Handles cognitive framework design, response methodology design, and behavioral
 """
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import logging
+from functools import cached_property
+import sys
 from enum import Enum
 
 from ...core.config import get_config
@@ -12,6 +13,10 @@ from ...core.memory.manager import MemoryManager, MemoryEntry, MemoryType
 from ...core.validation_gates.manager import ValidationGates
 
 
+# Sentinel for single-lookup registry access
+_MISSING = object()
+
+
 class BehavioralPatternType(Enum):
     """Types of behavioral patterns"""
     RESPONSE_FORMATION = "response_formation"
@@ -20,31 +25,118 @@ class BehavioralPatternType(Enum):
     CONSISTENCY_PATTERNS = "consistency_patterns"
 
 
+# Pattern type values in declaration order, resolved once for reporting
+_PATTERN_TYPE_VALUES = tuple(pattern_type.value for pattern_type in BehavioralPatternType)
+
+
+# Memory entry id prefixes and shared (read-only) tag tuples
+_PATTERN_ID_PREFIX = "behavioral_pattern_"
+_VALIDATION_ID_PREFIX = "behavioral_validation_"
+_ARCHITECTURE_ID_PREFIX = "cognitive_architecture_"
+_METHODOLOGY_ID_PREFIX = "methodology_"
+_PATTERN_TAGS = {
+    pattern_type: ("behavioral", "pattern", pattern_type.value)
+    for pattern_type in BehavioralPatternType
+}
+_VALIDATION_TAGS = ("behavioral", "validation")
+_ARCHITECTURE_TAGS = ("behavioral", "architecture", "cognitive")
+_METHODOLOGY_TAGS = ("behavioral", "methodology")
+
+# Pattern type -> (definition key, target key, issue prefix) used for validation
+_VALIDATION_DISPATCH = {
+    BehavioralPatternType.RESPONSE_FORMATION: (
+        "required_elements", "response_elements", "Missing required element"
+    ),
+    BehavioralPatternType.COGNITIVE_PROCESSING: (
+        "steps", "processing_steps", "Missing processing step"
+    ),
+    BehavioralPatternType.METHODOLOGY_ADHERENCE: (
+        "required_checks", "performed_checks", "Missing methodology check"
+    ),
+}
+
+
 class BehavioralPattern:
     """Represents a behavioral pattern"""
+    # Fixed attribute layout: patterns are serialized on every report and
+    # memory update, so attribute access stays on slot offsets
+    __slots__ = (
+        "name", "type", "_definition", "description", "created_at",
+        "_created_iso", "_last_modified", "_last_modified_iso", "enabled",
+        "version", "_validation_spec", "_to_dict_cache"
+    )
+    
     def __init__(self, name: str, pattern_type: BehavioralPatternType, 
                  definition: Dict[str, Any], description: str = ""):
         self.name = name
         self.type = pattern_type
         self.definition = definition  # Contains the actual pattern logic/structure
         self.description = description
-        self.created_at = datetime.now()
-        self.last_modified = datetime.now()
+        now = datetime.now()
+        self.created_at = now
+        self._created_iso = now.isoformat()
+        self.last_modified = now
         self.enabled = True
         self.version = "1.0"
     
+    @property
+    def definition(self) -> Dict[str, Any]:
+        """Pattern definition (logic/structure)"""
+        return self._definition
+    
+    @definition.setter
+    def definition(self, definition: Dict[str, Any]):
+        self._definition = definition
+        self._to_dict_cache = None
+        # Resolve the (required items, target key, issue prefix) validation spec
+        # once per definition so validation does not re-derive it on every call;
+        # order is kept for stable issue reporting. None means nothing to check.
+        self._validation_spec = None
+        spec = _VALIDATION_DISPATCH.get(self.type)
+        if spec is not None:
+            definition_key, target_key, issue_prefix = spec
+            required = tuple(definition.get(definition_key, ()))
+            if required:
+                self._validation_spec = (required, target_key, issue_prefix)
+    
+    @property
+    def last_modified(self) -> datetime:
+        """Time of the last modification"""
+        return self._last_modified
+    
+    @last_modified.setter
+    def last_modified(self, value: datetime):
+        self._last_modified = value
+        # Serialized once per modification instead of on every to_dict()
+        self._last_modified_iso = value.isoformat()
+        self._to_dict_cache = None
+    
+    def set_enabled(self, enabled: bool):
+        """Enable or disable the pattern"""
+        self.enabled = enabled
+        self._to_dict_cache = None
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation"""
-        return {
-            "name": self.name,
-            "type": self.type.value,
-            "definition": self.definition,
-            "description": self.description,
-            "created_at": self.created_at.isoformat(),
-            "last_modified": self.last_modified.isoformat(),
-            "enabled": self.enabled,
-            "version": self.version
-        }
+        """
+        Convert to dictionary representation
+        
+        The result is cached until the definition, last_modified or enabled
+        state changes; other fields are only updated alongside last_modified.
+        """
+        cached = self._to_dict_cache
+        if cached is None:
+            cached = self._to_dict_cache = {
+                "name": self.name,
+                "type": self.type.value,
+                "definition": self.definition,
+                "description": self.description,
+                "created_at": self._created_iso,
+                "last_modified": self._last_modified_iso,
+                "enabled": self.enabled,
+                "version": self.version
+            }
+        # Callers may mutate the result (e.g. memory patches), so hand out a copy
+        return cached.copy()
 
 
 class BehavioralArchitect:
@@ -55,7 +147,6 @@ class BehavioralArchitect:
         self.config = get_config()
         self.memory_manager = memory_manager or MemoryManager()
         self.validation_gates = validation_gates or ValidationGates()
-        self.logger = logging.getLogger(__name__)
         
         # Behavioral patterns registry
         self.patterns: Dict[str, BehavioralPattern] = {}
@@ -63,9 +154,15 @@ class BehavioralArchitect:
         # Initialize with basic system patterns
         self._init_system_patterns()
     
+    @cached_property
+    def logger(self):
+        """Logger, created on first use since most calls never log"""
+        import logging
+        return logging.getLogger(__name__)
+    
     def _init_system_patterns(self):
         """Initialize with basic behavioral patterns"""
-        system_patterns = [
+        system_patterns = (
             BehavioralPattern(
                 name="default_response_formation",
                 pattern_type=BehavioralPatternType.RESPONSE_FORMATION,
@@ -96,14 +193,16 @@ class BehavioralArchitect:
                 },
                 description="Methodology adherence checkpoints"
             )
-        ]
+        )
         
-        for pattern in system_patterns:
-            self.patterns[pattern.name] = pattern
+        # System patterns are registry-only: storing them as behavioral pattern
+        # memories would make them the drift-detection baseline
+        self.patterns.update((pattern.name, pattern) for pattern in system_patterns)
     
     def register_pattern(self, name: str, pattern_type: BehavioralPatternType,
                         definition: Dict[str, Any], description: str = "") -> bool:
         """Register a new behavioral pattern"""
+        name = sys.intern(name)
         if name in self.patterns:
             self.logger.warning(f"Pattern {name} already exists")
             return False
@@ -112,18 +211,21 @@ class BehavioralArchitect:
         self.patterns[name] = pattern
         
         # Store in memory for tracking
-        memory_entry = MemoryEntry(
-            id=f"behavioral_pattern_{name}",
+        self.memory_manager.store(self._pattern_memory_entry(pattern))
+        
+        self.logger.info(f"Registered behavioral pattern: {name}")
+        return True
+    
+    def _pattern_memory_entry(self, pattern: BehavioralPattern) -> MemoryEntry:
+        """Build the long-term memory entry tracking a pattern"""
+        return MemoryEntry(
+            id=_PATTERN_ID_PREFIX + pattern.name,
             content=pattern.to_dict(),
-            creation_time=datetime.now(),
+            creation_time=pattern.created_at,
             memory_type=MemoryType.LONG_TERM,
-            tags=["behavioral", "pattern", pattern_type.value],
+            tags=_PATTERN_TAGS[pattern.type],
             priority=8
         )
-        self.memory_manager.store(memory_entry)
-        
-        self.logger.info(f"Registered behavioral pattern: {name}")
-        return True
     
     def get_pattern(self, name: str) -> Optional[BehavioralPattern]:
         """Get a behavioral pattern by name"""
@@ -132,21 +234,21 @@ class BehavioralArchitect:
     def update_pattern(self, name: str, definition: Optional[Dict[str, Any]] = None,
                       description: Optional[str] = None) -> bool:
         """Update an existing behavioral pattern"""
-        if name not in self.patterns:
+        pattern = self.patterns.get(name, _MISSING)
+        if pattern is _MISSING:
             return False
         
-        pattern = self.patterns[name]
-        
         if definition is not None:
             pattern.definition = definition
-            pattern.last_modified = datetime.now()
         
         if description is not None:
             pattern.description = description
+        
+        if definition is not None or description is not None:
             pattern.last_modified = datetime.now()
         
         # Update memory entry
-        memory_entry = self.memory_manager.retrieve(f"behavioral_pattern_{name}")
+        memory_entry = self.memory_manager.retrieve(_PATTERN_ID_PREFIX + name)
         if memory_entry:
             memory_entry.content = pattern.to_dict()
             self.memory_manager.store(memory_entry)
@@ -156,6 +258,9 @@ class BehavioralArchitect:
     def validate_behavioral_framework(self, target_behavior: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a behavioral framework against registered patterns"""
         validation_results = []
+        # Bound once outside the per-pattern loop
+        validate = self._validate_against_pattern
+        append_result = validation_results.append
         
         # Check against all enabled patterns
         for pattern in self.patterns.values():
@@ -163,31 +268,32 @@ class BehavioralArchitect:
                 continue
             
             # Perform validation based on pattern type
-            result = self._validate_against_pattern(target_behavior, pattern)
-            validation_results.append({
+            append_result({
                 "pattern_name": pattern.name,
                 "pattern_type": pattern.type.value,
-                "result": result
+                "result": validate(target_behavior, pattern)
             })
         
         # Store validation results in memory
+        now = datetime.now()
+        timestamp = now.isoformat()
         validation_entry = MemoryEntry(
-            id=f"behavioral_validation_{datetime.now().isoformat()}",
+            id=_VALIDATION_ID_PREFIX + timestamp,
             content={
                 "target_behavior": target_behavior,
                 "validation_results": validation_results,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             },
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.SHORT_TERM,
-            tags=["behavioral", "validation"],
+            tags=_VALIDATION_TAGS,
             ttl=self.config.timeout_seconds * 4
         )
         self.memory_manager.store(validation_entry)
         
         return {
             "validation_results": validation_results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
     def _validate_against_pattern(self, target: Dict[str, Any], 
@@ -201,40 +307,27 @@ class BehavioralArchitect:
             "details": {}
         }
         
-        # Example validation logic based on pattern type
-        if pattern.type == BehavioralPatternType.RESPONSE_FORMATION:
-            required_elements = pattern.definition.get("required_elements", [])
-            for element in required_elements:
-                if element not in target.get("response_elements", []):
-                    result["compliant"] = False
-                    result["issues"].append(f"Missing required element: {element}")
-        
-        elif pattern.type == BehavioralPatternType.COGNITIVE_PROCESSING:
-            required_steps = pattern.definition.get("steps", [])
-            target_steps = target.get("processing_steps", [])
-            
-            missing_steps = [step for step in required_steps if step not in target_steps]
-            if missing_steps:
-                result["compliant"] = False
-                result["issues"].extend([f"Missing processing step: {step}" for step in missing_steps])
+        # Validation logic based on the pattern's precomputed spec
+        spec = pattern._validation_spec
+        if spec is None:
+            return result
         
-        elif pattern.type == BehavioralPatternType.METHODOLOGY_ADHERENCE:
-            required_checks = pattern.definition.get("required_checks", [])
-            target_checks = target.get("performed_checks", [])
-            
-            missing_checks = [check for check in required_checks if check not in target_checks]
-            if missing_checks:
-                result["compliant"] = False
-                result["issues"].extend([f"Missing methodology check: {check}" for check in missing_checks])
+        required, target_key, issue_prefix = spec
+        target_items = set(target.get(target_key, ()))
+        missing = [item for item in required if item not in target_items]
+        if missing:
+            result["compliant"] = False
+            result["issues"].extend([f"{issue_prefix}: {item}" for item in missing])
         
         return result
-    
+
     def create_cognitive_architecture(self, name: str, components: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create a cognitive architecture from behavioral patterns"""
+        now = datetime.now()
         architecture = {
             "name": name,
             "components": components,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "patterns_used": [],
             "validation_status": "pending"
         }
@@ -243,16 +336,15 @@ class BehavioralArchitect:
         for component in components:
             pattern_name = component.get("based_on_pattern")
             if pattern_name and pattern_name in self.patterns:
-                pattern = self.patterns[pattern_name]
                 architecture["patterns_used"].append(pattern_name)
         
         # Store architecture in memory
         architecture_entry = MemoryEntry(
-            id=f"cognitive_architecture_{name}",
+            id=_ARCHITECTURE_ID_PREFIX + name,
             content=architecture,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.LONG_TERM,
-            tags=["behavioral", "architecture", "cognitive"],
+            tags=_ARCHITECTURE_TAGS,
             priority=9
         )
         self.memory_manager.store(architecture_entry)
@@ -261,48 +353,47 @@ class BehavioralArchitect:
     
     def generate_methodology(self, name: str, patterns_to_combine: List[str]) -> Dict[str, Any]:
         """Generate a methodology by combining behavioral patterns"""
+        now = datetime.now()
         methodology = {
             "name": name,
             "description": f"Methodology combining patterns: {', '.join(patterns_to_combine)}",
             "patterns": [],
             "steps": [],
             "validation_requirements": [],
-            "created_at": datetime.now().isoformat()
+            "created_at": now.isoformat()
         }
         
-        # Combine relevant patterns
+        # Combine relevant patterns; insertion-ordered dicts dedupe as we go
+        steps: Dict[Any, None] = {}
+        validation_requirements: Dict[Any, None] = {}
         for pattern_name in patterns_to_combine:
-            if pattern_name in self.patterns:
-                pattern = self.patterns[pattern_name]
-                methodology["patterns"].append({
-                    "name": pattern.name,
-                    "type": pattern.type.value,
-                    "definition": pattern.definition
-                })
-                
-                # Extract steps from the pattern if applicable
-                if "steps" in pattern.definition:
-                    methodology["steps"].extend(pattern.definition["steps"])
-                
-                # Extract validation requirements
-                if "required_checks" in pattern.definition:
-                    methodology["validation_requirements"].extend(
-                        pattern.definition["required_checks"]
-                    )
+            pattern = self.patterns.get(pattern_name, _MISSING)
+            if pattern is _MISSING:
+                continue
+            
+            definition = pattern.definition
+            methodology["patterns"].append({
+                "name": pattern.name,
+                "type": pattern.type.value,
+                "definition": definition
+            })
+            
+            # Extract steps and validation requirements from the pattern
+            steps.update((step, None) for step in definition.get("steps", ()))
+            validation_requirements.update(
+                (check, None) for check in definition.get("required_checks", ())
+            )
         
-        # Remove duplicates while maintaining order
-        methodology["steps"] = list(dict.fromkeys(methodology["steps"]))
-        methodology["validation_requirements"] = list(
-            dict.fromkeys(methodology["validation_requirements"])
-        )
+        methodology["steps"] = list(steps)
+        methodology["validation_requirements"] = list(validation_requirements)
         
         # Store methodology in memory
         methodology_entry = MemoryEntry(
-            id=f"methodology_{name}",
+            id=_METHODOLOGY_ID_PREFIX + name,
             content=methodology,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.LONG_TERM,
-            tags=["behavioral", "methodology"],
+            tags=_METHODOLOGY_TAGS,
             priority=8
         )
         self.memory_manager.store(methodology_entry)
@@ -311,42 +402,44 @@ class BehavioralArchitect:
     
     def get_behavioral_report(self) -> Dict[str, Any]:
         """Generate a comprehensive behavioral patterns report"""
+        by_type = dict.fromkeys(_PATTERN_TYPE_VALUES, 0)
+        enabled_patterns = 0
+        pattern_dicts = []
+        
+        # Single pass over the registry for counts and serialization
+        for pattern in self.patterns.values():
+            by_type[pattern.type.value] += 1
+            enabled_patterns += pattern.enabled
+            pattern_dicts.append(pattern.to_dict())
+        
         report = {
             "summary": {
                 "total_patterns": len(self.patterns),
-                "by_type": {
-                    pattern_type.value: len([p for p in self.patterns.values() 
-                                           if p.type == pattern_type])
-                    for pattern_type in BehavioralPatternType
-                },
-                "enabled_patterns": len([p for p in self.patterns.values() if p.enabled]),
+                "by_type": by_type,
+                "enabled_patterns": enabled_patterns,
                 "timestamp": datetime.now().isoformat()
             },
-            "patterns": [pattern.to_dict() for pattern in self.patterns.values()]
+            "patterns": pattern_dicts
         }
         
         return report
     
     def enable_pattern(self, name: str) -> bool:
         """Enable a behavioral pattern"""
-        if name not in self.patterns:
+        pattern = self.patterns.get(name, _MISSING)
+        if pattern is _MISSING:
             return False
-        self.patterns[name].enabled = True
-        # Update memory
-        memory_entry = self.memory_manager.retrieve(f"behavioral_pattern_{name}")
-        if memory_entry:
-            memory_entry.content = self.patterns[name].to_dict()
-            self.memory_manager.store(memory_entry)
+        pattern.set_enabled(True)
+        # Update memory in place
+        self.memory_manager.patch(_PATTERN_ID_PREFIX + name, {"enabled": True})
         return True
     
     def disable_pattern(self, name: str) -> bool:
         """Disable a behavioral pattern"""
-        if name not in self.patterns:
+        pattern = self.patterns.get(name, _MISSING)
+        if pattern is _MISSING:
             return False
-        self.patterns[name].enabled = False
-        # Update memory
-        memory_entry = self.memory_manager.retrieve(f"behavioral_pattern_{name}")
-        if memory_entry:
-            memory_entry.content = self.patterns[name].to_dict()
-            self.memory_manager.store(memory_entry)
+        pattern.set_enabled(False)
+        # Update memory in place
+        self.memory_manager.patch(_PATTERN_ID_PREFIX + name, {"enabled": False})
         return True
\ No newline at end of file
@@ -6,10 +6,11 @@ Manages behavioral consistency monitoring, methodology adherence, and cognitive
 __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
-from .manager import CognitiveValidator, CognitivePatternType, CognitiveDriftType
+from .manager import CognitiveValidator, CognitivePatternType, CognitiveDriftType, BehaviorSnapshot
 
 __all__ = [
     "CognitiveValidator",
     "CognitivePatternType",
-    "CognitiveDriftType"
+    "CognitiveDriftType",
+    "BehaviorSnapshot"
 ]
\ No newline at end of file
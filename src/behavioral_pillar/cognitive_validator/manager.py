@@ -2,13 +2,17 @@
 Cognitive Validator Manager for the Qwen Profiler
 Handles behavioral consistency monitoring, methodology adherence, and cognitive pattern validation
 """
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Deque, Collection
+from collections import deque
+from dataclasses import dataclass
+import copy
 from datetime import datetime, timedelta
+from itertools import islice
 import logging
 from enum import Enum
 
 from ...core.config import get_config
-from ...core.memory.manager import MemoryManager, MemoryEntry, MemoryType
+from ...core.memory.manager import MemoryManager, MemoryEntry, MemoryType, sequenced_entry_id
 from ...core.validation_gates.manager import ValidationGates, ValidationResult, GateStatus
 from ..behavioral_architect.manager import BehavioralArchitect, BehavioralPattern
 
@@ -31,6 +35,82 @@ class CognitiveDriftType(Enum):
     CONTEXT_COLLAPSE = "context_collapse"
 
 
+# Bounds for in-process drift tracking so long-lived validators keep flat memory
+MAX_DETECTED_DRIFTS = 1000
+MAX_DRIFT_HISTORY = 200
+
+
+# Expected steps in a reasoning flow
+REASONING_FLOW_STEPS = ("perceive", "analyze", "reason", "conclude")
+_EXPECTED_REASONING_STEPS = frozenset(REASONING_FLOW_STEPS)
+
+# Gate identifiers reported when the corresponding validation rule is not registered
+_FALLBACK_GATE_BEHAVIOR = "_validate_behavioral_consistency"
+_FALLBACK_GATE_METHODOLOGY = "_validate_methodology_adherence"
+
+# Response characteristics compared when checking responses for consistency
+RESPONSE_CONSISTENCY_KEYS = ("tone", "format", "content_style")
+
+# Cognitive patterns every validator starts out tracking ("last_seen" is set per instance)
+_TRACKED_PATTERN_TEMPLATE = {
+    "default_reasoning_flow": {
+        "type": CognitivePatternType.REASONING_FLOW.value,
+        "definition": {
+            "required_steps": list(REASONING_FLOW_STEPS),
+            "validation_points": ["fact_check", "logic_validation", "consistency_check"]
+        },
+        "last_seen": None,
+        "compliance_count": 0,
+        "non_compliance_count": 0
+    },
+    "default_response_consistency": {
+        "type": CognitivePatternType.RESPONSE_CONSISTENCY.value,
+        "definition": {
+            "elements_to_track": list(RESPONSE_CONSISTENCY_KEYS),
+            "consistency_threshold": 0.8
+        },
+        "last_seen": None,
+        "compliance_count": 0,
+        "non_compliance_count": 0
+    }
+}
+
+
+def _response_signature(response: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Characteristics compared when checking responses for consistency"""
+    # Simplified comparison - in a real system, this would use more sophisticated NLP
+    return tuple(map(response.get, RESPONSE_CONSISTENCY_KEYS))
+
+
+@dataclass
+class BehaviorSnapshot:
+    """Behavior model prepared once for repeated drift comparisons"""
+    __slots__ = ("reasoning_steps", "reasoning_types", "responses",
+                 "first_response_style", "methodology_followed")
+    
+    reasoning_steps: Tuple[Dict[str, Any], ...]
+    reasoning_types: Tuple[Any, ...]
+    responses: Tuple[Dict[str, Any], ...]
+    first_response_style: Optional[str]
+    methodology_followed: frozenset
+    
+    @classmethod
+    def from_dict(cls, behavior: Dict[str, Any],
+                  methodology_followed: Optional[frozenset] = None) -> 'BehaviorSnapshot':
+        """Build a snapshot from a behavior payload dict"""
+        reasoning_steps = tuple(behavior.get("reasoning_steps", ()))
+        responses = tuple(behavior.get("responses", ()))
+        if methodology_followed is None:
+            methodology_followed = frozenset(behavior.get("methodology_followed", ()))
+        return cls(
+            reasoning_steps=reasoning_steps,
+            reasoning_types=tuple(step.get("type") for step in reasoning_steps),
+            responses=responses,
+            first_response_style=responses[0].get("style") if responses else None,
+            methodology_followed=methodology_followed
+        )
+
+
 class CognitiveValidator:
     """Manages behavioral consistency monitoring, methodology adherence, and cognitive pattern validation"""
     
@@ -43,42 +123,48 @@ class CognitiveValidator:
         self.behavioral_architect = behavioral_architect or BehavioralArchitect()
         self.logger = logging.getLogger(__name__)
         
+        # Resolve the gates reported on validation results once
+        self._behavior_gate = self._resolve_gate("behavior_consistency_check", _FALLBACK_GATE_BEHAVIOR)
+        self._methodology_gate = self._resolve_gate("methodology_adherence_check", _FALLBACK_GATE_METHODOLOGY)
+        
         # Track cognitive patterns and drifts
         self.tracked_patterns: Dict[str, Dict[str, Any]] = {}
-        self.detected_drifts: List[Dict[str, Any]] = []
-        self.drift_history: List[Dict[str, Any]] = []
+        self.detected_drifts: Deque[Dict[str, Any]] = deque(maxlen=MAX_DETECTED_DRIFTS)
+        self.drift_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_DRIFT_HISTORY)
+        
+        # Drift section of the cognitive report, rebuilt only after new drifts
+        self._drifts_version = 0
+        self._drift_report_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # (baseline methodology list, its frozenset) for the most recent baseline;
+        # baselines are reused across bursts of drift checks and never mutated
+        self._baseline_methodology_cache: Optional[Tuple[Any, frozenset]] = None
         
         # Initialize tracking system
         self._init_tracking_system()
     
+    def _resolve_gate(self, rule_id: str, fallback: Any) -> Any:
+        """Get the gate of a validation rule, or the fallback if the rule is not registered"""
+        rule = self.validation_gates._rules.get(rule_id)
+        return rule.gate if rule else fallback
+    
     def _init_tracking_system(self):
         """Initialize the cognitive pattern tracking system"""
-        # Initialize with common pattern templates
-        self.tracked_patterns = {
-            "default_reasoning_flow": {
-                "type": CognitivePatternType.REASONING_FLOW.value,
-                "definition": {
-                    "required_steps": ["perceive", "analyze", "reason", "conclude"],
-                    "validation_points": ["fact_check", "logic_validation", "consistency_check"]
-                },
-                "last_seen": datetime.now().isoformat(),
-                "compliance_count": 0,
-                "non_compliance_count": 0
-            },
-            "default_response_consistency": {
-                "type": CognitivePatternType.RESPONSE_CONSISTENCY.value,
-                "definition": {
-                    "elements_to_track": ["tone", "format", "content_style"],
-                    "consistency_threshold": 0.8
-                },
-                "last_seen": datetime.now().isoformat(),
-                "compliance_count": 0,
-                "non_compliance_count": 0
-            }
-        }
+        # Initialize with common pattern templates, stamped with a single timestamp
+        now_iso = datetime.now().isoformat()
+        self.tracked_patterns = copy.deepcopy(_TRACKED_PATTERN_TEMPLATE)
+        for pattern in self.tracked_patterns.values():
+            pattern["last_seen"] = now_iso
     
-    def validate_behavioral_consistency(self, target_behavior: Dict[str, Any]) -> ValidationResult:
-        """Validate behavioral consistency against established patterns"""
+    def validate_behavioral_consistency(self, target_behavior: Dict[str, Any],
+                                        now: Optional[datetime] = None,
+                                        collector: Optional[List[MemoryEntry]] = None,
+                                        fast_fail: bool = False) -> ValidationResult:
+        """Validate behavioral consistency against established patterns
+        
+        With fast_fail, checking stops at the first inconsistency, so the result
+        reports only that issue; use it when only the status is needed.
+        """
         # This is a simplified validation - in a real system, this would be more comprehensive
         issues = []
         
@@ -86,14 +172,16 @@ class CognitiveValidator:
         responses = target_behavior.get("responses", [])
         if len(responses) > 1:
             # Compare first response with others for consistency
-            first_response = responses[0]
+            first_signature = _response_signature(responses[0])
             for i, response in enumerate(responses[1:], 1):
-                if not self._compare_responses(first_response, response):
+                if _response_signature(response) != first_signature:
                     issues.append(f"Inconsistency detected between response 0 and response {i}")
+                    if fast_fail:
+                        break
         
         # Check for reasoning consistency
         reasoning_steps = target_behavior.get("reasoning_steps", [])
-        if len(reasoning_steps) > 0:
+        if len(reasoning_steps) > 0 and not (fast_fail and issues):
             if not self._validate_reasoning_flow(reasoning_steps):
                 issues.append("Reasoning flow deviates from expected pattern")
         
@@ -106,73 +194,56 @@ class CognitiveValidator:
             message = "Behavioral consistency validation passed"
         
         result = ValidationResult(
-            gate=self.validation_gates._rules.get("behavior_consistency_check").gate
-            if self.validation_gates._rules.get("behavior_consistency_check")
-            else self.validation_gates._validate_behavioral_consistency.__code__.co_name,
+            gate=self._behavior_gate,
             status=status,
             message=message,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             metadata={"validation_type": "behavioral_consistency", "issues_count": len(issues)},
             errors=issues
         )
         
         # Store validation result in memory
-        self._store_validation_result(result, target_behavior)
+        self._store_validation_result(result, target_behavior, collector)
         
         return result
     
-    def _compare_responses(self, response1: Dict[str, Any], response2: Dict[str, Any]) -> bool:
-        """Compare two responses for consistency"""
-        # Simplified comparison - in a real system, this would use more sophisticated NLP
-        keys_to_compare = ["tone", "format", "content_style"]
-        
-        for key in keys_to_compare:
-            val1 = response1.get(key)
-            val2 = response2.get(key)
-            
-            if val1 != val2:
-                return False
-        
-        return True
-    
     def _validate_reasoning_flow(self, reasoning_steps: List[Dict[str, Any]]) -> bool:
         """Validate that reasoning follows expected flow"""
-        # Expected steps in a reasoning flow
-        expected_steps = ["perceive", "analyze", "reason", "conclude"]
-        
         # Check if all required steps are present
-        step_types = [step.get("type") for step in reasoning_steps]
-        
-        for expected_step in expected_steps:
-            if expected_step not in step_types:
-                return False
-        
-        return True
+        return _EXPECTED_REASONING_STEPS.issubset(step.get("type") for step in reasoning_steps)
     
-    def validate_methodology_adherence(self, target_process: Dict[str, Any]) -> ValidationResult:
+    def validate_methodology_adherence(self, target_process: Dict[str, Any],
+                                       now: Optional[datetime] = None,
+                                       collector: Optional[List[MemoryEntry]] = None) -> ValidationResult:
         """Validate adherence to established methodologies"""
         issues = []
 
+        methodology = target_process.get("required_methodology") or {}
+
         # Check if required methodology steps were performed
-        required_steps = target_process.get("required_methodology", {}).get("steps", [])
-        performed_steps = target_process.get("performed_steps", [])
+        required_steps = methodology.get("steps") or ()
+        performed_steps = target_process.get("performed_steps") or ()
 
         # Only check for missing steps if both required and performed steps are defined
         if required_steps and performed_steps:
-            missing_steps = [step for step in required_steps if step not in performed_steps]
-            if missing_steps:
-                issues.extend([f"Missing required methodology step: {step}" for step in missing_steps])
+            performed_set = set(performed_steps)
+            issues.extend(
+                f"Missing required methodology step: {step}"
+                for step in required_steps if step not in performed_set
+            )
         # If no required steps or no performed steps, consider it as passing during system initialization
 
         # Check if required validation gates were passed
-        required_gates = target_process.get("required_methodology", {}).get("validation_gates", [])
-        passed_gates = target_process.get("passed_validation_gates", [])
+        required_gates = methodology.get("validation_gates") or ()
+        passed_gates = target_process.get("passed_validation_gates") or ()
 
         # Only check for missing gates if both required and passed gates are defined
         if required_gates and passed_gates:
-            missing_gates = [gate for gate in required_gates if gate not in passed_gates]
-            if missing_gates:
-                issues.extend([f"Missing required validation gate: {gate}" for gate in missing_gates])
+            passed_set = set(passed_gates)
+            issues.extend(
+                f"Missing required validation gate: {gate}"
+                for gate in required_gates if gate not in passed_set
+            )
         # If no required gates or no passed gates, consider it as passing during system initialization
 
         # Determine status based on issues found
@@ -184,22 +255,22 @@ class CognitiveValidator:
             message = "Methodology adherence validation passed"
 
         result = ValidationResult(
-            gate=self.validation_gates._rules.get("methodology_adherence_check").gate
-            if self.validation_gates._rules.get("methodology_adherence_check")
-            else self.validation_gates._validate_methodology_adherence.__code__.co_name,
+            gate=self._methodology_gate,
             status=status,
             message=message,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             metadata={"validation_type": "methodology_adherence", "issues_count": len(issues)},
             errors=issues
         )
 
         # Store validation result in memory
-        self._store_validation_result(result, target_process)
+        self._store_validation_result(result, target_process, collector)
 
         return result
     
-    def validate_cognitive_patterns(self, target_cognition: Dict[str, Any]) -> ValidationResult:
+    def validate_cognitive_patterns(self, target_cognition: Dict[str, Any],
+                                    now: Optional[datetime] = None,
+                                    collector: Optional[List[MemoryEntry]] = None) -> ValidationResult:
         """Validate cognitive patterns against expected models"""
         issues = []
         
@@ -207,9 +278,12 @@ class CognitiveValidator:
         patterns_to_match = target_cognition.get("expected_patterns", [])
         actual_patterns = target_cognition.get("observed_patterns", [])
         
-        for pattern in patterns_to_match:
-            if pattern not in actual_patterns:
-                issues.append(f"Expected cognitive pattern not found: {pattern}")
+        if patterns_to_match:
+            actual_set = set(actual_patterns)
+            issues.extend(
+                f"Expected cognitive pattern not found: {pattern}"
+                for pattern in patterns_to_match if pattern not in actual_set
+            )
         
         # Check for pattern consistency over time
         if "pattern_sequence" in target_cognition:
@@ -226,18 +300,16 @@ class CognitiveValidator:
             message = "Cognitive pattern validation passed"
         
         result = ValidationResult(
-            gate=self.validation_gates._rules.get("behavior_consistency_check").gate
-            if self.validation_gates._rules.get("behavior_consistency_check")
-            else self.validation_gates._validate_behavioral_consistency.__code__.co_name,
+            gate=self._behavior_gate,
             status=status,
             message=message,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             metadata={"validation_type": "cognitive_patterns", "issues_count": len(issues)},
             errors=issues
         )
         
         # Store validation result in memory
-        self._store_validation_result(result, target_cognition)
+        self._store_validation_result(result, target_cognition, collector)
         
         return result
     
@@ -251,9 +323,17 @@ class CognitiveValidator:
         # This would be expanded with actual domain knowledge in a real system
         return True
     
-    def detect_cognitive_drift(self, current_behavior: Dict[str, Any], 
-                              baseline_behavior: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Detect cognitive drift from baseline behavior"""
+    def detect_cognitive_drift(self, current_behavior: Any, 
+                              baseline_behavior: Optional[Any] = None,
+                              now: Optional[datetime] = None,
+                              collector: Optional[List[MemoryEntry]] = None) -> List[Dict[str, Any]]:
+        """
+        Detect cognitive drift from baseline behavior
+        
+        Either behavior may be a payload dict or a BehaviorSnapshot; callers comparing
+        against the same baseline repeatedly should convert it once with
+        BehaviorSnapshot.from_dict.
+        """
         drifts_detected = []
         
         if baseline_behavior is None:
@@ -267,78 +347,80 @@ class CognitiveValidator:
         # Compare current behavior with baseline
         drifts = self._compare_behaviors(current_behavior, baseline_behavior)
         
+        # One timestamp for every drift recorded by this call
+        now = now or datetime.now()
+        timestamp = now.isoformat()
+        
         for drift_type, details in drifts.items():
             if details["detected"]:
                 drift_record = {
                     "drift_type": drift_type,
                     "severity": details.get("severity", "medium"),
                     "details": details,
-                    "timestamp": datetime.now().isoformat(),
-                    "drift_id": f"drift_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.detected_drifts)}"
+                    "timestamp": timestamp,
+                    "drift_id": sequenced_entry_id("drift")
                 }
                 
                 drifts_detected.append(drift_record)
                 self.detected_drifts.append(drift_record)
+                self._drifts_version += 1
                 
                 # Store drift in memory
                 drift_entry = MemoryEntry(
                     id=f"cognitive_drift_{drift_record['drift_id']}",
                     content=drift_record,
-                    creation_time=datetime.now(),
+                    creation_time=now,
                     memory_type=MemoryType.SHORT_TERM,
                     tags=["cognitive", "drift", drift_type],
                     priority=9,
                     ttl=timedelta(hours=24)  # Keep drift records for 24 hours
                 )
-                self.memory_manager.store(drift_entry)
+                self._store_entry(drift_entry, collector)
         
         return drifts_detected
     
-    def _compare_behaviors(self, current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
-        """Compare two behavior models to detect drift"""
+    def _compare_behaviors(self, current: Any, baseline: Any) -> Dict[str, Any]:
+        """Compare two behavior models (snapshots or payload dicts) to detect drift"""
+        if not isinstance(current, BehaviorSnapshot):
+            current = BehaviorSnapshot.from_dict(current)
+        if not isinstance(baseline, BehaviorSnapshot):
+            baseline = BehaviorSnapshot.from_dict(
+                baseline,
+                self._baseline_methodology_set(baseline.get("methodology_followed", []))
+            )
+        
         drifts = {}
         
         # Detect reasoning deviation
-        current_reasoning = current.get("reasoning_steps", [])
-        baseline_reasoning = baseline.get("reasoning_steps", [])
-        
-        reasoning_deviation = len(current_reasoning) != len(baseline_reasoning)
-        if not reasoning_deviation:
-            # Check if the types of reasoning steps match
-            current_types = [step.get("type") for step in current_reasoning]
-            baseline_types = [step.get("type") for step in baseline_reasoning]
-            reasoning_deviation = current_types != baseline_types
+        current_count = len(current.reasoning_types)
+        baseline_count = len(baseline.reasoning_types)
+        reasoning_deviation = current.reasoning_types != baseline.reasoning_types
         
         drifts[CognitiveDriftType.REASONING_DEVIATION.value] = {
             "detected": reasoning_deviation,
             "severity": "high" if reasoning_deviation else "none",
-            "baseline_count": len(baseline_reasoning),
-            "current_count": len(current_reasoning)
+            "baseline_count": baseline_count,
+            "current_count": current_count
         }
         
         # Detect response inconsistency
-        current_responses = current.get("responses", [])
-        baseline_responses = baseline.get("responses", [])
+        current_count = len(current.responses)
+        baseline_count = len(baseline.responses)
         
-        response_inconsistency = len(current_responses) != len(baseline_responses)
-        if not response_inconsistency and current_responses and baseline_responses:
+        response_inconsistency = current_count != baseline_count
+        if not response_inconsistency and current_count:
             # Check if responses have similar characteristics
-            current_style = current_responses[0].get("style") if current_responses else None
-            baseline_style = baseline_responses[0].get("style") if baseline_responses else None
-            response_inconsistency = current_style != baseline_style
+            response_inconsistency = current.first_response_style != baseline.first_response_style
         
         drifts[CognitiveDriftType.RESPONSE_INCONSISTENCY.value] = {
             "detected": response_inconsistency,
             "severity": "medium" if response_inconsistency else "none",
-            "baseline_count": len(baseline_responses),
-            "current_count": len(current_responses)
+            "baseline_count": baseline_count,
+            "current_count": current_count
         }
         
         # Detect methodology violation
-        current_methodology = current.get("methodology_followed", [])
-        baseline_methodology = baseline.get("methodology_followed", [])
-        
-        methodology_violation = set(baseline_methodology) - set(current_methodology)
+        methodology_violation = baseline.methodology_followed - current.methodology_followed
         drifts[CognitiveDriftType.METHODOLOGY_VIOLATION.value] = {
             "detected": bool(methodology_violation),
             "severity": "high" if methodology_violation else "none",
@@ -349,26 +431,39 @@ class CognitiveValidator:
         
         return drifts
     
+    def _baseline_methodology_set(self, methodology: List[str]) -> frozenset:
+        """Get the baseline methodology as a set, reusing it while the baseline is unchanged"""
+        cached = self._baseline_methodology_cache
+        if cached is not None and cached[0] is methodology:
+            return cached[1]
+        
+        methodology_set = frozenset(methodology)
+        # Holding the list itself keeps the identity check valid
+        self._baseline_methodology_cache = (methodology, methodology_set)
+        return methodology_set
+    
     def _get_historical_baseline(self) -> Optional[Dict[str, Any]]:
         """Get historical baseline behavior from memory"""
-        # Look for recent behavioral records in memory
-        behavioral_entries = self.memory_manager.search(
-            tags=["behavioral", "pattern"], 
+        # Return the most recent behavioral record as baseline
+        latest_entry = self.memory_manager.get_latest(
+            tags=["behavioral", "pattern"],
             memory_type=MemoryType.LONG_TERM
         )
-        
-        # Return the most recent behavioral pattern as baseline
-        if behavioral_entries:
-            # Sort by creation time, most recent first
-            behavioral_entries.sort(key=lambda x: x.creation_time, reverse=True)
-            return behavioral_entries[0].content
-        
-        return None
+        return latest_entry.content if latest_entry else None
+    
+    def _store_entry(self, entry: MemoryEntry, collector: Optional[List[MemoryEntry]] = None):
+        """Store a memory entry now, or queue it on the collector for a batched store"""
+        if collector is None:
+            self.memory_manager.store(entry)
+        else:
+            collector.append(entry)
     
-    def _store_validation_result(self, result: ValidationResult, target: Any):
+    def _store_validation_result(self, result: ValidationResult, target: Any,
+                                 collector: Optional[List[MemoryEntry]] = None):
         """Store validation result in memory"""
+        timestamp = result.timestamp.isoformat()
         result_entry = MemoryEntry(
-            id=f"validation_result_{result.gate.value}_{datetime.now().isoformat()}",
+            id=sequenced_entry_id(f"validation_result_{result.gate.value}"),
             content={
                 "result": {
                     "gate": result.gate.value,
@@ -378,25 +473,36 @@ class CognitiveValidator:
                     "errors": result.errors
                 },
                 "target": str(target) if target else "N/A",
-                "timestamp": result.timestamp.isoformat()
+                "timestamp": timestamp
             },
             creation_time=result.timestamp,
             memory_type=MemoryType.SHORT_TERM,
             tags=["cognitive_validation", "result", result.gate.value],
             ttl=self.config.timeout_seconds * 5  # Keep results for 5x timeout duration
         )
-        self.memory_manager.store(result_entry)
+        self._store_entry(result_entry, collector)
     
-    def run_comprehensive_validation(self, target: Dict[str, Any]) -> Dict[str, Any]:
-        """Run all cognitive validations on a target"""
+    def run_comprehensive_validation(self, target: Dict[str, Any], fast_fail: bool = False) -> Dict[str, Any]:
+        """Run all cognitive validations on a target
+        
+        fast_fail is passed to the behavioral consistency check for callers that
+        only need statuses (e.g. monitoring probes).
+        """
+        # A single timestamp shared by every record of this run
+        now = datetime.now()
+        timestamp = now.isoformat()
+        # Memory entries of the run are queued and stored in one batch
+        pending: List[MemoryEntry] = []
         validation_results = {
-            "behavioral_consistency": self.validate_behavioral_consistency(target),
-            "methodology_adherence": self.validate_methodology_adherence(target),
-            "cognitive_patterns": self.validate_cognitive_patterns(target)
+            "behavioral_consistency": self.validate_behavioral_consistency(
+                target, now=now, collector=pending, fast_fail=fast_fail
+            ),
+            "methodology_adherence": self.validate_methodology_adherence(target, now=now, collector=pending),
+            "cognitive_patterns": self.validate_cognitive_patterns(target, now=now, collector=pending)
         }
         
         # Detect cognitive drifts
-        drifts = self.detect_cognitive_drift(target)
+        drifts = self.detect_cognitive_drift(target, now=now, collector=pending)
         
         comprehensive_result = {
             "validation_results": {
@@ -407,33 +513,45 @@ class CognitiveValidator:
                 } for k, v in validation_results.items()
             },
             "detected_drifts": drifts,
-            "overall_status": self._determine_overall_status(list(validation_results.values())),
-            "timestamp": datetime.now().isoformat()
+            "overall_status": self._determine_overall_status(validation_results.values()),
+            "timestamp": timestamp
         }
         
         # Store comprehensive result in memory
         comprehensive_entry = MemoryEntry(
-            id=f"comprehensive_cognitive_validation_{datetime.now().isoformat()}",
+            id=sequenced_entry_id("comprehensive_cognitive_validation"),
             content=comprehensive_result,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.SHORT_TERM,
             tags=["cognitive_validation", "comprehensive"],
             ttl=self.config.timeout_seconds * 10  # Keep comprehensive results longer
         )
-        self.memory_manager.store(comprehensive_entry)
+        pending.append(comprehensive_entry)
+        self.memory_manager.store_many(pending)
         
         return comprehensive_result
     
-    def _determine_overall_status(self, validation_results: List[ValidationResult]) -> str:
+    def _determine_overall_status(self, validation_results: Collection[ValidationResult]) -> str:
         """Determine overall status based on multiple validation results"""
-        statuses = [result.status for result in validation_results]
-        
-        if GateStatus.FAIL in statuses:
+        if any(result.status is GateStatus.FAIL for result in validation_results):
             return "fail"
-        elif GateStatus.PENDING in statuses:
+        if any(result.status is GateStatus.PENDING for result in validation_results):
             return "pending"
-        else:
-            return "pass"
+        return "pass"
+    
+    def _get_drift_report(self) -> Dict[str, Any]:
+        """Get the drift section of the report, reusing it until drifts change"""
+        cached = self._drift_report_cache
+        if cached is not None and cached[0] == self._drifts_version:
+            return cached[1]
+        
+        drift_report = {
+            "current": list(self.detected_drifts),
+            # Last 20 drifts from history
+            "history": list(islice(self.drift_history, max(0, len(self.drift_history) - 20), None))
+        }
+        self._drift_report_cache = (self._drifts_version, drift_report)
+        return drift_report
     
     def get_cognitive_report(self) -> Dict[str, Any]:
         """Generate a comprehensive cognitive validation report"""
@@ -444,10 +562,7 @@ class CognitiveValidator:
                 "drift_history_count": len(self.drift_history),
                 "timestamp": datetime.now().isoformat()
             },
-            "drifts": {
-                "current": self.detected_drifts,
-                "history": self.drift_history[-20:]  # Last 20 drifts from history
-            },
+            "drifts": self._get_drift_report(),
             "validation_stats": self.validation_gates.get_validation_stats() if self.validation_gates else {}
         }
         
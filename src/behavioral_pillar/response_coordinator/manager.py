@@ -2,13 +2,20 @@
 Response Coordinator Manager for the Qwen Profiler
 Handles response protocol implementation, quality assurance, and systematic observation application
 """
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple, Mapping, Sequence
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 import logging
+import queue
+import sys
+import threading
 from enum import Enum
 
 from ...core.config import get_config
-from ...core.memory.manager import MemoryManager, MemoryEntry, MemoryType
+from ...core.lazy import locked_cached_property
+from ...core.memory.manager import MemoryManager, MemoryEntry, MemoryType, sequenced_entry_id
 from ...core.validation_gates.manager import ValidationGates, ValidationResult, GateStatus
 from ..behavioral_architect.manager import BehavioralArchitect
 from ..cognitive_validator.manager import CognitiveValidator
@@ -31,52 +38,247 @@ class ResponseQuality(Enum):
     FAILED = "failed"
 
 
+# Bound on memory entries waiting for the background persist worker
+MAX_PENDING_PERSISTS = 1024
+
+# Queue marker telling the persist worker to exit
+_PERSIST_STOP = object()
+
+
+# Observation checks that always pass, with the details each one reports
+_PASSING_OBSERVATION_CHECKS = {
+    "clarity_check": "Clarity assessment completed",
+    "relevance_check": "Relevance assessment completed",
+    "completeness_check": "Completeness assessment completed",
+    "timeliness_check": "Timeliness assessment completed",
+    "tone_consistency": "Tone consistency assessment completed",
+    "format_consistency": "Format consistency assessment completed",
+    "content_style_consistency": "Content style consistency assessment completed"
+}
+
+
+@dataclass
+class StepResult:
+    """Outcome of a single protocol step"""
+    __slots__ = ("step", "result", "success")
+    
+    step: str
+    result: Dict[str, Any]
+    success: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert step result to dictionary"""
+        return {"step": self.step, "result": self.result, "success": self.success}
+
+
+@dataclass
+class GateResult:
+    """Outcome of a validation gate run for a protocol"""
+    __slots__ = ("gate", "status", "message")
+    
+    gate: str
+    status: str
+    message: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert gate result to dictionary"""
+        return {"gate": self.gate, "status": self.status, "message": self.message}
+
+
+@dataclass(frozen=True)
+class ProtocolPlan:
+    """A response protocol's steps, gates and checkpoints compiled for execution"""
+    __slots__ = ("steps", "gates", "checkpoints")
+    
+    steps: Tuple[str, ...]
+    gates: Tuple[str, ...]
+    checkpoints: Tuple[str, ...]
+    
+    @classmethod
+    def from_definition(cls, definition: Mapping[str, Any]) -> 'ProtocolPlan':
+        """Compile a protocol definition, interning its step, gate and checkpoint names"""
+        return cls(
+            steps=tuple(map(sys.intern, definition["requirement_steps"])),
+            gates=tuple(map(sys.intern, definition.get("validation_gates", ()))),
+            checkpoints=tuple(map(sys.intern, definition.get("quality_checkpoints", ())))
+        )
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep copy of a configuration value: mappings become proxies, lists tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Plain deep copy of a frozen value: proxies become dicts, tuples lists"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _passing_check_result(check_name: str, details: str) -> Dict[str, Any]:
+    """Fresh result of an always-passing observation check"""
+    return {"check": check_name, "result": {"success": True}, "details": details}
+
+
+def _quality_signals(response: Dict[str, Any]) -> Tuple[bool, bool, bool, bool]:
+    """Response features the quality scores depend on: (facts or citations, structured, topic aligned, complete coverage)"""
+    return (
+        bool(response.get("facts") or response.get("citations")),
+        bool(response.get("structured")),
+        bool(response.get("topic_aligned")),
+        bool(response.get("complete_coverage"))
+    )
+
+
+# Per criterion: (index into the response signals, score when the signal is present,
+# score when it is absent); criteria without a signal always get the first score.
+# This is a simplified calculation - in a real system, this would be more sophisticated
+_CRITERION_SCORES = {
+    "accuracy": (0, 0.85, 0.6),         # presence of facts or citations
+    "clarity": (1, 0.8, 0.65),          # structure
+    "relevance": (2, 0.9, 0.4),         # topic alignment
+    "completeness": (3, 0.75, 0.5),     # coverage of key points
+    "timeliness": (None, 0.95, 0.95)    # all responses are timely in this simulation
+}
+
+
+def _criterion_score(criterion: str, signals: Tuple[bool, bool, bool, bool]) -> float:
+    """Calculate the quality score for a criterion from the response signals"""
+    spec = _CRITERION_SCORES.get(criterion)
+    if spec is None:
+        return 0.5  # Default score if criterion is unknown
+    
+    signal_index, present_score, absent_score = spec
+    if signal_index is None or signals[signal_index]:
+        return present_score
+    return absent_score
+
+
 class ResponseCoordinator:
     """Manages response protocol implementation, quality assurance, and systematic observation application"""
     
+    _FAIL_STATUS = GateStatus.FAIL.value
+    
+    # Minimum weighted score for each quality level, best first
+    _QUALITY_LEVELS = (
+        (0.9, ResponseQuality.EXCELLENT.value),
+        (0.8, ResponseQuality.GOOD.value),
+        (0.7, ResponseQuality.ADEQUATE.value),
+        (0.5, ResponseQuality.POOR.value)
+    )
+    
     def __init__(self, memory_manager: Optional[MemoryManager] = None, 
                  validation_gates: Optional[ValidationGates] = None,
                  behavioral_architect: Optional[BehavioralArchitect] = None,
-                 cognitive_validator: Optional[CognitiveValidator] = None):
+                 cognitive_validator: Optional[CognitiveValidator] = None,
+                 background_persist: bool = False):
         self.config = get_config()
-        self.memory_manager = memory_manager or MemoryManager()
-        self.validation_gates = validation_gates or ValidationGates()
-        self.behavioral_architect = behavioral_architect or BehavioralArchitect()
-        self.cognitive_validator = cognitive_validator or CognitiveValidator(
-            memory_manager=self.memory_manager,
-            validation_gates=self.validation_gates,
-            behavioral_architect=self.behavioral_architect
-        )
+        # Collaborators that were not supplied are created on first use
+        self._memory_manager_arg = memory_manager
+        self._validation_gates_arg = validation_gates
+        self._behavioral_architect_arg = behavioral_architect
+        self._cognitive_validator_arg = cognitive_validator
         self.logger = logging.getLogger(__name__)
         
+        # Result entries are stored by a worker thread when background_persist is set
+        self._persist_queue: Optional[queue.Queue] = None
+        self._persist_thread: Optional[threading.Thread] = None
+        if background_persist:
+            # Resolve the memory manager before the worker thread can race to create it
+            self.memory_manager
+            self._persist_queue = queue.Queue(maxsize=MAX_PENDING_PERSISTS)
+            self._persist_thread = threading.Thread(
+                target=self._persist_worker, name="response-coordinator-persist", daemon=True
+            )
+            self._persist_thread.start()
+        
         # Response protocols registry
         self.response_protocols: Dict[str, Dict[str, Any]] = {}
         
-        # Quality assessment criteria
-        self.quality_criteria: Dict[str, Any] = {}
+        # Execution plans compiled from response_protocols on first use
+        self._compiled_protocols: Dict[str, ProtocolPlan] = {}
+        
+        # Protocols section of the coordination report; cleared when protocols are registered
+        self._protocol_report_cache: Optional[Dict[str, Any]] = None
         
-        # Systematic observation templates
-        self.observation_templates: Dict[str, Dict[str, Any]] = {}
+        # Quality assessment criteria (read-only; replaced as a whole on change)
+        self.quality_criteria: Mapping[str, Mapping[str, float]] = MappingProxyType({})
+        
+        # Systematic observation templates (read-only; replaced as a whole on change)
+        self.observation_templates: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+        # Per template: (check name, shared constant result or None) for each required check
+        self._template_checks: Dict[str, Tuple[Tuple[str, Optional[Mapping[str, Any]]], ...]] = {}
         
         # Initialize system
         self._init_system_components()
     
+    @locked_cached_property
+    def memory_manager(self) -> MemoryManager:
+        """Memory manager, created on first use when none was supplied"""
+        return self._memory_manager_arg or MemoryManager()
+    
+    @locked_cached_property
+    def validation_gates(self) -> ValidationGates:
+        """Validation gates, created on first use when none were supplied"""
+        return self._validation_gates_arg or ValidationGates()
+    
+    @locked_cached_property
+    def behavioral_architect(self) -> BehavioralArchitect:
+        """Behavioral architect, created on first use when none was supplied"""
+        return self._behavioral_architect_arg or BehavioralArchitect()
+    
+    @locked_cached_property
+    def cognitive_validator(self) -> CognitiveValidator:
+        """Cognitive validator, created on first use when none was supplied"""
+        return self._cognitive_validator_arg or CognitiveValidator(
+            memory_manager=self.memory_manager,
+            validation_gates=self.validation_gates,
+            behavioral_architect=self.behavioral_architect
+        )
+    
     def _init_system_components(self):
         """Initialize the response coordination system components"""
         # Register default response protocols
         self._register_default_protocols()
         
+        # Dispatch tables for protocol steps and observation checks
+        self._step_dispatch: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "validate_content_accuracy": self._validate_content_accuracy,
+            "check_formatting_standards": self._check_formatting_standards,
+            "verify_citation_requirements": self._verify_citation_requirements,
+            "ensure_compliance_with_guidelines": self._ensure_compliance_with_guidelines,
+            "apply_quality_criteria": self._apply_quality_criteria,
+            "perform_systematic_review": self._perform_systematic_review,
+            "validate_response_quality": self._validate_response_quality,
+            "confirm_user_satisfaction_indicators": self._confirm_user_satisfaction_indicators,
+            "apply_observation_template": self._apply_observation_template,
+            "perform_structured_analysis": self._perform_structured_analysis,
+            "document_observations": self._document_observations,
+            "apply_improvement_feedback": self._apply_improvement_feedback
+        }
+        # Checks listed in _PASSING_OBSERVATION_CHECKS always pass and need no entry here
+        self._check_dispatch: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "accuracy_check": self._accuracy_observation_check
+        }
+        
         # Set up quality assessment criteria
-        self.quality_criteria = {
+        self.quality_criteria = _freeze({
             "accuracy": {"weight": 0.3, "threshold": 0.8},
             "clarity": {"weight": 0.2, "threshold": 0.7},
             "relevance": {"weight": 0.2, "threshold": 0.8},
             "completeness": {"weight": 0.15, "threshold": 0.75},
             "timeliness": {"weight": 0.15, "threshold": 0.8}
-        }
+        })
         
         # Set up observation templates
-        self.observation_templates = {
+        self._set_observation_templates({
             "quality_assessment": {
                 "template": {
                     "accuracy_check": True,
@@ -95,7 +297,25 @@ class ResponseCoordinator:
                 },
                 "required_for": ["all"]
             }
+        })
+    
+    def _set_observation_templates(self, templates: Mapping[str, Mapping[str, Any]]):
+        """
+        Install a frozen copy of the observation templates with their required checks precompiled
+        
+        Checks with a constant outcome are resolved to their details here, so applying
+        a template only runs the checks that depend on the target.
+        """
+        frozen = _freeze(templates)
+        # Compiled checks are installed first so readers never see a template without them
+        self._template_checks = {
+            name: tuple(
+                (check, _PASSING_OBSERVATION_CHECKS.get(check))
+                for check, required in template["template"].items() if required
+            )
+            for name, template in frozen.items()
         }
+        self.observation_templates = frozen
     
     def _register_default_protocols(self):
         """Register default response protocols"""
@@ -140,112 +360,170 @@ class ResponseCoordinator:
         
         for name, protocol in default_protocols.items():
             self.response_protocols[name] = protocol
+            self._compiled_protocols.pop(name, None)
+        self._protocol_report_cache = None
     
     def coordinate_response(self, request: Dict[str, Any], protocol_name: str = "standards_compliant") -> Dict[str, Any]:
         """Coordinate the formation of a response using a specific protocol"""
-        if protocol_name not in self.response_protocols:
-            self.logger.error(f"Unknown protocol: {protocol_name}")
-            return {
-                "status": "error",
-                "error": f"Unknown protocol: {protocol_name}",
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        protocol = self.response_protocols[protocol_name]
+        protocol_name = sys.intern(protocol_name)
+        plan = self._get_protocol_plan(protocol_name)
+        if plan is None:
+            return self._unknown_protocol_result(protocol_name)
         
         # Execute protocol steps
-        execution_results = []
-        all_successful = True
+        step_results = [
+            self._run_protocol_step(step, request) for step in plan.steps
+        ]
+        
+        # Perform validation gate checks required by protocol
+        gate_results = self._check_validation_gates(plan.gates, request)
+        
+        return self._compile_coordination_result(protocol_name, request, step_results, gate_results)
+    
+    async def coordinate_response_async(self, request: Dict[str, Any],
+                                        protocol_name: str = "standards_compliant") -> Dict[str, Any]:
+        """
+        Coordinate the formation of a response like coordinate_response, running the
+        protocol steps and validation gates concurrently in worker threads
+        """
+        protocol_name = sys.intern(protocol_name)
+        plan = self._get_protocol_plan(protocol_name)
+        if plan is None:
+            return self._unknown_protocol_result(protocol_name)
         
-        for step in protocol["requirement_steps"]:
+        # gather keeps step results in protocol order regardless of completion order;
+        # gates run as one batch since ValidationGates serializes them on its lock
+        step_results, gate_results = await asyncio.gather(
+            asyncio.gather(*(
+                asyncio.to_thread(self._run_protocol_step, step, request)
+                for step in plan.steps
+            )),
+            asyncio.to_thread(self._check_validation_gates, plan.gates, request)
+        )
+        
+        return self._compile_coordination_result(protocol_name, request, step_results, gate_results)
+    
+    def _get_protocol_plan(self, protocol_name: str) -> Optional[ProtocolPlan]:
+        """Get the compiled plan for a registered protocol, compiling it on first use"""
+        plan = self._compiled_protocols.get(protocol_name)
+        if plan is None:
+            definition = self.response_protocols.get(protocol_name)
+            if definition is None:
+                return None
+            plan = self._compiled_protocols[protocol_name] = ProtocolPlan.from_definition(definition)
+        return plan
+    
+    def _unknown_protocol_result(self, protocol_name: str) -> Dict[str, Any]:
+        """Error result for a request naming an unregistered protocol"""
+        self.logger.error(f"Unknown protocol: {protocol_name}")
+        return {
+            "status": "error",
+            "error": f"Unknown protocol: {protocol_name}",
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _run_protocol_step(self, step: str, request: Dict[str, Any]) -> StepResult:
+        """Execute a protocol step and record its outcome"""
+        # Only the step body itself needs the exception guard
+        step_func = self._step_dispatch.get(step)
+        if step_func is None:
+            result = {"success": False, "error": f"Unknown protocol step: {step}"}
+        else:
             try:
-                result = self._execute_protocol_step(step, request)
-                execution_results.append({
-                    "step": step,
-                    "result": result,
-                    "success": result["success"]
-                })
-                
-                if not result["success"]:
-                    all_successful = False
-                    self.logger.warning(f"Protocol step failed: {step}")
-                    
+                result = step_func(request)
             except Exception as e:
-                execution_results.append({
-                    "step": step,
-                    "result": {"error": str(e)},
-                    "success": False
-                })
-                all_successful = False
                 self.logger.error(f"Protocol step execution failed: {step}, error: {e}")
+                return StepResult(step, {"error": str(e)}, False)
         
-        # Perform validation gate checks required by protocol
-        validation_results = []
-        for gate_id in protocol.get("validation_gates", []):
-            gate_result = self.validation_gates.validate_rule(gate_id, request)
-            if gate_result:
-                validation_results.append({
-                    "gate": gate_id,
-                    "status": gate_result.status.value,
-                    "message": gate_result.message
-                })
+        # A step result that does not report success counts as a failure
+        success = bool(result.get("success", False))
+        if not success:
+            self.logger.warning(f"Protocol step failed: {step}")
+        return StepResult(step, result, success)
+    
+    def _check_validation_gates(self, gate_ids: Sequence[str], request: Dict[str, Any]) -> List[GateResult]:
+        """Run the protocol's validation gates for the request, skipping gates that did not run"""
+        gate_results = self.validation_gates.validate_rules(gate_ids, request)
+        return [
+            GateResult(gate_id, gate_result.status.value, gate_result.message)
+            for gate_id, gate_result in zip(gate_ids, gate_results)
+            if gate_result
+        ]
+    
+    def _compile_coordination_result(self, protocol_name: str, request: Dict[str, Any],
+                                     step_results: List[StepResult],
+                                     gate_results: List[GateResult]) -> Dict[str, Any]:
+        """Assess quality, compile the coordination result and store it in memory"""
+        overall_success = (
+            all(step.success for step in step_results)
+            and self._is_validation_successful(gate_results)
+        )
+        
+        # One timestamp for the coordination result and its quality assessment
+        now = datetime.now()
+        now_iso = now.isoformat()
         
         # Assess quality according to protocol
-        quality_result = self.assess_response_quality(request)
+        quality_result = self.assess_response_quality(request, now=now)
         
         # Compile response coordination result
         result = {
             "protocol": protocol_name,
             "request": request,
-            "execution_results": execution_results,
-            "validation_results": validation_results,
+            "execution_results": [step.to_dict() for step in step_results],
+            "validation_results": [gate.to_dict() for gate in gate_results],
             "quality_assessment": quality_result,
-            "overall_success": all_successful and self._is_validation_successful(validation_results),
-            "timestamp": datetime.now().isoformat()
+            "overall_success": overall_success,
+            "timestamp": now_iso
         }
         
         # Store coordination result in memory
         coordination_entry = MemoryEntry(
-            id=f"response_coordination_{protocol_name}_{datetime.now().isoformat()}",
+            id=sequenced_entry_id(f"response_coordination_{protocol_name}"),
             content=result,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.SHORT_TERM,
             tags=["response_coordination", "protocol", protocol_name],
             ttl=self.config.timeout_seconds * 6
         )
-        self.memory_manager.store(coordination_entry)
+        self._persist(coordination_entry)
         
         return result
     
-    def _execute_protocol_step(self, step_name: str, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a specific step in the response protocol"""
-        # Implement protocol-specific functionality
-        if step_name == "validate_content_accuracy":
-            return self._validate_content_accuracy(request)
-        elif step_name == "check_formatting_standards":
-            return self._check_formatting_standards(request)
-        elif step_name == "verify_citation_requirements":
-            return self._verify_citation_requirements(request)
-        elif step_name == "ensure_compliance_with_guidelines":
-            return self._ensure_compliance_with_guidelines(request)
-        elif step_name == "apply_quality_criteria":
-            return self._apply_quality_criteria(request)
-        elif step_name == "perform_systematic_review":
-            return self._perform_systematic_review(request)
-        elif step_name == "validate_response_quality":
-            return self._validate_response_quality(request)
-        elif step_name == "confirm_user_satisfaction_indicators":
-            return self._confirm_user_satisfaction_indicators(request)
-        elif step_name == "apply_observation_template":
-            return self._apply_observation_template(request)
-        elif step_name == "perform_structured_analysis":
-            return self._perform_structured_analysis(request)
-        elif step_name == "document_observations":
-            return self._document_observations(request)
-        elif step_name == "apply_improvement_feedback":
-            return self._apply_improvement_feedback(request)
+    def _persist(self, entry: MemoryEntry):
+        """Store a result entry, handing it to the persist worker when one is running"""
+        if self._persist_queue is None:
+            self.memory_manager.store(entry)
         else:
-            return {"success": False, "error": f"Unknown protocol step: {step_name}"}
+            self._persist_queue.put(entry)
+    
+    def _persist_worker(self):
+        """Store queued entries until the stop marker arrives"""
+        persist_queue = self._persist_queue
+        while True:
+            entry = persist_queue.get()
+            try:
+                if entry is _PERSIST_STOP:
+                    return
+                self.memory_manager.store(entry)
+            except Exception as e:
+                self.logger.error(f"Background persist failed for {entry.id}: {e}")
+            finally:
+                persist_queue.task_done()
+    
+    def flush(self):
+        """Wait until every queued result entry has been stored"""
+        if self._persist_queue is not None:
+            self._persist_queue.join()
+    
+    def close(self):
+        """Store any queued result entries and stop the persist worker"""
+        if self._persist_thread is None:
+            return
+        self._persist_queue.put(_PERSIST_STOP)
+        self._persist_thread.join()
+        self._persist_thread = None
+        self._persist_queue = None
     
     def _validate_content_accuracy(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Validate the accuracy of content in the response"""
@@ -319,90 +597,65 @@ class ResponseCoordinator:
         # For now, this is a placeholder
         return {"success": True, "details": "Improvement feedback applied"}
     
-    def _is_validation_successful(self, validation_results: List[Dict[str, Any]]) -> bool:
-        """Check if validation results indicate success"""
-        for result in validation_results:
-            if result["status"] == GateStatus.FAIL.value:
-                return False
-        return True
+    def _is_validation_successful(self, gate_results: Sequence[GateResult]) -> bool:
+        """Check if validation gate results indicate success"""
+        fail_status = self._FAIL_STATUS
+        return not any(gate.status == fail_status for gate in gate_results)
     
-    def assess_response_quality(self, response: Dict[str, Any]) -> Dict[str, Any]:
+    def assess_response_quality(self, response: Dict[str, Any],
+                                now: Optional[datetime] = None) -> Dict[str, Any]:
         """Assess the quality of a response based on defined criteria"""
         # Initialize quality scores
         quality_scores = {}
+        weighted_score = 0.0
         
-        # Calculate individual quality metrics
+        # Calculate individual quality metrics and their weighted sum in one pass;
+        # scores only depend on the response signals
+        signals = _quality_signals(response)
         for criterion, params in self.quality_criteria.items():
-            score = self._calculate_quality_score(criterion, response)
+            score = _criterion_score(criterion, signals)
+            weight = params["weight"]
+            threshold = params["threshold"]
             quality_scores[criterion] = {
                 "score": score,
-                "weight": params["weight"],
-                "threshold": params["threshold"],
-                "passed": score >= params["threshold"]
+                "weight": weight,
+                "threshold": threshold,
+                "passed": score >= threshold
             }
-        
-        # Calculate weighted average score
-        weighted_score = sum(
-            quality_scores[criterion]["score"] * quality_scores[criterion]["weight"]
-            for criterion in quality_scores
-        )
+            weighted_score += score * weight
         
         # Determine overall quality level
-        if weighted_score >= 0.9:
-            quality_level = ResponseQuality.EXCELLENT.value
-        elif weighted_score >= 0.8:
-            quality_level = ResponseQuality.GOOD.value
-        elif weighted_score >= 0.7:
-            quality_level = ResponseQuality.ADEQUATE.value
-        elif weighted_score >= 0.5:
-            quality_level = ResponseQuality.POOR.value
-        else:
-            quality_level = ResponseQuality.FAILED.value
+        quality_level = next(
+            (level for threshold, level in self._QUALITY_LEVELS if weighted_score >= threshold),
+            ResponseQuality.FAILED.value
+        )
         
+        now = now or datetime.now()
+        now_iso = now.isoformat()
         quality_result = {
             "individual_scores": quality_scores,
             "weighted_average": weighted_score,
             "overall_quality": quality_level,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Store quality assessment in memory
         quality_entry = MemoryEntry(
-            id=f"response_quality_assessment_{datetime.now().isoformat()}",
+            id=sequenced_entry_id("response_quality_assessment"),
             content=quality_result,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.SHORT_TERM,
             tags=["response_quality", "assessment"],
             ttl=self.config.timeout_seconds * 8
         )
-        self.memory_manager.store(quality_entry)
+        self._persist(quality_entry)
         
         return quality_result
     
-    def _calculate_quality_score(self, criterion: str, response: Dict[str, Any]) -> float:
-        """Calculate quality score for a specific criterion"""
-        # This is a simplified calculation - in a real system, this would be more sophisticated
-        if criterion == "accuracy":
-            # Placeholder: assume accuracy is based on presence of facts or citations
-            return 0.85 if response.get("facts") or response.get("citations") else 0.6
-        elif criterion == "clarity":
-            # Placeholder: assume clarity is based on structure
-            return 0.8 if response.get("structured") else 0.65
-        elif criterion == "relevance":
-            # Placeholder: assume relevance is based on topic alignment
-            return 0.9 if response.get("topic_aligned") else 0.4
-        elif criterion == "completeness":
-            # Placeholder: assume completeness is based on coverage of key points
-            return 0.75 if response.get("complete_coverage") else 0.5
-        elif criterion == "timeliness":
-            # Placeholder: assume all responses are timely in this simulation
-            return 0.95
-        
-        return 0.5  # Default score if criterion is unknown
-    
     def apply_systematic_observation(self, target: Dict[str, Any], 
                                    template_name: str = "quality_assessment") -> Dict[str, Any]:
         """Apply systematic observation methodology to a target"""
+        template_name = sys.intern(template_name)
         if template_name not in self.observation_templates:
             return {
                 "status": "error",
@@ -410,99 +663,81 @@ class ResponseCoordinator:
                 "timestamp": datetime.now().isoformat()
             }
         
-        template = self.observation_templates[template_name]
-        observations = {}
-        
-        # Apply the template's checks
-        template_data = template["template"]
-        for check, required in template_data.items():
-            if required:
-                observation = self._perform_observation_check(check, target)
-                observations[check] = observation
+        # Apply the template's checks; constant results are built fresh from their
+        # precompiled details so the observation stays plain, caller-owned data
+        observations = {
+            check: _passing_check_result(check, details) if details is not None
+            else self._perform_observation_check(check, target)
+            for check, details in self._template_checks[template_name]
+        }
         
+        now = datetime.now()
+        now_iso = now.isoformat()
         result = {
             "template": template_name,
             "observations": observations,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Store observation result in memory
         observation_entry = MemoryEntry(
-            id=f"systematic_observation_{template_name}_{datetime.now().isoformat()}",
+            id=sequenced_entry_id(f"systematic_observation_{template_name}"),
             content=result,
-            creation_time=datetime.now(),
+            creation_time=now,
             memory_type=MemoryType.SHORT_TERM,
             tags=["systematic_observation", "quality", template_name],
             ttl=self.config.timeout_seconds * 7
         )
-        self.memory_manager.store(observation_entry)
+        self._persist(observation_entry)
         
         return result
     
     def _perform_observation_check(self, check_name: str, target: Dict[str, Any]) -> Dict[str, Any]:
         """Perform a specific observation check"""
-        if check_name == "accuracy_check":
-            return {
-                "check": check_name,
-                "result": self._validate_content_accuracy(target),
-                "details": "Content accuracy validated"
-            }
-        elif check_name == "clarity_check":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Clarity assessment completed"
-            }
-        elif check_name == "relevance_check":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Relevance assessment completed"
-            }
-        elif check_name == "completeness_check":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Completeness assessment completed"
-            }
-        elif check_name == "timeliness_check":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Timeliness assessment completed"
-            }
-        elif check_name == "tone_consistency":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Tone consistency assessment completed"
-            }
-        elif check_name == "format_consistency":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Format consistency assessment completed"
-            }
-        elif check_name == "content_style_consistency":
-            return {
-                "check": check_name,
-                "result": {"success": True},
-                "details": "Content style consistency assessment completed"
-            }
-        else:
+        details = _PASSING_OBSERVATION_CHECKS.get(check_name)
+        if details is not None:
+            return _passing_check_result(check_name, details)
+        
+        check = self._check_dispatch.get(check_name)
+        if check is None:
             return {
                 "check": check_name,
                 "result": {"success": False, "error": f"Unknown check: {check_name}"},
                 "details": f"Unknown check: {check_name}"
             }
+        return check(target)
+    
+    def _accuracy_observation_check(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        """Observe content accuracy"""
+        return {
+            "check": "accuracy_check",
+            "result": self._validate_content_accuracy(target),
+            "details": "Content accuracy validated"
+        }
+    
+    def set_quality_criterion(self, criterion: str, weight: float, threshold: float):
+        """Add or update a quality assessment criterion"""
+        criteria = dict(self.quality_criteria)
+        criteria[sys.intern(criterion)] = {"weight": weight, "threshold": threshold}
+        self.quality_criteria = _freeze(criteria)
+    
+    def register_observation_template(self, name: str, template: Dict[str, Any]):
+        """Register or replace a systematic observation template"""
+        name = sys.intern(name)
+        replaced = name in self.observation_templates
+        self._set_observation_templates({**self.observation_templates, name: template})
+        self.logger.info(f"{'Replaced' if replaced else 'Registered'} observation template: {name}")
     
     def register_custom_protocol(self, name: str, protocol_definition: Dict[str, Any]) -> bool:
         """Register a custom response protocol"""
+        name = sys.intern(name)
         if name in self.response_protocols:
             self.logger.warning(f"Protocol {name} already exists")
             return False
         
         self.response_protocols[name] = protocol_definition
+        self._compiled_protocols.pop(name, None)
+        self._protocol_report_cache = None
         
         # Store protocol in memory
         protocol_entry = MemoryEntry(
@@ -518,6 +753,25 @@ class ResponseCoordinator:
         self.logger.info(f"Registered custom response protocol: {name}")
         return True
     
+    def _get_protocol_report(self) -> Dict[str, Any]:
+        """
+        Get the protocols section of the report, reusing it until a protocol is registered
+        
+        Callers get a copy of the cached section; its entries are flat, so copying
+        each entry is enough to keep changes from leaking into later reports.
+        """
+        if self._protocol_report_cache is None:
+            self._protocol_report_cache = {
+                name: {
+                    "name": details["name"],
+                    "description": details["description"],
+                    "requirement_steps_count": len(details["requirement_steps"]),
+                    "validation_gates_count": len(details["validation_gates"])
+                }
+                for name, details in self.response_protocols.items()
+            }
+        return {name: dict(entry) for name, entry in self._protocol_report_cache.items()}
+    
     def get_response_coordination_report(self) -> Dict[str, Any]:
         """Generate a comprehensive response coordination report"""
         report = {
@@ -527,17 +781,10 @@ class ResponseCoordinator:
                 "observation_templates_count": len(self.observation_templates),
                 "timestamp": datetime.now().isoformat()
             },
-            "protocols": {
-                name: {
-                    "name": details["name"],
-                    "description": details["description"],
-                    "requirement_steps_count": len(details["requirement_steps"]),
-                    "validation_gates_count": len(details["validation_gates"])
-                }
-                for name, details in self.response_protocols.items()
-            },
-            "quality_criteria": self.quality_criteria,
-            "observation_templates": self.observation_templates
+            "protocols": self._get_protocol_report(),
+            # Plain copies so the report stays JSON serializable and deep-copyable
+            "quality_criteria": _thaw(self.quality_criteria),
+            "observation_templates": _thaw(self.observation_templates)
         }
         
         return report
\ No newline at end of file
@@ -3,249 +3,33 @@ Conversation-Driven Profiler for the Qwen Profiler project
 Operates as the primary interface that integrates the three-pillar system
 during user conversations to automatically analyze requirements and generate configurations
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
+import json
 import logging
+import threading
+import time
+import zlib
+from types import MappingProxyType
 from src.core.config import get_config
-from src.core.memory.manager import MemoryManager, MemoryEntry, MemoryType
+from src.core.lazy import locked_cached_property
+from src.core.memory.manager import MemoryManager, MemoryEntry, MemoryType, sequenced_entry_id
 from src.core.validation_gates.manager import ValidationGates
-from src.integration_layer.manager import IntegrationLayer
+from src.integration_layer.manager import IntegrationLayer, get_execution_profile
 from src.semantic_pillar.domain_linguist.manager import DomainLinguist
 from src.behavioral_pillar.cognitive_validator.manager import CognitiveValidator
 from src.technical_pillar.sre_specialist.manager import SRESpecialist
 
 
-class ConversationalProfiler:
-    """
-    A conversation-driven profiler that operates as the primary interface
-    connecting user inputs to the three-pillar backroom system for analysis
-    and configuration generation.
-    """
-    
-    def __init__(self):
-        self.config = get_config()
-        self.logger = logging.getLogger(__name__)
-        
-        # Initialize core components
-        self.memory_manager = MemoryManager()
-        self.validation_gates = ValidationGates(
-            memory_manager=self.memory_manager
-        )
-        
-        # Initialize the integration layer (which initializes all pillars)
-        self.integration_layer = IntegrationLayer(
-            memory_manager=self.memory_manager,
-            validation_gates=self.validation_gates
-        )
-        
-        # Store reference to individual pillar components
-        self.domain_linguist = self.integration_layer.domain_linguist
-        self.cognitive_validator = self.integration_layer.cognitive_validator
-        self.sre_specialist = self.integration_layer.sre_specialist
-        
-        self.logger.info("Conversational Profiler initialized with three-pillar backroom")
-        self.logger.info("System ready to analyze user project requirements")
-
-    def process_user_request(self, user_input: str, framework_hint: Optional[str] = None) -> Dict[str, Any]:
-        """
-        Process a user's project request using the three-pillar backroom system
-        """
-        self.logger.info(f"Processing user request: {user_input[:50]}...")
-        
-        # Automatically engage the three-pillar analysis system
-        analysis_results = self._analyze_project_requirements(user_input, framework_hint)
-        
-        # Generate appropriate configuration outputs based on analysis
-        configuration_recommendations = self._generate_configurations_from_analysis(analysis_results)
-        
-        # Package results for user delivery
-        response = {
-            "original_request": user_input,
-            "analysis": analysis_results,
-            "recommendations": configuration_recommendations,
-            "processing_timestamp": datetime.now().isoformat()
-        }
-
-        # Store interaction in memory for learning and reference
-        self._store_interaction(user_input, response)
-
-        return response
-
-    def get_analysis_summary(self, analysis_results: Dict[str, Any]) -> str:
-        """
-        Generate a user-friendly summary of the three-pillar analysis
-        """
-        summary = []
-        summary.append("## Project Analysis Summary")
-        summary.append("")
-
-        # Technical pillar analysis
-        tech_results = analysis_results.get("technical_pillar", {})
-        tech_validation_tests = tech_results.get("validation_tests", [])
-        if tech_validation_tests:
-            passed_tests = [t for t in tech_validation_tests if t.get("status") == "pass"]
-            summary.append(f"### Technical Analysis")
-            summary.append(f"- Validation tests: {len(passed_tests)}/{len(tech_validation_tests)} passed")
-            if len(passed_tests) < len(tech_validation_tests):
-                summary.append("- ⚠️ Some technical validations failed - specific remediation may be required")
-            else:
-                summary.append("- ✅ All technical validations passed")
-
-        # Behavioral pillar analysis
-        behav_results = analysis_results.get("behavioral_pillar", {})
-        summary.append(f"### Behavioral Analysis")
-        if behav_results.get("behavioral_consistency", {}).get("status") == "pass":
-            summary.append("- ✅ Behavioral consistency maintained")
-        else:
-            summary.append("- ⚠️ Behavioral consistency concerns identified")
-
-        if behav_results.get("methodology_adherence", {}).get("status") == "pass":
-            summary.append("- ✅ Methodology adherence confirmed")
-        else:
-            summary.append("- ⚠️ Methodology adherence issues detected")
-
-        # Semantic pillar analysis
-        sem_results = analysis_results.get("semantic_pillar", {})
-        summary.append(f"### Semantic Analysis")
-        if sem_results.get("semantic_bridge", {}).get("overall_success", False):
-            summary.append("- ✅ Semantic translation successful")
-        else:
-            summary.append("- ⚠️ Semantic translation issues detected")
-
-        if sem_results.get("hallucination_prevention", {}).get("success", False):
-            summary.append("- ✅ Hallucination prevention effective")
-        else:
-            summary.append("- ⚠️ Hallucination risks detected")
-
-        # Integration score
-        integration_score = analysis_results.get("integration_score", 0)
-        summary.append(f"### Integration Score")
-        summary.append(f"- Overall system coherence: {integration_score:.2f}/1.0")
-
-        return "\n".join(summary)
-
-    def _analyze_project_requirements(self, user_input: str, framework_hint: Optional[str] = None) -> Dict[str, Any]:
-        """
-        Engage the three-pillar backroom to analyze user project requirements
-        """
-        self.logger.debug("Engaging three-pillar backroom analysis")
-        
-        # Create target for integrated profiling
-        target = {
-            "user_intent": user_input,
-            "target_framework": framework_hint or "universal",  # Default to universal if not specified
-            "expected_concept": "agent_configuration",  # Default expectation
-            "required_methodology": {
-                "steps": ["analyze", "design", "validate", "recommend"],
-                "validation_gates": ["tech_implementation_check", "behavior_consistency_check", "semantic_accuracy_check"]
-            }
-        }
-
-        # Execute integrated profiling using the three-pillar system
-        results = self.integration_layer.execute_integrated_profiling(target)
-        
-        self.logger.debug("Three-pillar analysis completed")
-        
-        return results
-
-    def _generate_configurations_from_analysis(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generate configuration recommendations based on the three-pillar analysis
-        """
-        self.logger.debug("Generating configuration recommendations from analysis")
-        
-        # This is where the system would translate analysis results into concrete configurations
-        # Based on the semantic bridge, technical validation, and behavioral consistency
-        
-        recommendations = {
-            "technical_recommendations": self._extract_technical_recommendations(analysis_results),
-            "behavioral_recommendations": self._extract_behavioral_recommendations(analysis_results),
-            "semantic_recommendations": self._extract_semantic_recommendations(analysis_results),
-            "framework_specific_configurations": self._generate_framework_configurations(analysis_results),
-            "generation_timestamp": datetime.now().isoformat()
-        }
-        
-        # Generate specific configuration files based on analysis
-        configurations = self._create_concrete_configurations(recommendations)
-        recommendations["configurations"] = configurations
-        
-        return recommendations
-
-    def _extract_technical_recommendations(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract technical recommendations from analysis"""
-        tech_results = analysis_results.get("technical_pillar", {})
-        
-        recommendations = {
-            "infrastructure_suggestions": tech_results.get("infrastructure", {}).get("components_by_type", {}),
-            "validation_results_summary": self._summarize_validation_results(
-                tech_results.get("validation_tests", [])
-            ),
-            "sre_considerations": tech_results.get("sre_metrics", {}).get("reliability_metrics", {}),
-            "performance_recommendations": []
-        }
-        
-        # Add specific recommendations based on identified issues
-        if tech_results.get("validation_tests"):
-            failed_tests = [test for test in tech_results["validation_tests"] if test.get("status") == "fail"]
-            if failed_tests:
-                recommendations["performance_recommendations"].append(
-                    f"Address {len(failed_tests)} technical validation failures identified in analysis"
-                )
-        
-        return recommendations
-
-    def _extract_behavioral_recommendations(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract behavioral recommendations from analysis"""
-        behav_results = analysis_results.get("behavioral_pillar", {})
-        
-        recommendations = {
-            "consistency_maintained": behav_results.get("behavioral_consistency", {}).get("status") == "pass",
-            "methodology_adherence": behav_results.get("methodology_adherence", {}).get("status") == "pass",
-            "cognitive_pattern_validation": behav_results.get("cognitive_patterns", {}).get("status") == "pass",
-            "response_quality_assessment": behav_results.get("response_coordination", {}).get("quality_assessment", {})
-        }
-        
-        return recommendations
-
-    def _extract_semantic_recommendations(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract semantic recommendations from analysis"""
-        sem_results = analysis_results.get("semantic_pillar", {})
-        
-        recommendations = {
-            "semantic_bridge_quality": sem_results.get("semantic_bridge", {}).get("overall_success", False),
-            "translation_confidence": sem_results.get("semantic_bridge", {}).get("translation_result", {}).get("confidence", 0),
-            "mapping_validation_status": sem_results.get("mapping_validation", {}).get("status") == "pass",
-            "hallucination_prevention_success": sem_results.get("hallucination_prevention", {}).get("success", False)
-        }
-        
-        return recommendations
-
-    def _generate_framework_configurations(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate framework-specific configuration based on analysis"""
-        sem_results = analysis_results.get("semantic_pillar", {})
-        user_intent = analysis_results.get("input", {}).get("user_intent", "unknown")
-        
-        # Extract the translated intent from semantic bridge
-        translated_intent = sem_results.get("semantic_bridge", {}).get("translation_result", {}).get("translated_intent", "Unknown translation")
-        
-        # Determine which framework was identified
-        target_framework = analysis_results.get("input", {}).get("target_framework", "universal")
-        
-        # Generate configuration based on framework
-        framework_config = self._create_framework_specific_config(target_framework, user_intent, translated_intent)
-        
-        return {
-            "target_framework": target_framework,
-            "identified_requirements": translated_intent,
-            "configuration_template": framework_config,
-            "confidence_score": self._calculate_configuration_confidence(analysis_results)
-        }
+logger = logging.getLogger(__name__)
 
-    def _create_framework_specific_config(self, framework: str, user_intent: str, translated_intent: str) -> str:
-        """Create framework-specific configuration template"""
-        # This would be expanded to generate actual configuration files for each framework
-        templates = {
-            "autogen": f"""# Autogen Configuration Template
+# Format strings keyed by framework; only the selected one is rendered
+_FRAMEWORK_TEMPLATES: Dict[str, str] = {
+    "autogen": """# Autogen Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
@@ -262,7 +46,7 @@ user_proxy = ConversableAgent(
 
 # Additional agents would be configured based on detailed requirements
 """,
-            "crewai": f"""# CrewAI Configuration Template
+    "crewai": """# CrewAI Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
@@ -276,7 +60,7 @@ task = Task(
 
 # Agents and tasks would be configured based on detailed requirements
 """,
-            "semantic_kernel": f"""# Semantic Kernel Configuration Template
+    "semantic_kernel": """# Semantic Kernel Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
@@ -289,7 +73,7 @@ kernel.add_chat_service("gpt", OpenAIChatCompletion(service_id="chat-gpt", ai_mo
 
 # Plugins and functions would be configured based on detailed requirements
 """,
-            "langgraph": f"""# LangGraph Configuration Template
+    "langgraph": """# LangGraph Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
@@ -298,7 +82,7 @@ from langgraph.graph import StateGraph
 # Example configuration
 # Graph structure would be configured based on detailed requirements
 """,
-            "langroid": f"""# Langroid Configuration Template
+    "langroid": """# Langroid Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
@@ -308,130 +92,579 @@ from langroid.my_agent import MyAgent
 # Example configuration
 # Agent interactions would be configured based on detailed requirements
 """,
-            "universal": f"""# Universal Configuration Template
+    "universal": """# Universal Configuration Template
 # Based on user request: {user_intent}
 # Translated to: {translated_intent}
 
 # This is a conceptual template that would be refined based on 
 # detailed requirements analysis from all three pillars
 """
-        }
+}
+
+# Repeats of a request within the cooldown reuse its response instead of
+# re-running the three-pillar analysis; the execution profile sizes the cache
+RECENT_REQUEST_COOLDOWN_SECONDS = 30.0
+
+# Methodology every analysis target requires; each target gets its own plain
+# dict (so responses stay JSON serializable) sharing these immutable step tuples
+_METHODOLOGY_TEMPLATE = MappingProxyType({
+    "steps": ("analyze", "design", "validate", "recommend"),
+    "validation_gates": ("tech_implementation_check", "behavior_consistency_check", "semantic_accuracy_check")
+})
+
+# Stored interactions are deduplicated per request key; the key index is
+# pruned of expired interactions after this many new stores
+INTERACTION_COMPACTION_INTERVAL = 100
+
+
+# Accepted spellings of each framework id; anything else targets "universal"
+_FRAMEWORK_ALIASES: Dict[str, str] = {
+    "ag2": "autogen",
+    "autogen": "autogen",
+    "crew": "crewai",
+    "crewai": "crewai",
+    "sk": "semantic_kernel",
+    "semantic-kernel": "semantic_kernel",
+    "semantic_kernel": "semantic_kernel",
+    "lg": "langgraph",
+    "langgraph": "langgraph",
+    "langroid": "langroid",
+    "universal": "universal",
+}
+
+
+def _canonical_framework(hint: Optional[str]) -> str:
+    """Map a free-form framework hint to a canonical framework id"""
+    if not hint:
+        return "universal"
+    return _FRAMEWORK_ALIASES.get(hint.strip().lower(), "universal")
+
+
+def _request_key(user_input: str, framework: str) -> str:
+    """Digest of the normalized request and its canonical target framework"""
+    normalized = f"{framework}\0{user_input.strip().casefold()}"
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def _pack_response(response: Dict[str, Any]) -> bytes:
+    """Serialize a response into a compressed JSON snapshot"""
+    return zlib.compress(json.dumps(response, default=str).encode())
+
+
+def _unpack_response(blob: bytes) -> Dict[str, Any]:
+    """Rebuild a fresh response from a snapshot made by ``_pack_response``"""
+    return json.loads(zlib.decompress(blob))
+
+
+def _count_validation_statuses(validation_tests: List[Dict[str, Any]]) -> Counter:
+    """Count validation tests by status in a single pass"""
+    return Counter(test.get("status", "unknown") for test in validation_tests)
+
+
+@dataclass
+class InteractionRecord:
+    """Slim projection of a delivered response kept in interaction memory
+
+    The full response is only held as a compressed JSON blob, decoded on
+    demand by ``response()``; ``hit_count`` and ``last_seen`` track repeats.
+    """
+    __slots__ = (
+        "user_input", "request_key", "target_framework", "integration_score",
+        "confidence", "timestamp", "blob", "hit_count", "last_seen"
+    )
+
+    user_input: str
+    request_key: Optional[str]
+    target_framework: str
+    integration_score: float
+    confidence: float
+    timestamp: str
+    blob: bytes
+    hit_count: int
+    last_seen: str
+
+    @classmethod
+    def from_response(cls, user_input: str, response: Dict[str, Any], now: datetime,
+                      request_key: Optional[str] = None, blob: Optional[bytes] = None) -> "InteractionRecord":
+        """Project a delivered response into a record, reusing its snapshot when one is given"""
+        framework_config = response.get("recommendations", {}).get("framework_specific_configurations", {})
+        timestamp = now.isoformat()
+        return cls(
+            user_input=user_input,
+            request_key=request_key,
+            target_framework=framework_config.get("target_framework", "universal"),
+            integration_score=response.get("analysis", {}).get("integration_score", 0),
+            confidence=framework_config.get("confidence_score", 0),
+            timestamp=timestamp,
+            blob=blob if blob is not None else _pack_response(response),
+            hit_count=1,
+            last_seen=timestamp
+        )
+
+    def response(self) -> Dict[str, Any]:
+        """Decode the full response this record was projected from"""
+        return _unpack_response(self.blob)
+
+
+@dataclass(frozen=True)
+class PillarView:
+    """Leaves of an integrated analysis that recommendations and summaries read
+
+    Built once per analysis so the helpers use attribute access instead of
+    repeating the nested ``dict.get`` descent into each pillar.
+    """
+    __slots__ = (
+        "tech_validation_tests", "tech_status_counts", "tech_infra_components",
+        "tech_sre_reliability", "behav_consistency_pass", "behav_methodology_pass",
+        "behav_patterns_pass", "behav_quality_assessment", "sem_bridge_success",
+        "sem_translation_confidence", "sem_translated_intent", "sem_mapping_pass",
+        "sem_hallucination_success", "user_intent", "target_framework", "integration_score"
+    )
+
+    tech_validation_tests: List[Dict[str, Any]]
+    tech_status_counts: Counter
+    tech_infra_components: Dict[str, Any]
+    tech_sre_reliability: Dict[str, Any]
+    behav_consistency_pass: bool
+    behav_methodology_pass: bool
+    behav_patterns_pass: bool
+    behav_quality_assessment: Dict[str, Any]
+    sem_bridge_success: bool
+    sem_translation_confidence: float
+    sem_translated_intent: str
+    sem_mapping_pass: bool
+    sem_hallucination_success: bool
+    user_intent: str
+    target_framework: str
+    integration_score: float
+
+    @classmethod
+    def from_analysis(cls, analysis_results: Dict[str, Any]) -> "PillarView":
+        """Flatten integrated profiling results into a view"""
+        tech_results = analysis_results.get("technical_pillar", {})
+        behav_results = analysis_results.get("behavioral_pillar", {})
+        sem_results = analysis_results.get("semantic_pillar", {})
+        semantic_bridge = sem_results.get("semantic_bridge", {})
+        translation_result = semantic_bridge.get("translation_result", {})
+        target = analysis_results.get("input", {})
+        validation_tests = tech_results.get("validation_tests", [])
+
+        return cls(
+            tech_validation_tests=validation_tests,
+            tech_status_counts=_count_validation_statuses(validation_tests),
+            tech_infra_components=tech_results.get("infrastructure", {}).get("components_by_type", {}),
+            tech_sre_reliability=tech_results.get("sre_metrics", {}).get("reliability_metrics", {}),
+            behav_consistency_pass=behav_results.get("behavioral_consistency", {}).get("status") == "pass",
+            behav_methodology_pass=behav_results.get("methodology_adherence", {}).get("status") == "pass",
+            behav_patterns_pass=behav_results.get("cognitive_patterns", {}).get("status") == "pass",
+            behav_quality_assessment=behav_results.get("response_coordination", {}).get("quality_assessment", {}),
+            sem_bridge_success=semantic_bridge.get("overall_success", False),
+            sem_translation_confidence=translation_result.get("confidence", 0),
+            sem_translated_intent=translation_result.get("translated_intent", "Unknown translation"),
+            sem_mapping_pass=sem_results.get("mapping_validation", {}).get("status") == "pass",
+            sem_hallucination_success=sem_results.get("hallucination_prevention", {}).get("success", False),
+            user_intent=target.get("user_intent", "unknown"),
+            target_framework=target.get("target_framework", "universal"),
+            integration_score=analysis_results.get("integration_score", 0)
+        )
+
+
+class ConversationalProfiler:
+    """
+    A conversation-driven profiler that operates as the primary interface
+    connecting user inputs to the three-pillar backroom system for analysis
+    and configuration generation.
+    """
+
+    def __init__(self, execution_profile: str = "balanced"):
+        self.config = get_config()
+        self.execution_profile_name = execution_profile
+        self.execution_profile = get_execution_profile(execution_profile)
         
-        return templates.get(framework.lower(), templates["universal"])
+        # Core components and the three-pillar backroom are built on first use,
+        # so summaries and templates never pay for them
+        
+        # Recently delivered responses as key -> (monotonic store time, response snapshot)
+        self._recent_responses: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
+        # Request key -> id of the stored interaction representing it
+        self._interaction_ids: Dict[str, str] = {}
+        self._interaction_stores = 0
+        self._interaction_lock = threading.Lock()
+        
+        logger.info("Conversational Profiler initialized; three-pillar backroom is built on first request")
+
+    @locked_cached_property
+    def memory_manager(self) -> MemoryManager:
+        """Memory manager, created on first use"""
+        return MemoryManager()
 
-    def _create_concrete_configurations(self, recommendations: Dict[str, Any]) -> Dict[str, str]:
-        """Create concrete configuration outputs ready for user implementation"""
-        configurations = {}
+    @locked_cached_property
+    def validation_gates(self) -> ValidationGates:
+        """Validation gates, created on first use"""
+        return ValidationGates(memory_manager=self.memory_manager)
+
+    @locked_cached_property
+    def integration_layer(self) -> IntegrationLayer:
+        """Integration layer, which initializes all three pillars on first use"""
+        return IntegrationLayer(
+            memory_manager=self.memory_manager,
+            validation_gates=self.validation_gates,
+            execution_profile=self.execution_profile_name
+        )
+
+    @locked_cached_property
+    def domain_linguist(self) -> DomainLinguist:
+        """Semantic pillar linguist from the integration layer"""
+        return self.integration_layer.domain_linguist
+
+    @locked_cached_property
+    def cognitive_validator(self) -> CognitiveValidator:
+        """Behavioral pillar validator from the integration layer"""
+        return self.integration_layer.cognitive_validator
+
+    @locked_cached_property
+    def sre_specialist(self) -> SRESpecialist:
+        """Technical pillar SRE specialist from the integration layer"""
+        return self.integration_layer.sre_specialist
+
+    def process_user_request(self, user_input: str, framework_hint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Process a user's project request using the three-pillar backroom system
+        """
+        logger.info("Processing user request: %.50s...", user_input)
         
-        # Generate configuration files based on framework-specific recommendations
-        framework_config = recommendations.get("framework_specific_configurations", {})
-        if framework_config:
-            target_framework = framework_config.get("target_framework", "universal")
-            config_template = framework_config.get("configuration_template", "")
-            
-            configurations[target_framework] = config_template
+        framework = _canonical_framework(framework_hint)
+        request_key = _request_key(user_input, framework)
+        cached = self._serve_recent_response(request_key, user_input)
+        if cached is not None:
+            return cached
+        
+        # Automatically engage the three-pillar analysis system
+        analysis_results = self._analyze_project_requirements(user_input, framework)
         
-        return configurations
+        return self._deliver_response(user_input, analysis_results, request_key)
 
-    def _calculate_configuration_confidence(self, analysis_results: Dict[str, Any]) -> float:
-        """Calculate overall confidence in the configuration based on all three pillars"""
-        tech_score = analysis_results.get("technical_pillar", {}).get("validation_tests", [])
-        behav_score = analysis_results.get("behavioral_pillar", {}).get("behavioral_consistency", {}).get("status") == "pass"
-        sem_score = analysis_results.get("semantic_pillar", {}).get("semantic_bridge", {}).get("overall_success", False)
+    async def process_user_request_async(self, user_input: str, framework_hint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Process a user's project request without blocking the event loop
+
+        The three pillars run concurrently; a pillar that fails is reported in
+        its slot of the analysis instead of cancelling the others.
+        """
+        logger.info("Processing user request: %.50s...", user_input)
+
+        framework = _canonical_framework(framework_hint)
+        request_key = _request_key(user_input, framework)
+        cached = self._serve_recent_response(request_key, user_input)
+        if cached is not None:
+            return cached
+
+        target = self._build_analysis_target(user_input, framework)
+        analysis_results = await self.integration_layer.execute_integrated_profiling_async(target)
+
+        return self._deliver_response(user_input, analysis_results, request_key)
+
+    def _serve_recent_response(self, request_key: str, user_input: str) -> Optional[Dict[str, Any]]:
+        """Answer a repeat from the recent responses, logging it like any other interaction
+
+        The repeat counts against the stored interaction for the request, or is
+        stored afresh if that interaction has already expired.
+        """
+        blob = self._get_recent_snapshot(request_key)
+        if blob is None:
+            return None
+        
+        logger.debug("Reusing recent analysis for repeated request")
+        # Each hit rebuilds its own response, so changes to one cannot leak into later hits
+        response = _unpack_response(blob)
+        response["original_request"] = user_input
+        self._store_interaction(user_input, response, request_key=request_key, blob=blob)
+        return response
+
+    def _get_recent_snapshot(self, request_key: str) -> Optional[bytes]:
+        """Return the response snapshot for a repeat of a request still within its cooldown"""
+        with self._recent_lock:
+            cached = self._recent_responses.get(request_key)
+            if cached is None:
+                return None
+            stored_at, blob = cached
+            if time.monotonic() - stored_at >= RECENT_REQUEST_COOLDOWN_SECONDS:
+                del self._recent_responses[request_key]
+                return None
+            self._recent_responses.move_to_end(request_key)
+            return blob
+
+    def _remember_response(self, request_key: str, blob: bytes):
+        """Keep a delivered response's snapshot for repeats, evicting the least recently used"""
+        with self._recent_lock:
+            self._recent_responses[request_key] = (time.monotonic(), blob)
+            self._recent_responses.move_to_end(request_key)
+            if len(self._recent_responses) > self.execution_profile.response_cache_size:
+                self._recent_responses.popitem(last=False)
+
+    def _deliver_response(self, user_input: str, analysis_results: Dict[str, Any],
+                          request_key: Optional[str] = None) -> Dict[str, Any]:
+        """Turn analysis results into the user-facing response and record the interaction
+
+        The response is serialized once; interaction memory and the recent
+        responses share that snapshot, and the caller gets a response rebuilt
+        from it, the same plain JSON data a later repeat is served.
+        """
+        # One clock read stamps the recommendations, the response and the stored interaction
+        now = datetime.now()
+        now_iso = now.isoformat()
         
-        # Convert to numeric scores
-        valid_tech_tests = len([t for t in tech_score if t.get("status") == "pass"])
-        total_tech_tests = len(tech_score) if tech_score else 1
+        # Generate appropriate configuration outputs based on analysis
+        configuration_recommendations = self._generate_configurations_from_analysis(analysis_results, now=now)
         
-        tech_confidence = valid_tech_tests / total_tech_tests if total_tech_tests > 0 else 0.5
-        behav_confidence = 1.0 if behav_score else 0.3
-        sem_confidence = 1.0 if sem_score else 0.4
+        # Package results for user delivery
+        response = {
+            "original_request": user_input,
+            "analysis": analysis_results,
+            "recommendations": configuration_recommendations,
+            "processing_timestamp": now_iso
+        }
+
+        # Store interaction in memory for learning and reference
+        blob = _pack_response(response)
+        self._store_interaction(user_input, response, now=now, request_key=request_key, blob=blob)
+        if request_key is not None:
+            self._remember_response(request_key, blob)
+
+        return _unpack_response(blob)
+
+    def get_configuration(self, recommendations: Dict[str, Any],
+                          framework: Optional[str] = None) -> Optional[str]:
+        """
+        Return the configuration template from a set of recommendations
+
+        When a framework is given, the template is only returned if it was
+        generated for that framework.
+        """
+        framework_config = recommendations.get("framework_specific_configurations", {})
+        if framework is not None and _canonical_framework(framework) != framework_config.get("target_framework"):
+            return None
+        return framework_config.get("configuration_template")
+
+    def _analyze_project_requirements(self, user_input: str, framework: str = "universal") -> Dict[str, Any]:
+        """
+        Engage the three-pillar backroom to analyze user project requirements
+        """
+        logger.debug("Engaging three-pillar backroom analysis")
         
-        # Weighted average
-        confidence = (tech_confidence * 0.4 + behav_confidence * 0.3 + sem_confidence * 0.3)
+        target = self._build_analysis_target(user_input, framework)
+
+        # Execute integrated profiling using the three-pillar system
+        results = self.integration_layer.execute_integrated_profiling(target)
         
-        return confidence
+        logger.debug("Three-pillar analysis completed")
+        
+        return results
+
+    def _build_analysis_target(self, user_input: str, framework: str = "universal") -> Dict[str, Any]:
+        """Create the target handed to integrated profiling"""
+        return {
+            "user_intent": user_input,
+            "target_framework": framework,
+            "expected_concept": "agent_configuration",  # Default expectation
+            "required_methodology": dict(_METHODOLOGY_TEMPLATE)
+        }
 
-    def _summarize_validation_results(self, validation_tests: list) -> Dict[str, int]:
-        """Summarize validation test results"""
-        summary = {"pass": 0, "fail": 0, "skip": 0}
+    def _generate_configurations_from_analysis(self, analysis_results: Dict[str, Any],
+                                               now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Generate configuration recommendations based on the three-pillar analysis
+        """
+        logger.debug("Generating configuration recommendations from analysis")
         
-        for test in validation_tests:
-            status = test.get("status", "unknown")
-            if status in summary:
-                summary[status] += 1
-            else:
-                summary["skip"] += 1  # Consider unknown as skip
+        # This is where the system would translate analysis results into concrete configurations
+        # Based on the semantic bridge, technical validation, and behavioral consistency
         
-        return summary
-    
-    def _store_interaction(self, user_input: str, response: Dict[str, Any]):
-        """Store the user interaction in memory for future learning and reference"""
-        interaction_entry = MemoryEntry(
-            id=f"interaction_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            content={
-                "user_input": user_input,
-                "response": response,
-                "timestamp": datetime.now().isoformat()
-            },
-            creation_time=datetime.now(),
-            memory_type=MemoryType.SHORT_TERM,
-            tags=["conversational_profiler", "interaction_log"],
-            ttl=timedelta(hours=24)  # Keep for 24 hours
+        technical, behavioral, semantic, framework = self._extract_all_recommendations(
+            PillarView.from_analysis(analysis_results)
         )
-        self.memory_manager.store(interaction_entry)
+        
+        recommendations = {
+            "technical_recommendations": technical,
+            "behavioral_recommendations": behavioral,
+            "semantic_recommendations": semantic,
+            "framework_specific_configurations": framework,
+            "generation_timestamp": (now or datetime.now()).isoformat()
+        }
+        
+        return recommendations
 
-    def get_analysis_summary(self, analysis_results: Dict[str, Any]) -> str:
+    def _extract_all_recommendations(self, view: PillarView) -> Tuple[Dict[str, Any], Dict[str, Any],
+                                                                    Dict[str, Any], Dict[str, Any]]:
         """
-        Generate a user-friendly summary of the three-pillar analysis
+        Extract the technical, behavioral, semantic and framework-specific
+        recommendations from one flattened analysis
         """
-        summary = []
-        summary.append("## Project Analysis Summary")
-        summary.append("")
-        
-        # Technical pillar summary
-        tech_results = analysis_results.get("technical_pillar", {})
-        tech_validation_tests = tech_results.get("validation_tests", [])
-        if tech_validation_tests:
-            passed_tests = [t for t in tech_validation_tests if t.get("status") == "pass"]
-            summary.append(f"### Technical Analysis")
-            summary.append(f"- Validation tests: {len(passed_tests)}/{len(tech_validation_tests)} passed")
-            if len(passed_tests) < len(tech_validation_tests):
-                summary.append("- ⚠️ Some technical validations failed - specific remediation may be required")
-            else:
-                summary.append("- ✅ All technical validations passed")
+        status_counts = view.tech_status_counts
         
-        # Behavioral pillar summary
-        behav_results = analysis_results.get("behavioral_pillar", {})
-        overall_success = analysis_results.get("cross_pillar_validation", {}).get("overall_success", False)
-        summary.append(f"### Behavioral Analysis")
-        if behav_results.get("behavioral_consistency", {}).get("status") == "pass":
-            summary.append("- ✅ Behavioral consistency maintained")
-        else:
-            summary.append("- ⚠️ Behavioral consistency concerns identified")
+        # Add specific recommendations based on identified issues
+        performance_recommendations = []
+        if status_counts["fail"]:
+            performance_recommendations.append(
+                f"Address {status_counts['fail']} technical validation failures identified in analysis"
+            )
+        
+        technical = {
+            "infrastructure_suggestions": view.tech_infra_components,
+            "validation_results_summary": self._summarize_validation_results(status_counts),
+            "sre_considerations": view.tech_sre_reliability,
+            "performance_recommendations": performance_recommendations
+        }
+        behavioral = {
+            "consistency_maintained": view.behav_consistency_pass,
+            "methodology_adherence": view.behav_methodology_pass,
+            "cognitive_pattern_validation": view.behav_patterns_pass,
+            "response_quality_assessment": view.behav_quality_assessment
+        }
+        semantic = {
+            "semantic_bridge_quality": view.sem_bridge_success,
+            "translation_confidence": view.sem_translation_confidence,
+            "mapping_validation_status": view.sem_mapping_pass,
+            "hallucination_prevention_success": view.sem_hallucination_success
+        }
+        # Generate configuration based on the identified framework and translated intent
+        framework = {
+            "target_framework": view.target_framework,
+            "identified_requirements": view.sem_translated_intent,
+            "configuration_template": self._create_framework_specific_config(
+                view.target_framework, view.user_intent, view.sem_translated_intent
+            ),
+            "confidence_score": self._calculate_configuration_confidence(view)
+        }
         
-        if behav_results.get("methodology_adherence", {}).get("status") == "pass":
-            summary.append("- ✅ Methodology adherence confirmed")
-        else:
-            summary.append("- ⚠️ Methodology adherences issues detected")
+        return technical, behavioral, semantic, framework
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _create_framework_specific_config(framework: str, user_intent: str, translated_intent: str) -> str:
+        """Create framework-specific configuration template"""
+        # This would be expanded to generate actual configuration files for each framework
+        template = _FRAMEWORK_TEMPLATES.get(framework, _FRAMEWORK_TEMPLATES["universal"])
+        return template.format(user_intent=user_intent, translated_intent=translated_intent)
+
+    def _calculate_configuration_confidence(self, view: PillarView) -> float:
+        """Calculate overall confidence in the configuration based on all three pillars"""
+        status_counts = view.tech_status_counts
         
-        # Semantic pillar summary  
-        sem_results = analysis_results.get("semantic_pillar", {})
-        translation_success = sem_results.get("semantic_bridge", {}).get("overall_success", False)
-        summary.append(f"### Semantic Analysis")
-        if translation_success:
-            summary.append("- ✅ Semantic translation successful")
-        else:
-            summary.append("- ⚠️ Semantic translation issues detected")
+        # Convert to numeric scores; no tests at all counts as zero technical confidence
+        tech_confidence = status_counts["pass"] / (sum(status_counts.values()) or 1)
+        behav_confidence = 1.0 if view.behav_consistency_pass else 0.3
+        sem_confidence = 1.0 if view.sem_bridge_success else 0.4
         
-        if sem_results.get("hallucination_prevention", {}).get("success", False):
-            summary.append("- ✅ Hallucination prevention effective")
-        else:
-            summary.append("- ⚠️ Hallucination risks detected")
+        # Weighted average
+        confidence = (tech_confidence * 0.4 + behav_confidence * 0.3 + sem_confidence * 0.3)
         
-        # Integration summary
-        integration_score = analysis_results.get("integration_score", 0)
-        summary.append(f"### Integration Score")
-        summary.append(f"- Overall system coherence: {integration_score:.2f}/1.0")
+        return confidence
+
+    @staticmethod
+    def _summarize_validation_results(status_counts: Counter) -> Dict[str, int]:
+        """Summarize validation test results from their status counts"""
+        passed, failed = status_counts["pass"], status_counts["fail"]
         
-        return "\n".join(summary)
\ No newline at end of file
+        # Anything that is neither pass nor fail, including unknown, counts as skip
+        return {"pass": passed, "fail": failed, "skip": sum(status_counts.values()) - passed - failed}
+    
+    def _store_interaction(self, user_input: str, response: Dict[str, Any],
+                           now: Optional[datetime] = None, request_key: Optional[str] = None,
+                           blob: Optional[bytes] = None):
+        """Store the user interaction in memory for future learning and reference
+        
+        A repeat of a request whose interaction is still stored only bumps that
+        entry's ``hit_count`` instead of storing another copy. ``blob`` is the
+        response's snapshot when the caller already made one; otherwise it is
+        only serialized if a new record is actually stored.
+        """
+        now = now or datetime.now()
+        with self._interaction_lock:
+            if request_key is not None and self._record_repeat_interaction(request_key, now):
+                return
+            
+            interaction_entry = MemoryEntry(
+                id=sequenced_entry_id("interaction"),
+                content=InteractionRecord.from_response(user_input, response, now, request_key, blob),
+                creation_time=now,
+                memory_type=MemoryType.SHORT_TERM,
+                tags=["conversational_profiler", "interaction_log"],
+                ttl=timedelta(hours=24)  # Keep for 24 hours
+            )
+            self.memory_manager.store(interaction_entry)
+            
+            if request_key is not None:
+                self._interaction_ids[request_key] = interaction_entry.id
+            self._interaction_stores += 1
+            if self._interaction_stores >= INTERACTION_COMPACTION_INTERVAL:
+                self._compact_interaction_index()
+
+    def _record_repeat_interaction(self, request_key: str, now: datetime) -> bool:
+        """Count a repeat against the stored interaction for its request, if any"""
+        entry_id = self._interaction_ids.get(request_key)
+        if entry_id is None:
+            return False
+        
+        entry = self.memory_manager.retrieve(entry_id)
+        if entry is None:
+            del self._interaction_ids[request_key]
+            return False
+        
+        record = entry.content
+        record.hit_count += 1
+        record.last_seen = now.isoformat()
+        return True
+
+    def _compact_interaction_index(self):
+        """Drop index entries whose interactions are no longer stored"""
+        self._interaction_ids = {
+            request_key: entry_id for request_key, entry_id in self._interaction_ids.items()
+            if self.memory_manager.retrieve(entry_id) is not None
+        }
+        self._interaction_stores = 0
+
+    def get_analysis_summary(self, analysis_results: Dict[str, Any]) -> str:
+        """
+        Generate a user-friendly summary of the three-pillar analysis
+        """
+        view = PillarView.from_analysis(analysis_results)
+        
+        # The technical section only appears when validation tests ran
+        total_tests = len(view.tech_validation_tests)
+        technical = ""
+        if total_tests:
+            passed = view.tech_status_counts["pass"]
+            technical_outcome = (
+                "✅ All technical validations passed" if passed >= total_tests
+                else "⚠️ Some technical validations failed - specific remediation may be required"
+            )
+            technical = (
+                "### Technical Analysis\n"
+                f"- Validation tests: {passed}/{total_tests} passed\n"
+                f"- {technical_outcome}\n"
+            )
+        
+        consistency = ("✅ Behavioral consistency maintained" if view.behav_consistency_pass
+                       else "⚠️ Behavioral consistency concerns identified")
+        methodology = ("✅ Methodology adherence confirmed" if view.behav_methodology_pass
+                       else "⚠️ Methodology adherence issues detected")
+        translation = ("✅ Semantic translation successful" if view.sem_bridge_success
+                       else "⚠️ Semantic translation issues detected")
+        hallucination = ("✅ Hallucination prevention effective" if view.sem_hallucination_success
+                         else "⚠️ Hallucination risks detected")
+        
+        return (
+            "## Project Analysis Summary\n\n"
+            f"{technical}"
+            "### Behavioral Analysis\n"
+            f"- {consistency}\n"
+            f"- {methodology}\n"
+            "### Semantic Analysis\n"
+            f"- {translation}\n"
+            f"- {hallucination}\n"
+            "### Integration Score\n"
+            f"- Overall system coherence: {view.integration_score:.2f}/1.0"
+        )
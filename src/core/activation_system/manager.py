@@ -3,16 +3,33 @@ Activation system for the Qwen Profiler
 Manages dynamic activation of roles and components based on context
 """
 import asyncio
+import bisect
+import heapq
+import inspect
 import threading
+import time
 from typing import Dict, List, Optional, Callable, Any, Set, Tuple
-from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import logging
 import statistics
-from collections import defaultdict, deque
+import sys
+from collections import OrderedDict, defaultdict, deque
 from ..memory.manager import MemoryManager, MemoryEntry, MemoryType
 
+logger = logging.getLogger(__name__)
+
+# Default period between expiry sweeps when run_cleanup_loop is scheduled
+CLEANUP_INTERVAL_SECONDS = 60.0
+
+# Monotonic deadline of activations that never expire
+_NO_DEADLINE = float("inf")
+
+# Bounds on profiles registered at runtime; inactive ones are evicted least
+# recently used first once over the cap or idle for longer than the TTL
+MAX_DYNAMIC_PROFILES = 256
+DYNAMIC_PROFILE_IDLE_SECONDS = 3600.0
+
 
 class ActivationState(Enum):
     """States for role activation"""
@@ -30,31 +47,99 @@ class ActivationContext(Enum):
     INTEGRATION = "integration"
 
 
-@dataclass
+# Lowercase condition keywords that trigger activation of each context
+_TRIGGER_KEYWORDS: Dict[ActivationContext, frozenset] = {
+    ActivationContext.TECHNICAL: frozenset({
+        "infrastructure", "validation", "sre", "deployment", "monitoring"
+    }),
+    ActivationContext.BEHAVIORAL: frozenset({
+        "behavior", "response", "cognitive", "drift", "consistency"
+    }),
+    ActivationContext.SEMANTIC: frozenset({
+        "semantic", "translation", "ontology", "domain", "intent"
+    }),
+    ActivationContext.INTEGRATION: frozenset({
+        "integration", "cross-pillar", "coordinator", "synergy"
+    })
+}
+
+
 class ActivationProfile:
     """Represents a profile that can be activated"""
-    id: str
-    name: str
-    context: ActivationContext
-    priority: int = 5  # 1-10 scale, 10 is highest priority
-    active: bool = False
-    activation_time: Optional[datetime] = None
-    expiry_time: Optional[datetime] = None
-    dependencies: List[str] = field(default_factory=list)
-    deactivation_callbacks: List[Callable] = field(default_factory=list)
+    # Fixed attribute layout: the registry grows with dynamically registered
+    # roles, and activation checks read these attributes on every call
+    __slots__ = (
+        "id", "name", "context", "priority", "active", "activation_time",
+        "expiry_time", "dependencies", "deactivation_callbacks"
+    )
+
+    def __init__(self, id: str, name: str, context: ActivationContext,
+                 priority: int = 5, active: bool = False,
+                 activation_time: Optional[datetime] = None,
+                 expiry_time: Optional[datetime] = None,
+                 dependencies: Optional[List[str]] = None,
+                 deactivation_callbacks: Optional[List[Callable]] = None):
+        self.id = id
+        self.name = name
+        self.context = context
+        self.priority = priority  # 1-10 scale, 10 is highest priority
+        self.active = active
+        self.activation_time = activation_time
+        self.expiry_time = expiry_time
+        self.dependencies = dependencies if dependencies is not None else []
+        self.deactivation_callbacks = deactivation_callbacks if deactivation_callbacks is not None else []
+
+    def __repr__(self) -> str:
+        return (f"ActivationProfile(id={self.id!r}, name={self.name!r}, context={self.context}, "
+                f"priority={self.priority}, active={self.active})")
 
 
 class ActivationSystem:
     """Manages the activation of various roles and components in the system"""
 
-    def __init__(self, memory_manager: Optional[MemoryManager] = None):
+    def __init__(self, memory_manager: Optional[MemoryManager] = None, persist_activations: bool = True,
+                 max_dynamic_profiles: int = MAX_DYNAMIC_PROFILES):
         self._profiles: Dict[str, ActivationProfile] = {}
         self._active_profiles: Set[str] = set()
+        # Immutable copy of the active ids, republished after each change so
+        # is_active reads a consistent set without taking the lock
+        self._active_snapshot: frozenset = frozenset()
+        # Profiles per context, highest priority first, and active counts keyed
+        # by context value in the shape get_activation_stats reports them
+        self._by_context: Dict[ActivationContext, List[ActivationProfile]] = {c: [] for c in ActivationContext}
+        # Negated priorities parallel to each bucket, kept for bisect insertion
+        self._bucket_keys: Dict[ActivationContext, List[int]] = {c: [] for c in ActivationContext}
+        self._active_counts: Dict[str, int] = {c.value: 0 for c in ActivationContext}
+        # time.monotonic() deadlines of expiring activations, mirrored by a
+        # min-heap of (deadline, profile_id); heap entries made stale by a later
+        # activation or deactivation are discarded when popped
+        self._expiry_deadlines: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Runtime-registered profile ids in least-recently-used order, mapped to
+        # their last use on the monotonic clock; default profiles stay pinned
+        self._dynamic_profiles: "OrderedDict[str, float]" = OrderedDict()
+        self._max_dynamic_profiles = max_dynamic_profiles
+        # Last get_active_profiles result paired with the earliest expiry among
+        # its profiles; reset on any activation change and published as one
+        # tuple so lock-free readers never see a mismatched pair
+        self._active_cache: Optional[Tuple[Tuple[ActivationProfile, ...], float]] = None
+        # Transitive dependency ids per profile, extended as profiles register
+        self._dependency_closures: Dict[str, frozenset] = {}
+        # Registered profile ids naming each id as a direct dependency; a
+        # dynamic profile with dependents is never evicted
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
         self._lock = threading.RLock()
         self._memory_manager = memory_manager or MemoryManager()
+        # Whether activations are recorded in the memory manager for tracking,
+        # the record key per profile, and which profiles currently have a record
+        self._persist_activations = persist_activations
+        self._memory_keys: Dict[str, str] = {}
+        self._persisted_records: Set[str] = set()
         self._init_default_profiles()
         self._cleanup_task = None
         self._setup_cleanup_task()
+        # Async deactivation callbacks scheduled on a running loop, kept until done
+        self._callback_tasks: Set[asyncio.Task] = set()
 
         # Initialize ML predictor for activation prediction (deferred instantiation to avoid circular import)
         self._ml_predictor_instance = None
@@ -124,22 +209,131 @@ class ActivationSystem:
         ]
 
         for profile in default_profiles:
-            self._profiles[profile.id] = profile
+            self._index_profile(profile)
+
+    def _index_profile(self, profile: ActivationProfile):
+        """Add a profile to the registry and its priority-ordered context bucket"""
+        # Interned ids let registry, active-set and dependency lookups with the
+        # same id literals match on identity before comparing characters
+        profile.id = sys.intern(profile.id)
+        # A fresh list, so the caller's dependency list is never rewritten
+        profile.dependencies = [sys.intern(dep_id) for dep_id in profile.dependencies]
+        self._profiles[profile.id] = profile
+        self._memory_keys[profile.id] = f"activation_{profile.id}"
+        self._link_dependencies(profile)
+        keys = self._bucket_keys[profile.context]
+        # bisect_right keeps registration order among equal priorities
+        position = bisect.bisect_right(keys, -profile.priority)
+        keys.insert(position, -profile.priority)
+        self._by_context[profile.context].insert(position, profile)
+
+    def _unindex_profile(self, profile: ActivationProfile):
+        """Remove a profile from the registry and its context bucket"""
+        del self._profiles[profile.id]
+        del self._memory_keys[profile.id]
+        bucket = self._by_context[profile.context]
+        position = bucket.index(profile)
+        del bucket[position]
+        del self._bucket_keys[profile.context][position]
+        self._dependency_closures.pop(profile.id, None)
+        for dep_id in profile.dependencies:
+            dependents = self._dependents[dep_id]
+            dependents.discard(profile.id)
+            if not dependents:
+                del self._dependents[dep_id]
+
+    def _link_dependencies(self, profile: ActivationProfile):
+        """Record a new profile's transitive dependencies and extend those of profiles naming it
+
+        The closure is built from the closures of its direct dependencies, so only
+        the new profile and the profiles that already depend on its id are touched.
+        """
+        closures = self._dependency_closures
+        closure = set(profile.dependencies)
+        for dep_id in profile.dependencies:
+            closure.update(closures.get(dep_id, ()))
+        closure = closures[profile.id] = frozenset(closure)
+
+        # Profiles already naming this id now depend on everything it depends on
+        pending = list(self._dependents.get(profile.id, ()))
+        extended: Set[str] = set()
+        while pending:
+            dependent_id = pending.pop()
+            if dependent_id in extended:
+                continue
+            extended.add(dependent_id)
+            closures[dependent_id] = closures[dependent_id] | closure
+            pending.extend(self._dependents.get(dependent_id, ()))
+
+        for dep_id in profile.dependencies:
+            self._dependents[dep_id].add(profile.id)
+
+    def _cyclic_dependencies(self, profile: ActivationProfile) -> List[str]:
+        """Direct dependencies through which registering the profile would close a cycle"""
+        # Only an id that is its own dependency or is already named by a
+        # registered profile can be reached from its dependencies
+        if profile.id not in self._dependents and profile.id not in profile.dependencies:
+            return []
+        closures = self._dependency_closures
+        return [
+            dep_id for dep_id in profile.dependencies
+            if dep_id == profile.id or profile.id in closures.get(dep_id, ())
+        ]
     
     def _setup_cleanup_task(self):
         """Set up a periodic cleanup task for expired activations"""
-        # For now, just log that we would set up the task
-        # In a real implementation, we'd schedule this task
+        # The system is usually built outside any event loop; async hosts
+        # schedule run_cleanup_loop themselves once their loop is running
         pass
+
+    async def run_cleanup_loop(self, interval_seconds: float = CLEANUP_INTERVAL_SECONDS):
+        """Periodically deactivate expired profiles from within an event loop"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.cleanup_expired()
     
     def register_profile(self, profile: ActivationProfile) -> bool:
         """Register a new activation profile"""
         with self._lock:
             if profile.id in self._profiles:
                 return False
-            self._profiles[profile.id] = profile
+            # Checked before anything changes so a rejected profile evicts nothing
+            cyclic = self._cyclic_dependencies(profile)
+            if cyclic:
+                logger.warning("Cannot register %s, circular dependency through %s", profile.id, cyclic)
+                return False
+            self._index_profile(profile)
+            self._active_cache = None
+            # Evict once the new profile is indexed, so its dependencies are kept
+            now = time.monotonic()
+            self._evict_dynamic_profiles(now)
+            missing = [dep_id for dep_id in profile.dependencies if dep_id not in self._profiles]
+            if missing:
+                logger.warning("Profile %s depends on unregistered profiles: %s", profile.id, missing)
+            self._dynamic_profiles[profile.id] = now
             return True
 
+    def _evict_dynamic_profiles(self, now: float):
+        """Make room for one more dynamic profile, dropping inactive ones past the cap or idle TTL
+
+        Profiles that registered profiles still depend on are kept, since
+        evicting them would leave their dependents unable to activate.
+        """
+        excess = len(self._dynamic_profiles) + 1 - self._max_dynamic_profiles
+        # Scan from the least recently used end and stop at the first profile
+        # that may stay, instead of copying the whole registry per registration
+        evicted: List[str] = []
+        for profile_id, last_used in self._dynamic_profiles.items():
+            if excess <= 0 and now - last_used < DYNAMIC_PROFILE_IDLE_SECONDS:
+                break
+            if profile_id in self._active_profiles or profile_id in self._dependents:
+                continue
+            evicted.append(profile_id)
+            excess -= 1
+        for profile_id in evicted:
+            self._unindex_profile(self._profiles[profile_id])
+            del self._dynamic_profiles[profile_id]
+
     def deactivate_profile(self, profile_id: str) -> bool:
         """Deactivate a profile by ID"""
         with self._lock:
@@ -153,7 +347,7 @@ class ActivationSystem:
             # Check for dependents that would be affected
             dependents = [pid for pid, p in self._profiles.items() if profile_id in p.dependencies]
             if dependents:
-                logging.warning(f"Deactivating {profile_id} may affect dependent profiles: {dependents}")
+                logger.warning("Deactivating %s may affect dependent profiles: %s", profile_id, dependents)
 
             # Deactivate the profile
             profile.active = False
@@ -170,7 +364,7 @@ class ActivationSystem:
                 conditions={"deactivation_source": "direct_call", "triggering_context": profile.context.value}
             )
 
-            logging.info(f"Deactivated profile: {profile_id}")
+            logger.info("Deactivated profile: %s", profile_id)
             return True
 
     def _update_correlations(self, profile_id: str, context: str, condition: str = None):
@@ -251,54 +445,84 @@ class ActivationSystem:
     def activate_profile(self, profile_id: str, duration: Optional[timedelta] = None) -> bool:
         """Activate a profile by ID"""
         with self._lock:
-            if profile_id not in self._profiles:
-                return False
-
-            profile = self._profiles[profile_id]
-
-            # Check dependencies
-            for dep_id in profile.dependencies:
-                if dep_id not in self._active_profiles:
-                    logging.warning(f"Cannot activate {profile_id}, dependency {dep_id} not active")
-                    return False
-
-            # Set expiry time if duration is specified
-            if duration:
-                profile.expiry_time = datetime.now() + duration
-            else:
-                profile.expiry_time = None  # No expiration
+            records: List[MemoryEntry] = []
+            activated = self._activate_profile(profile_id, duration, records)
+            if records:
+                self._memory_manager.store_many(records)
+            return activated
 
-            # Activate the profile
-            profile.active = True
-            profile.activation_time = datetime.now()
+    def _activate_profile(self, profile_id: str, duration: Optional[timedelta],
+                          records: List[MemoryEntry]) -> bool:
+        """Activate a profile, appending its tracking record to records instead of storing it"""
+        if profile_id not in self._profiles:
+            return False
+
+        profile = self._profiles[profile_id]
+
+        # Check dependencies, including those of dependencies
+        required = self._dependency_closures[profile_id]
+        if not self._active_profiles.issuperset(required):
+            missing = sorted(required - self._active_profiles)
+            logger.warning("Cannot activate %s, dependencies %s not active", profile_id, missing)
+            return False
+
+        # Wall-clock times are kept for reporting; expiry is tracked on the monotonic clock
+        now = datetime.now()
+
+        # Set expiry time if duration is specified
+        if duration:
+            profile.expiry_time = now + duration
+            deadline = time.monotonic() + duration.total_seconds()
+            self._expiry_deadlines[profile_id] = deadline
+            heapq.heappush(self._expiry_heap, (deadline, profile_id))
+        else:
+            profile.expiry_time = None  # No expiration
+            self._expiry_deadlines.pop(profile_id, None)
+
+        # Activate the profile
+        profile.active = True
+        profile.activation_time = now
+        self._active_cache = None
+        if profile_id in self._dynamic_profiles:
+            # Dependencies count as used whenever their dependent is
+            last_used = time.monotonic()
+            for used_id in (*required, profile_id):
+                if used_id in self._dynamic_profiles:
+                    self._dynamic_profiles[used_id] = last_used
+                    self._dynamic_profiles.move_to_end(used_id)
+        context_value = profile.context.value
+        if profile_id not in self._active_profiles:
             self._active_profiles.add(profile_id)
-
-            # Store in memory for tracking
-            memory_entry = MemoryEntry(
-                id=f"activation_{profile_id}",
+            self._active_snapshot = frozenset(self._active_profiles)
+            self._active_counts[context_value] += 1
+
+        if self._persist_activations:
+            # Record in memory for tracking
+            self._persisted_records.add(profile_id)
+            records.append(MemoryEntry(
+                id=self._memory_keys[profile_id],
                 content={
                     "profile_id": profile_id,
                     "activation_time": profile.activation_time.isoformat(),
                     "expiry_time": profile.expiry_time.isoformat() if profile.expiry_time else None,
-                    "context": profile.context.value,
+                    "context": context_value,
                     "priority": profile.priority
                 },
                 creation_time=profile.activation_time,
                 memory_type=MemoryType.SHORT_TERM,
-                tags=["activation", profile.context.value],
+                tags=["activation", context_value],
                 ttl=timedelta(hours=1)  # Keep activation records for 1 hour
-            )
-            self._memory_manager.store(memory_entry)
+            ))
 
-            # Record activation event for ML model training
-            self.ml_predictor.record_activation_event(
-                profile_id=profile_id,
-                context=profile.context,
-                conditions={"activation_source": "direct_call", "triggering_context": profile.context.value}
-            )
+        # Record activation event for ML model training
+        self.ml_predictor.record_activation_event(
+            profile_id=profile_id,
+            context=profile.context,
+            conditions={"activation_source": "direct_call", "triggering_context": context_value}
+        )
 
-            logging.info(f"Activated profile: {profile_id} (context: {profile.context.value})")
-            return True
+        logger.info("Activated profile: %s (context: %s)", profile_id, context_value)
+        return True
     
     def deactivate_profile(self, profile_id: str) -> bool:
         """Deactivate a profile by ID"""
@@ -311,46 +535,88 @@ class ActivationSystem:
                 return False
             
             # Execute deactivation callbacks
-            for callback in profile.deactivation_callbacks:
-                try:
-                    callback()
-                except Exception as e:
-                    logging.error(f"Error in deactivation callback for {profile_id}: {e}")
+            self._run_deactivation_callbacks(profile_id, profile.deactivation_callbacks)
             
             # Deactivate the profile
             profile.active = False
             profile.activation_time = None
             profile.expiry_time = None
-            self._active_profiles.discard(profile_id)
+            self._expiry_deadlines.pop(profile_id, None)
+            self._active_cache = None
+            if profile_id in self._active_profiles:
+                self._active_profiles.discard(profile_id)
+                self._active_snapshot = frozenset(self._active_profiles)
+                self._active_counts[profile.context.value] -= 1
             
-            # Remove from memory
-            self._memory_manager.delete(f"activation_{profile_id}")
+            # Remove the tracking record, if one was stored
+            if profile_id in self._persisted_records:
+                self._persisted_records.discard(profile_id)
+                self._memory_manager.delete(self._memory_keys[profile_id])
             
-            logging.info(f"Deactivated profile: {profile_id}")
+            logger.info("Deactivated profile: %s", profile_id)
             return True
     
+    def _run_deactivation_callbacks(self, profile_id: str, callbacks: List[Callable]):
+        """Run deactivation callbacks, awaiting any that return awaitables concurrently"""
+        pending = []
+        for callback in callbacks:
+            try:
+                result = callback()
+            except Exception as e:
+                logger.error("Error in deactivation callback for %s: %s", profile_id, e)
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+        if not pending:
+            return
+
+        async def await_pending():
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Error in deactivation callback for %s: %s", profile_id, result)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from plain synchronous code: wait for the callbacks here
+            asyncio.run(await_pending())
+        else:
+            # Already inside an event loop that this call cannot block on
+            task = loop.create_task(await_pending())
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+
     def is_active(self, profile_id: str) -> bool:
         """Check if a profile is currently active"""
-        with self._lock:
-            if profile_id not in self._profiles:
-                return False
-            return self._profiles[profile_id].active
+        # The snapshot is rebound, never mutated, so one attribute load is a
+        # consistent view without the lock
+        return profile_id in self._active_snapshot
     
     def get_active_profiles(self) -> List[ActivationProfile]:
         """Get all currently active profiles"""
+        cache = self._active_cache
+        if cache is not None and time.monotonic() < cache[1]:
+            return list(cache[0])
         with self._lock:
-            return [
+            now = time.monotonic()
+            deadlines = self._expiry_deadlines
+            active = tuple(
                 profile for profile in self._profiles.values()
-                if profile.active and (
-                    profile.expiry_time is None or 
-                    datetime.now() < profile.expiry_time
-                )
-            ]
+                if profile.active and now < deadlines.get(profile.id, _NO_DEADLINE)
+            )
+            valid_until = min(
+                (deadlines.get(profile.id, _NO_DEADLINE) for profile in active),
+                default=_NO_DEADLINE
+            )
+            self._active_cache = (active, valid_until)
+            return list(active)
     
     def activate_by_context(self, context: ActivationContext, duration: Optional[timedelta] = None, use_ml_prediction: bool = False) -> List[str]:
         """Activate all profiles matching the specified context"""
         with self._lock:
             activated = []
+            records: List[MemoryEntry] = []
 
             if use_ml_prediction:
                 # Use ML model to predict which profiles should be activated
@@ -359,30 +625,26 @@ class ActivationSystem:
                 for profile_id, confidence in predictions:
                     profile = self._profiles.get(profile_id)
                     if profile and profile.context == context and not profile.active:
-                        if self.activate_profile(profile_id, duration):
+                        if self._activate_profile(profile_id, duration, records):
                             activated.append(profile_id)
             else:
-                # Default behavior: activate all profiles matching the context
-                # Sort profiles by priority (highest first)
-                sorted_profiles = sorted(
-                    self._profiles.values(),
-                    key=lambda p: p.priority,
-                    reverse=True
-                )
-
-                for profile in sorted_profiles:
-                    if profile.context == context:
-                        if self.activate_profile(profile.id, duration):
-                            activated.append(profile.id)
-
+                # Default behavior: activate all profiles matching the context,
+                # highest priority first as kept by the context index
+                for profile in self._by_context[context]:
+                    if self._activate_profile(profile.id, duration, records):
+                        activated.append(profile.id)
+
+            # Persist all tracking records with a single memory manager call
+            if records:
+                self._memory_manager.store_many(records)
             return activated
     
     def deactivate_by_context(self, context: ActivationContext) -> List[str]:
         """Deactivate all profiles matching the specified context"""
         with self._lock:
             deactivated = []
-            for profile in self._profiles.values():
-                if profile.context == context and profile.active:
+            for profile in self._by_context[context]:
+                if profile.active:
                     if self.deactivate_profile(profile.id):
                         deactivated.append(profile.id)
             return deactivated
@@ -390,16 +652,12 @@ class ActivationSystem:
     def cleanup_expired(self):
         """Clean up expired activations"""
         with self._lock:
-            now = datetime.now()
-            expired_profiles = [
-                profile_id for profile_id, profile in self._profiles.items()
-                if profile.active and 
-                profile.expiry_time and 
-                now > profile.expiry_time
-            ]
-            
-            for profile_id in expired_profiles:
-                self.deactivate_profile(profile_id)
+            now = time.monotonic()
+            heap = self._expiry_heap
+            while heap and now > heap[0][0]:
+                deadline, profile_id = heapq.heappop(heap)
+                if self._expiry_deadlines.get(profile_id) == deadline:
+                    self.deactivate_profile(profile_id)
     
     def get_activation_stats(self) -> Dict[str, Any]:
         """Get activation system statistics"""
@@ -409,12 +667,7 @@ class ActivationSystem:
             stats = {
                 "total_profiles": len(self._profiles),
                 "active_profiles": len(self._active_profiles),
-                "activation_counts_by_context": {
-                    "technical": len([p for p in self.get_active_profiles() if p.context == ActivationContext.TECHNICAL]),
-                    "behavioral": len([p for p in self.get_active_profiles() if p.context == ActivationContext.BEHAVIORAL]),
-                    "semantic": len([p for p in self.get_active_profiles() if p.context == ActivationContext.SEMANTIC]),
-                    "integration": len([p for p in self.get_active_profiles() if p.context == ActivationContext.INTEGRATION])
-                },
+                "activation_counts_by_context": dict(self._active_counts),
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -424,21 +677,6 @@ class ActivationSystem:
         """Trigger activation based on contextual conditions"""
         # This is a simplified version - in a full implementation,
         # this would have more sophisticated condition checking
-        activation_rules = {
-            ActivationContext.TECHNICAL: [
-                "infrastructure", "validation", "sre", "deployment", "monitoring"
-            ],
-            ActivationContext.BEHAVIORAL: [
-                "behavior", "response", "cognitive", "drift", "consistency"
-            ],
-            ActivationContext.SEMANTIC: [
-                "semantic", "translation", "ontology", "domain", "intent"
-            ],
-            ActivationContext.INTEGRATION: [
-                "integration", "cross-pillar", "coordinator", "synergy"
-            ]
-        }
-        
-        if condition.lower() in activation_rules[context]:
+        if condition.lower() in _TRIGGER_KEYWORDS[context]:
             return self.activate_by_context(context)
         return []
\ No newline at end of file
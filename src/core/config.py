@@ -133,5 +133,10 @@ config_manager = ConfigManager()
 
 
 def get_config() -> AppConfig:
-    """Get the global configuration instance"""
+    """Get the global configuration instance
+    
+    The configuration is loaded once when this module is imported, so this is a
+    cheap accessor; callers should not cache the result themselves, otherwise
+    they will miss updates made through ``config_manager.reload_config()``.
+    """
     return config_manager.get_config()
\ No newline at end of file
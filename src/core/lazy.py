@@ -0,0 +1,37 @@
+"""
+Lazy attribute helpers for the Qwen Profiler
+Builds expensive collaborators on first use, exactly once per instance
+"""
+import threading
+from typing import Any, Callable, Optional
+
+
+class locked_cached_property:
+    """
+    Like functools.cached_property, but the first computation runs under a lock
+
+    functools.cached_property does not lock on Python 3.12+, so two threads
+    touching a collaborator for the first time could each build one. Here the
+    value is computed and cached while holding the lock, and later reads come
+    straight from the instance dict. The lock is re-entrant so one lazy
+    collaborator can build others.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.attrname: Optional[str] = None
+        self.__doc__ = func.__doc__
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type, name: str):
+        self.attrname = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        with self._lock:
+            # Another thread may have cached the value while this one waited
+            if self.attrname not in cache:
+                cache[self.attrname] = self.func(instance)
+            return cache[self.attrname]
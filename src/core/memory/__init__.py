@@ -6,10 +6,11 @@ Manages both short-term and long-term memory operations.
 __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
-from .manager import MemoryManager, MemoryEntry, MemoryType
+from .manager import MemoryManager, MemoryEntry, MemoryType, sequenced_entry_id
 
 __all__ = [
     "MemoryManager",
     "MemoryEntry",
-    "MemoryType"
+    "MemoryType",
+    "sequenced_entry_id"
 ]
\ No newline at end of file
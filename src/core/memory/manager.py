@@ -3,12 +3,27 @@ Memory manager for the Qwen Profiler
 Handles both short-term and long-term memory operations
 """
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from datetime import datetime, timedelta
 import weakref
 import threading
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import count
+
+
+# Process-wide sequence behind sequenced_entry_id
+_entry_sequence = count()
+
+
+def sequenced_entry_id(prefix: str) -> str:
+    """
+    Build a memory entry id from a prefix and a process-wide sequence number
+
+    Ids stay unique even when several components share a memory manager or
+    record within the same microsecond.
+    """
+    return f"{prefix}_{next(_entry_sequence)}"
 
 
 class MemoryType(Enum):
@@ -24,7 +39,7 @@ class MemoryEntry:
     content: Any
     creation_time: datetime
     memory_type: MemoryType
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     ttl: Optional[timedelta] = None  # Time-to-live for short-term memory
     priority: int = 1  # Priority level (1-10)
 
@@ -37,6 +52,8 @@ class MemoryManager:
         self._long_term_memory: Dict[str, MemoryEntry] = {}
         self._lock = threading.RLock()  # Thread-safe operations
         self._cleanup_task: Optional[asyncio.Task] = None
+        # Newest entry seen per (tag, memory type); validated on read by get_latest
+        self._latest_by_tag: Dict[Tuple[str, MemoryType], MemoryEntry] = {}
         self._init_memory_stores()
     
     def _init_memory_stores(self):
@@ -55,6 +72,7 @@ class MemoryManager:
             priority=10
         )
         self._long_term_memory["system_metadata"] = system_entry
+        self._index_latest(system_entry)
     
     def store(self, entry: MemoryEntry) -> bool:
         """Store a memory entry in the appropriate memory system"""
@@ -66,9 +84,11 @@ class MemoryManager:
                         entry.ttl = timedelta(minutes=30)  # Default 30 minutes
                     
                     self._short_term_memory[entry.id] = entry
+                    self._index_latest(entry)
                     return True
                 elif entry.memory_type == MemoryType.LONG_TERM:
                     self._long_term_memory[entry.id] = entry
+                    self._index_latest(entry)
                     return True
                 else:
                     raise ValueError(f"Unknown memory type: {entry.memory_type}")
@@ -76,6 +96,14 @@ class MemoryManager:
                 print(f"Error storing memory entry: {e}")
                 return False
     
+    def store_many(self, entries: List[MemoryEntry]) -> bool:
+        """Store several memory entries under a single lock acquisition"""
+        with self._lock:
+            stored = True
+            for entry in entries:
+                stored = self.store(entry) and stored
+            return stored
+    
     def retrieve(self, entry_id: str, memory_type: Optional[MemoryType] = None) -> Optional[MemoryEntry]:
         """Retrieve a memory entry by ID"""
         with self._lock:
@@ -122,7 +150,61 @@ class MemoryManager:
             results.sort(key=lambda x: (x.priority, x.creation_time), reverse=True)
             return results
     
-    def update(self, entry_id: str, content: Any, tags: Optional[List[str]] = None) -> bool:
+    def get_latest(self, tags: Sequence[str], memory_type: Optional[MemoryType] = None) -> Optional[MemoryEntry]:
+        """Get the most recently created entry matching any of the tags
+        
+        Equivalent to the newest result of search(tags, memory_type), but served
+        from the per-tag index unless an indexed entry has since been removed,
+        expired or retagged, in which case the stores are scanned.
+        """
+        with self._lock:
+            memory_types = (memory_type,) if memory_type is not None else tuple(MemoryType)
+            latest = None
+            for mem_type in memory_types:
+                memory_store = self._store_for(mem_type)
+                for tag in tags:
+                    entry = self._latest_by_tag.get((tag, mem_type))
+                    if entry is None:
+                        continue
+                    if (memory_store.get(entry.id) is not entry or tag not in entry.tags
+                            or self._is_expired(entry)):
+                        return self._scan_latest(tags, memory_types)
+                    if latest is None or entry.creation_time > latest.creation_time:
+                        latest = entry
+            return latest
+    
+    def _scan_latest(self, tags: Sequence[str], memory_types: Tuple[MemoryType, ...]) -> Optional[MemoryEntry]:
+        """Find the newest matching entry by scanning, refreshing the index on the way"""
+        latest = None
+        for mem_type in memory_types:
+            memory_store = self._store_for(mem_type)
+            for tag in tags:
+                self._latest_by_tag.pop((tag, mem_type), None)
+            for entry in list(memory_store.values()):
+                if self._is_expired(entry):
+                    self._remove_expired_entry(entry.id, mem_type)
+                    continue
+                if any(tag in entry.tags for tag in tags):
+                    self._index_latest(entry)
+                    if latest is None or entry.creation_time > latest.creation_time:
+                        latest = entry
+        return latest
+    
+    def _index_latest(self, entry: MemoryEntry):
+        """Record an entry as the newest for its tags if it is"""
+        for tag in entry.tags:
+            key = (tag, entry.memory_type)
+            current = self._latest_by_tag.get(key)
+            if current is None or entry.creation_time >= current.creation_time:
+                self._latest_by_tag[key] = entry
+    
+    def _store_for(self, memory_type: MemoryType) -> Dict[str, MemoryEntry]:
+        """Get the backing store for a memory type"""
+        if memory_type == MemoryType.SHORT_TERM:
+            return self._short_term_memory
+        return self._long_term_memory
+    
+    def update(self, entry_id: str, content: Any, tags: Optional[Sequence[str]] = None) -> bool:
         """Update an existing memory entry"""
         with self._lock:
             # Try to find in both memory types
@@ -135,7 +217,19 @@ class MemoryManager:
             entry.content = content
             if tags is not None:
                 entry.tags = tags
+                self._index_latest(entry)
+            
+            return True
+    
+    def patch(self, entry_id: str, changes: Dict[str, Any]) -> bool:
+        """Update individual keys of an existing entry's dict content in place"""
+        with self._lock:
+            entry = self._short_term_memory.get(entry_id) or self._long_term_memory.get(entry_id)
+            
+            if not entry or self._is_expired(entry) or not isinstance(entry.content, dict):
+                return False
             
+            entry.content.update(changes)
             return True
     
     def delete(self, entry_id: str, memory_type: Optional[MemoryType] = None) -> bool:
@@ -224,4 +318,6 @@ class MemoryManager:
             if memory_type == MemoryType.SHORT_TERM or memory_type is None:
                 self._short_term_memory.clear()
             if memory_type == MemoryType.LONG_TERM or memory_type is None:
-                self._long_term_memory.clear()
\ No newline at end of file
+                self._long_term_memory.clear()
+            if memory_type is None:
+                self._latest_by_tag.clear()
\ No newline at end of file
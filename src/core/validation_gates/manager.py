@@ -4,7 +4,7 @@ Implements validation protocols and quality assurance mechanisms
 """
 import asyncio
 import threading
-from typing import Dict, List, Optional, Callable, Any, Set, Awaitable
+from typing import Dict, List, Optional, Callable, Any, Set, Awaitable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -254,6 +254,15 @@ class ValidationGates:
                 
                 return result
     
+    def validate_rules(self, rule_ids: Sequence[str], target: Any = None,
+                       context: Optional[Dict[str, Any]] = None) -> List[Optional[ValidationResult]]:
+        """Run several validation rules in order under a single lock acquisition
+        
+        Results line up with rule_ids; a rule that is unknown or disabled yields None.
+        """
+        with self._lock:
+            return [self.validate_rule(rule_id, target, context) for rule_id in rule_ids]
+    
     def validate_gate(self, gate: ValidationGate, target: Any = None, 
                      context: Optional[Dict[str, Any]] = None) -> List[ValidationResult]:
         """Run all validation rules for a specific gate"""
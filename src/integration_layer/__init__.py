@@ -7,9 +7,11 @@ __version__ = "0.1.0"
 __author__ = "Qwen Profiler Team"
 
 # Import key components for easy access
-from .manager import IntegrationLayer, IntegrationEventType
+from .manager import IntegrationLayer, IntegrationEventType, ExecutionProfile, EXECUTION_PROFILES
 
 __all__ = [
     "IntegrationLayer",
-    "IntegrationEventType"
+    "IntegrationEventType",
+    "ExecutionProfile",
+    "EXECUTION_PROFILES"
 ]
\ No newline at end of file
@@ -3,8 +3,12 @@ Integration Layer for the Qwen Profiler
 Handles cross-pillar coordination, unified monitoring, and integrated quality assurance
 """
 from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+import asyncio
 import logging
+import threading
 from enum import Enum
 
 from ..core.config import get_config
@@ -20,6 +24,55 @@ from ..behavioral_pillar.response_coordinator.manager import ResponseCoordinator
 from ..semantic_pillar.domain_linguist.manager import DomainLinguist
 
 
+@dataclass(frozen=True)
+class ExecutionProfile:
+    """Resource tier for integrated profiling
+
+    ``pillar_workers`` bounds how many pillars profile concurrently (one runs
+    them in the calling thread) and ``response_cache_size`` is how many recent
+    responses a conversational profiler keeps for repeated requests.
+    """
+    __slots__ = ("pillar_workers", "response_cache_size")
+
+    pillar_workers: int
+    response_cache_size: int
+
+
+EXECUTION_PROFILES: Dict[str, ExecutionProfile] = {
+    "lean": ExecutionProfile(pillar_workers=1, response_cache_size=32),
+    "balanced": ExecutionProfile(pillar_workers=3, response_cache_size=128),
+    "max": ExecutionProfile(pillar_workers=3, response_cache_size=512),
+}
+
+
+def get_execution_profile(name: str) -> ExecutionProfile:
+    """Look up an execution profile by name"""
+    try:
+        return EXECUTION_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown execution profile: {name} (expected one of {', '.join(EXECUTION_PROFILES)})"
+        ) from None
+
+
+# Pillar executors are shared per worker count so fan-out reuses threads
+# instead of spawning them per request. The pillars only meet on the memory
+# manager, validation gates and activation system, all of which serialize
+# access with their own locks.
+_PILLAR_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+_PILLAR_EXECUTORS_LOCK = threading.Lock()
+
+
+def _pillar_executor(workers: int) -> ThreadPoolExecutor:
+    """Shared executor running at most ``workers`` pillars at once"""
+    with _PILLAR_EXECUTORS_LOCK:
+        executor = _PILLAR_EXECUTORS.get(workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pillar")
+            _PILLAR_EXECUTORS[workers] = executor
+        return executor
+
+
 class IntegrationEventType(Enum):
     """Types of integration events"""
     CROSS_PILLAR_COMMUNICATION = "cross_pillar_communication"
@@ -40,8 +93,10 @@ class IntegrationLayer:
                  behavioral_architect: Optional[BehavioralArchitect] = None,
                  cognitive_validator: Optional[CognitiveValidator] = None,
                  response_coordinator: Optional[ResponseCoordinator] = None,
-                 domain_linguist: Optional[DomainLinguist] = None):
+                 domain_linguist: Optional[DomainLinguist] = None,
+                 execution_profile: str = "balanced"):
         self.config = get_config()
+        self.execution_profile = get_execution_profile(execution_profile)
         self.memory_manager = memory_manager or MemoryManager()
         self.activation_system = activation_system or ActivationSystem(self.memory_manager)
         self.validation_gates = validation_gates or ValidationGates(
@@ -145,11 +200,72 @@ class IntegrationLayer:
         # Activate the integrated profiling profile
         self.activation_system.activate_profile("integrated_profiling")
         
-        # Execute profiling in each pillar
-        technical_results = self._execute_technical_profiling(target)
-        behavioral_results = self._execute_behavioral_profiling(target)
-        semantic_results = self._execute_semantic_profiling(target)
+        try:
+            # Execute profiling in each pillar concurrently
+            technical_results, behavioral_results, semantic_results = self._run_pillars_parallel(target)
+            return self._compile_integrated_results(
+                target, technical_results, behavioral_results, semantic_results
+            )
+        finally:
+            # Deactivate the profile after execution
+            self.activation_system.deactivate_profile("integrated_profiling")
+    
+    async def execute_integrated_profiling_async(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute integrated profiling across all pillars without blocking the event loop
+        
+        A pillar that raises is reported as an ``error`` entry in its slot
+        instead of aborting the other pillars.
+        """
+        self.activation_system.activate_profile("integrated_profiling")
         
+        try:
+            loop = asyncio.get_running_loop()
+            executor = _pillar_executor(self.execution_profile.pillar_workers)
+            pillar_results = await asyncio.gather(
+                *(loop.run_in_executor(executor, runner, target)
+                  for runner in self._pillar_runners()),
+                return_exceptions=True
+            )
+            technical_results, behavioral_results, semantic_results = (
+                self._pillar_failure(result) if isinstance(result, Exception) else result
+                for result in pillar_results
+            )
+            return self._compile_integrated_results(
+                target, technical_results, behavioral_results, semantic_results
+            )
+        finally:
+            self.activation_system.deactivate_profile("integrated_profiling")
+    
+    def _pillar_runners(self) -> Tuple[Any, Any, Any]:
+        """Pillar profiling callables in technical, behavioral, semantic order"""
+        return (
+            self._execute_technical_profiling,
+            self._execute_behavioral_profiling,
+            self._execute_semantic_profiling
+        )
+    
+    def _run_pillars_parallel(self, target: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Run the three pillar profilings on the shared executor and wait for all of them"""
+        workers = self.execution_profile.pillar_workers
+        if workers == 1:
+            # A single worker would only serialize them on another thread
+            return tuple(runner(target) for runner in self._pillar_runners())
+        
+        executor = _pillar_executor(workers)
+        futures = [executor.submit(runner, target) for runner in self._pillar_runners()]
+        # result() re-raises the first pillar failure once its future settles
+        return tuple(future.result() for future in futures)
+    
+    def _pillar_failure(self, error: Exception) -> Dict[str, Any]:
+        """Result placeholder for a pillar that raised during async profiling"""
+        self.logger.error(f"Pillar profiling failed: {str(error)}")
+        return {"error": str(error), "timestamp": datetime.now().isoformat()}
+    
+    def _compile_integrated_results(self, target: Dict[str, Any],
+                                    technical_results: Dict[str, Any],
+                                    behavioral_results: Dict[str, Any],
+                                    semantic_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Cross-validate finished pillar results and record the integrated outcome"""
         # Perform cross-pillar validation
         cross_pillar_validation = self._perform_cross_pillar_validation(
             technical_results, 
@@ -190,9 +306,6 @@ class IntegrationLayer:
             {"target": target, "results": integrated_results}
         )
         
-        # Deactivate the profile after execution
-        self.activation_system.deactivate_profile("integrated_profiling")
-        
         return integrated_results
     
     def _execute_technical_profiling(self, target: Dict[str, Any]) -> Dict[str, Any]:
@@ -365,10 +478,10 @@ class IntegrationLayer:
         """Calculate an overall integration score"""
         # This is a simplified calculation - in a real system, this would be more sophisticated
         
-        # Count successful validations from each pillar
-        tech_success = sum(1 for result in tech_results.get("validation_tests", []) 
-                          if result.get("status") == "pass")
-        tech_total = len(tech_results.get("validation_tests", []))
+        # Count successful validations from each pillar in one pass over the tests
+        validation_tests = tech_results.get("validation_tests", [])
+        tech_total = len(validation_tests)
+        tech_success = sum(1 for result in validation_tests if result.get("status") == "pass")
         tech_score = tech_success / tech_total if tech_total > 0 else 1.0
         
         behav_score = 1.0  # Simplified - in real system would calculate from behavioral results
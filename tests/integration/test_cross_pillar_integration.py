@@ -140,6 +140,28 @@ class TestCrossPillarIntegration:
         assert "semantic_bridge" in sem_results
         assert "mapping_validation" in sem_results
     
+    def test_execute_integrated_profiling_async_isolates_pillar_failures(self):
+        """Test that a failing pillar does not abort the others in async profiling"""
+        import asyncio
+
+        def failing_semantic_profiling(target):
+            raise RuntimeError("semantic pillar unavailable")
+
+        self.integration_layer._execute_semantic_profiling = failing_semantic_profiling
+        target = {"user_intent": "make the agents talk to each other", "target_framework": "autogen"}
+
+        results = asyncio.run(self.integration_layer.execute_integrated_profiling_async(target))
+
+        assert results["semantic_pillar"]["error"] == "semantic pillar unavailable"
+        assert "validation_tests" in results["technical_pillar"]
+        assert "behavioral_consistency" in results["behavioral_pillar"]
+        assert not self.activation_system.is_active("integrated_profiling")
+
+        # The synchronous path still surfaces the failure
+        with pytest.raises(RuntimeError):
+            self.integration_layer.execute_integrated_profiling(target)
+        assert not self.activation_system.is_active("integrated_profiling")
+    
     def test_unified_monitoring(self):
         """Test unified monitoring across all pillars"""
         # Run unified monitoring
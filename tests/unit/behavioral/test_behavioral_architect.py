@@ -211,4 +211,139 @@ class TestBehavioralArchitect:
         assert "total_patterns" in summary
         assert "by_type" in summary
         assert "enabled_patterns" in summary
-        assert "timestamp" in summary
\ No newline at end of file
+        assert "timestamp" in summary
+
+    def test_validate_reports_missing_items_in_definition_order(self):
+        """Test that missing items are reported in order and track definition updates"""
+        from src.behavioral_pillar.behavioral_architect.manager import BehavioralPatternType
+
+        self.behavioral_architect.register_pattern(
+            name="ordered_pattern",
+            pattern_type=BehavioralPatternType.METHODOLOGY_ADHERENCE,
+            definition={"required_checks": ["check_c", "check_a", "check_b"]}
+        )
+        pattern = self.behavioral_architect.get_pattern("ordered_pattern")
+
+        result = self.behavioral_architect._validate_against_pattern(
+            {"performed_checks": ["check_a"]}, pattern
+        )
+        assert result["compliant"] is False
+        assert result["issues"] == [
+            "Missing methodology check: check_c",
+            "Missing methodology check: check_b"
+        ]
+
+        self.behavioral_architect.update_pattern(
+            "ordered_pattern", definition={"required_checks": ["check_a"]}
+        )
+        result = self.behavioral_architect._validate_against_pattern(
+            {"performed_checks": ["check_a"]}, pattern
+        )
+        assert result["compliant"] is True
+        assert result["issues"] == []
+
+    def test_pattern_to_dict_tracks_last_modified(self):
+        """Test that serialized timestamps follow pattern modifications"""
+        from datetime import datetime
+
+        pattern = self.behavioral_architect.get_pattern("default_response_formation")
+        assert pattern.to_dict()["created_at"] == pattern.created_at.isoformat()
+
+        pattern.last_modified = datetime(2030, 1, 1, 12, 0, 0)
+        assert pattern.to_dict()["last_modified"] == "2030-01-01T12:00:00"
+
+    def test_behavioral_pattern_uses_slots(self):
+        """Test that patterns have a fixed attribute layout"""
+        pattern = self.behavioral_architect.get_pattern("cognitive_processing_flow")
+
+        assert not hasattr(pattern, "__dict__")
+        with pytest.raises(AttributeError):
+            pattern.unknown_attribute = True
+
+    def test_disable_pattern_updates_memory(self):
+        """Test that toggling a registered pattern is reflected in memory"""
+        from src.behavioral_pillar.behavioral_architect.manager import BehavioralPatternType
+
+        memory_manager = self.behavioral_architect.memory_manager
+        self.behavioral_architect.register_pattern(
+            name="toggle_pattern",
+            pattern_type=BehavioralPatternType.METHODOLOGY_ADHERENCE,
+            definition={"required_checks": ["validation_gate"]}
+        )
+
+        assert self.behavioral_architect.disable_pattern("toggle_pattern") is True
+        entry = memory_manager.retrieve("behavioral_pattern_toggle_pattern")
+        assert entry is not None
+        assert entry.content["enabled"] is False
+
+        assert self.behavioral_architect.enable_pattern("toggle_pattern") is True
+        assert entry.content["enabled"] is True
+
+        # System patterns are not tracked in memory
+        assert self.behavioral_architect.disable_pattern("methodology_checkpoints") is True
+        assert memory_manager.retrieve("behavioral_pattern_methodology_checkpoints") is None
+
+    def test_behavioral_report_counts(self):
+        """Test report counts by type and enabled state"""
+        self.behavioral_architect.disable_pattern("default_response_formation")
+
+        summary = self.behavioral_architect.get_behavioral_report()["summary"]
+
+        assert summary["total_patterns"] == 3
+        assert summary["enabled_patterns"] == 2
+        assert summary["by_type"] == {
+            "response_formation": 1,
+            "cognitive_processing": 1,
+            "methodology_adherence": 1,
+            "consistency_patterns": 0
+        }
+
+    def test_generate_methodology_deduplicates_in_order(self):
+        """Test that combined steps and checks are deduplicated preserving order"""
+        from src.behavioral_pillar.behavioral_architect.manager import BehavioralPatternType
+
+        self.behavioral_architect.register_pattern(
+            name="overlapping_flow",
+            pattern_type=BehavioralPatternType.COGNITIVE_PROCESSING,
+            definition={
+                "steps": ["reason", "reflect", "act"],
+                "required_checks": ["role_activation", "peer_review"]
+            }
+        )
+
+        methodology = self.behavioral_architect.generate_methodology(
+            name="dedup_methodology",
+            patterns_to_combine=[
+                "cognitive_processing_flow", "methodology_checkpoints",
+                "overlapping_flow", "unknown_pattern"
+            ]
+        )
+
+        assert len(methodology["patterns"]) == 3
+        assert methodology["steps"] == [
+            "perceive", "interpret", "reason", "decide", "act", "reflect"
+        ]
+        assert methodology["validation_requirements"] == [
+            "validation_gate", "memory_consistency", "role_activation", "peer_review"
+        ]
+
+    def test_pattern_to_dict_cache_invalidated_on_change(self):
+        """Test that cached serialization reflects later modifications"""
+        pattern = self.behavioral_architect.get_pattern("cognitive_processing_flow")
+
+        first = pattern.to_dict()
+        first["enabled"] = "mutated by caller"
+        assert pattern.to_dict()["enabled"] is True
+
+        self.behavioral_architect.disable_pattern("cognitive_processing_flow")
+        self.behavioral_architect.update_pattern("cognitive_processing_flow", description="Updated")
+
+        serialized = pattern.to_dict()
+        assert serialized["enabled"] is False
+        assert serialized["description"] == "Updated"
+
+        self.behavioral_architect.enable_pattern("cognitive_processing_flow")
+        self.behavioral_architect.update_pattern("cognitive_processing_flow", definition={"steps": ["act"]})
+        serialized = pattern.to_dict()
+        assert serialized["enabled"] is True
+        assert serialized["definition"] == {"steps": ["act"]}
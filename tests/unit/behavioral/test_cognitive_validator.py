@@ -247,4 +247,113 @@ class TestCognitiveValidator:
         assert "tracked_patterns" in summary
         assert "detected_drifts" in summary
         assert "drift_history_count" in summary
-        assert "timestamp" in summary
\ No newline at end of file
+        assert "timestamp" in summary
+
+    def test_comprehensive_validation_shares_one_timestamp(self):
+        """Test that a comprehensive run stamps all results once without id collisions"""
+        memory_manager = self.cognitive_validator.memory_manager
+
+        result = self.cognitive_validator.run_comprehensive_validation({
+            "responses": [{"tone": "professional"}],
+            "performed_steps": ["analyze"]
+        })
+
+        stored = memory_manager.search(tags=["result"])
+        assert len(stored) == 3
+        assert {entry.content["timestamp"] for entry in stored} == {result["timestamp"]}
+
+    def test_detect_reasoning_deviation_by_step_type(self):
+        """Test that reordered reasoning steps of equal length count as deviation"""
+        baseline_behavior = {
+            "reasoning_steps": [{"type": "perceive"}, {"type": "analyze"}, {"type": "reason"}]
+        }
+        same_behavior = {
+            "reasoning_steps": [{"type": "perceive"}, {"type": "analyze"}, {"type": "reason"}]
+        }
+        reordered_behavior = {
+            "reasoning_steps": [{"type": "perceive"}, {"type": "reason"}, {"type": "analyze"}]
+        }
+
+        assert self.cognitive_validator.detect_cognitive_drift(same_behavior, baseline_behavior) == []
+
+        drifts = self.cognitive_validator.detect_cognitive_drift(reordered_behavior, baseline_behavior)
+        assert [drift["drift_type"] for drift in drifts] == ["reasoning_deviation"]
+
+    def test_detected_drifts_are_bounded(self):
+        """Test that drift tracking keeps a bounded window with unique ids"""
+        from src.behavioral_pillar.cognitive_validator import manager
+
+        baseline_behavior = {"methodology_followed": ["analyze"]}
+        current_behavior = {"methodology_followed": []}
+
+        for _ in range(manager.MAX_DETECTED_DRIFTS + 5):
+            self.cognitive_validator.detect_cognitive_drift(current_behavior, baseline_behavior)
+
+        detected = self.cognitive_validator.detected_drifts
+        assert len(detected) == manager.MAX_DETECTED_DRIFTS
+        assert len({drift["drift_id"] for drift in detected}) == manager.MAX_DETECTED_DRIFTS
+
+        report = self.cognitive_validator.get_cognitive_report()
+        assert isinstance(report["drifts"]["current"], list)
+        assert report["summary"]["detected_drifts"] == manager.MAX_DETECTED_DRIFTS
+
+    def test_cognitive_report_drift_section_refreshes(self):
+        """Test that the drift section is reused until a new drift is recorded"""
+        first = self.cognitive_validator.get_cognitive_report()
+        second = self.cognitive_validator.get_cognitive_report()
+        assert first["drifts"] is second["drifts"]
+
+        self.cognitive_validator.detect_cognitive_drift(
+            {"methodology_followed": []}, {"methodology_followed": ["analyze"]}
+        )
+
+        third = self.cognitive_validator.get_cognitive_report()
+        assert len(third["drifts"]["current"]) == 1
+        assert first["drifts"]["current"] == []
+
+    def test_validate_behavioral_consistency_fast_fail(self):
+        """Test that fast_fail stops at the first inconsistency"""
+        target_behavior = {
+            "responses": [
+                {"tone": "professional"},
+                {"tone": "casual"},
+                {"tone": "casual"}
+            ],
+            "reasoning_steps": [{"type": "perceive"}]
+        }
+
+        full = self.cognitive_validator.validate_behavioral_consistency(target_behavior)
+        fast = self.cognitive_validator.validate_behavioral_consistency(target_behavior, fast_fail=True)
+
+        assert full.status.value == "fail"
+        assert len(full.errors) == 3
+        assert fast.status.value == "fail"
+        assert fast.errors == ["Inconsistency detected between response 0 and response 1"]
+
+    def test_detect_cognitive_drift_accepts_snapshots(self):
+        """Test that a prepared baseline snapshot gives the same drifts as its dict"""
+        from src.behavioral_pillar.cognitive_validator.manager import BehaviorSnapshot
+
+        baseline_behavior = {
+            "reasoning_steps": [{"type": "perceive"}, {"type": "analyze"}],
+            "responses": [{"style": "formal"}],
+            "methodology_followed": ["analyze", "validate"]
+        }
+        current_behavior = {
+            "reasoning_steps": [{"type": "perceive"}, {"type": "analyze"}],
+            "responses": [{"style": "casual"}],
+            "methodology_followed": ["analyze"]
+        }
+        baseline_snapshot = BehaviorSnapshot.from_dict(baseline_behavior)
+        assert baseline_snapshot.reasoning_types == ("perceive", "analyze")
+        assert baseline_snapshot.first_response_style == "formal"
+
+        from_dict = self.cognitive_validator.detect_cognitive_drift(current_behavior, baseline_behavior)
+        from_snapshot = self.cognitive_validator.detect_cognitive_drift(
+            BehaviorSnapshot.from_dict(current_behavior), baseline_snapshot
+        )
+
+        assert [drift["drift_type"] for drift in from_snapshot] == [
+            "response_inconsistency", "methodology_violation"
+        ]
+        assert [drift["details"] for drift in from_snapshot] == [drift["details"] for drift in from_dict]
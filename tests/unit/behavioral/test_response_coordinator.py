@@ -1,8 +1,11 @@
 """
 Unit tests for the ResponseCoordinator component
 """
+import copy
+import json
+
 import pytest
-from src.behavioral_pillar.response_coordinator.manager import ResponseCoordinator
+from src.behavioral_pillar.response_coordinator.manager import ResponseCoordinator, GateResult, StepResult
 from src.core.memory.manager import MemoryManager
 from src.core.validation_gates.manager import ValidationGates
 from src.behavioral_pillar.behavioral_architect.manager import BehavioralArchitect
@@ -206,4 +209,332 @@ class TestResponseCoordinator:
         assert "registered_protocols" in summary
         assert "quality_criteria_count" in summary
         assert "observation_templates_count" in summary
-        assert "timestamp" in summary
\ No newline at end of file
+        assert "timestamp" in summary
+
+    def test_coordination_report_is_plain_data(self):
+        """Test that the report copies frozen configuration into plain JSON-serializable data"""
+        report = self.response_coordinator.get_response_coordination_report()
+
+        assert json.loads(json.dumps(report)) == report
+        copied = copy.deepcopy(report)
+        assert type(copied["quality_criteria"]["accuracy"]) is dict
+        assert isinstance(copied["observation_templates"]["quality_assessment"]["required_for"], list)
+
+        report["quality_criteria"]["accuracy"]["weight"] = 0.0
+        assert self.response_coordinator.quality_criteria["accuracy"]["weight"] != 0.0
+
+    def test_protocol_steps_and_checks_dispatch(self):
+        """Test dispatch of known and unknown protocol steps and observation checks"""
+        coordinator = self.response_coordinator
+
+        assert coordinator._run_protocol_step("document_observations", {}) == StepResult(
+            "document_observations", {"success": True, "details": "Observations documented"}, True
+        )
+        assert coordinator._run_protocol_step("unknown_step", {}) == StepResult(
+            "unknown_step", {"success": False, "error": "Unknown protocol step: unknown_step"}, False
+        )
+
+        # A step result without a success flag fails the step instead of raising
+        coordinator._step_dispatch["document_observations"] = lambda request: {"details": "no flag"}
+        assert coordinator._run_protocol_step("document_observations", {}) == StepResult(
+            "document_observations", {"details": "no flag"}, False
+        )
+
+        assert coordinator._perform_observation_check("tone_consistency", {}) == {
+            "check": "tone_consistency",
+            "result": {"success": True},
+            "details": "Tone consistency assessment completed"
+        }
+        assert coordinator._perform_observation_check("accuracy_check", {})["result"]["success"] is True
+        unknown = coordinator._perform_observation_check("unknown_check", {})
+        assert unknown["result"]["success"] is False
+        assert unknown["details"] == "Unknown check: unknown_check"
+
+    def test_quality_scores_follow_response_signals(self):
+        """Test that memoized criterion scores still track each response"""
+        coordinator = self.response_coordinator
+
+        rich = coordinator.assess_response_quality({
+            "citations": ["doc"], "structured": True, "topic_aligned": True, "complete_coverage": True
+        })
+        bare = coordinator.assess_response_quality({})
+
+        assert rich["individual_scores"]["accuracy"]["score"] == 0.85
+        assert bare["individual_scores"]["accuracy"]["score"] == 0.6
+        assert bare["individual_scores"]["relevance"]["passed"] is False
+        assert rich["weighted_average"] == pytest.approx(0.85)
+        assert rich["overall_quality"] == "good"
+        assert rich["individual_scores"]["clarity"]["score"] == 0.8
+
+        coordinator.set_quality_criterion("originality", weight=0.0, threshold=0.4)
+        assert coordinator.assess_response_quality({})["individual_scores"]["originality"]["score"] == 0.5
+
+    def test_coordinate_response_async_matches_sync(self):
+        """Test that concurrent coordination keeps protocol order and outcomes"""
+        import asyncio
+
+        request = {"user_intent": "Summarize agent roles", "structured": True}
+        protocol = self.response_coordinator.response_protocols["quality_assured"]
+
+        sync_result = self.response_coordinator.coordinate_response(request, "quality_assured")
+        async_result = asyncio.run(
+            self.response_coordinator.coordinate_response_async(request, "quality_assured")
+        )
+
+        assert [r["step"] for r in async_result["execution_results"]] == protocol["requirement_steps"]
+        assert async_result["execution_results"] == sync_result["execution_results"]
+        assert async_result["validation_results"] == sync_result["validation_results"]
+        assert async_result["overall_success"] == sync_result["overall_success"]
+
+        unknown = asyncio.run(self.response_coordinator.coordinate_response_async(request, "missing"))
+        assert unknown["status"] == "error"
+
+    def test_quality_levels_and_shared_timestamp(self):
+        """Test quality level thresholds and that the stored assessment shares its timestamp"""
+        coordinator = self.response_coordinator
+
+        bare = coordinator.assess_response_quality({})
+        assert bare["weighted_average"] == pytest.approx(0.6075)
+        assert bare["overall_quality"] == "poor"
+
+        coordinator.set_quality_criterion("relevance", weight=0.0, threshold=0.8)
+        coordinator.set_quality_criterion("accuracy", weight=0.0, threshold=0.8)
+        assert coordinator.assess_response_quality({})["overall_quality"] == "failed"
+
+        stored = [entry for entry in coordinator.memory_manager.search(tags=["response_quality"])
+                  if entry.content is bare]
+        assert len(stored) == 1
+        assert stored[0].creation_time.isoformat() == bare["timestamp"]
+
+    def test_background_persist_stores_entries(self):
+        """Test that results queued for background persistence reach memory"""
+        memory_manager = MemoryManager()
+        coordinator = ResponseCoordinator(
+            memory_manager=memory_manager,
+            validation_gates=ValidationGates(),
+            behavioral_architect=BehavioralArchitect(),
+            background_persist=True
+        )
+
+        def stored_contents(tag):
+            return [entry.content for entry in memory_manager.search(tags=[tag])]
+
+        quality = coordinator.assess_response_quality({"structured": True})
+        coordinator.flush()
+        assert any(content is quality for content in stored_contents("response_quality"))
+
+        observation = coordinator.apply_systematic_observation({}, "consistency_check")
+        coordinator.close()
+        assert any(content is observation for content in stored_contents("systematic_observation"))
+
+        # After close, entries are stored synchronously again
+        quality = coordinator.assess_response_quality({})
+        assert any(content is quality for content in stored_contents("response_quality"))
+
+    def test_observation_templates_apply_required_checks(self):
+        """Test that only required checks run, including for registered and replaced templates"""
+        coordinator = self.response_coordinator
+
+        coordinator.register_observation_template("partial", {
+            "template": {"tone_consistency": True, "format_consistency": False, "clarity_check": True}
+        })
+        result = coordinator.apply_systematic_observation({}, "partial")
+        assert list(result["observations"]) == ["tone_consistency", "clarity_check"]
+
+        coordinator.register_observation_template("partial", {"template": {"format_consistency": True}})
+        result = coordinator.apply_systematic_observation({}, "partial")
+        assert list(result["observations"]) == ["format_consistency"]
+
+        # The registry is read-only; templates change only through registration
+        with pytest.raises(TypeError):
+            coordinator.observation_templates["direct"] = {"template": {"relevance_check": True}}
+        with pytest.raises(TypeError):
+            coordinator.observation_templates["partial"]["template"]["tone_consistency"] = True
+        with pytest.raises(TypeError):
+            coordinator.quality_criteria["accuracy"]["weight"] = 1.0
+
+    def test_repeated_assessments_get_distinct_entries(self):
+        """Test that back-to-back assessments are all kept in memory"""
+        memory_manager = self.response_coordinator.memory_manager
+        before = len(memory_manager.search(tags=["response_quality"]))
+
+        for _ in range(5):
+            self.response_coordinator.assess_response_quality({})
+
+        assert len(memory_manager.search(tags=["response_quality"])) == before + 5
+
+    def test_is_validation_successful(self):
+        """Test that any failing gate fails validation"""
+        check = self.response_coordinator._is_validation_successful
+
+        assert check([]) is True
+        assert check([GateResult("a", "pass", ""), GateResult("b", "skipped", "")]) is True
+        assert check([GateResult("a", "fail", ""), GateResult("b", "pass", "")]) is False
+
+    def test_coordinate_response_reports_failing_step(self):
+        """Test that a raising protocol step is recorded and fails the coordination"""
+        def broken_step(request):
+            raise RuntimeError("step exploded")
+
+        self.response_coordinator._step_dispatch["check_formatting_standards"] = broken_step
+
+        result = self.response_coordinator.coordinate_response({"user_intent": "test"})
+
+        assert result["overall_success"] is False
+        assert result["execution_results"][1] == {
+            "step": "check_formatting_standards",
+            "result": {"error": "step exploded"},
+            "success": False
+        }
+        assert all(isinstance(gate, dict) for gate in result["validation_results"])
+
+    def test_coordination_report_protocols_refresh(self):
+        """Test that the protocols section is reused until a protocol is registered"""
+        first = self.response_coordinator.get_response_coordination_report()
+        cached = self.response_coordinator._protocol_report_cache
+        second = self.response_coordinator.get_response_coordination_report()
+        assert self.response_coordinator._protocol_report_cache is cached
+        assert first["protocols"] == second["protocols"]
+
+        # Each report gets its own copy; changing one leaves later reports alone
+        first["protocols"]["quality_assured"]["name"] = "changed"
+        first["protocols"].pop("standards_compliant")
+        later = self.response_coordinator.get_response_coordination_report()
+        assert later["protocols"] == second["protocols"]
+
+        self.response_coordinator.register_custom_protocol("report_protocol", {
+            "name": "Report Protocol",
+            "description": "Registered after the first report",
+            "requirement_steps": ["document_observations"],
+            "validation_gates": []
+        })
+
+        third = self.response_coordinator.get_response_coordination_report()
+        assert third["summary"]["registered_protocols"] == 4
+        assert third["protocols"]["report_protocol"]["requirement_steps_count"] == 1
+        assert "report_protocol" not in first["protocols"]
+
+    def test_coordinate_response_unknown_step(self):
+        """Test that an unknown protocol step is reported without raising"""
+        self.response_coordinator.register_custom_protocol("typo_protocol", {
+            "name": "Typo Protocol",
+            "description": "Names a step that does not exist",
+            "requirement_steps": ["document_observations", "documnet_observations"],
+            "validation_gates": []
+        })
+
+        result = self.response_coordinator.coordinate_response({}, "typo_protocol")
+
+        assert result["overall_success"] is False
+        assert [step["success"] for step in result["execution_results"]] == [True, False]
+        assert result["execution_results"][1]["result"]["error"] == \
+            "Unknown protocol step: documnet_observations"
+
+    def test_collaborators_created_on_first_use(self):
+        """Test that unsupplied collaborators are built lazily and then reused"""
+        memory_manager = MemoryManager()
+        coordinator = ResponseCoordinator(memory_manager=memory_manager)
+
+        assert "validation_gates" not in vars(coordinator)
+        assert "cognitive_validator" not in vars(coordinator)
+
+        coordinator.assess_response_quality({})
+        assert "validation_gates" not in vars(coordinator)
+        assert coordinator.memory_manager is memory_manager
+
+        validator = coordinator.cognitive_validator
+        assert validator is coordinator.cognitive_validator
+        assert validator.memory_manager is memory_manager
+        assert validator.validation_gates is coordinator.validation_gates
+
+    def test_concurrent_first_use_builds_one_collaborator(self, monkeypatch):
+        """Test that threads racing on first access share a single lazily built collaborator"""
+        import threading
+        import time
+        from src.behavioral_pillar.response_coordinator import manager as coordinator_module
+
+        built = []
+
+        class SlowValidationGates(ValidationGates):
+            def __init__(self):
+                time.sleep(0.02)
+                built.append(self)
+                super().__init__()
+
+        monkeypatch.setattr(coordinator_module, "ValidationGates", SlowValidationGates)
+        coordinator = ResponseCoordinator(memory_manager=MemoryManager())
+        seen = []
+        threads = [
+            threading.Thread(target=lambda: seen.append(coordinator.validation_gates))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(gates is built[0] for gates in seen)
+
+    def test_passing_observation_results_are_independent_plain_data(self):
+        """Test that constant observation results are plain copies callers may change"""
+        first = self.response_coordinator.apply_systematic_observation({}, "consistency_check")
+
+        assert json.loads(json.dumps(first)) == first
+        tone = first["observations"]["tone_consistency"]
+        assert tone["details"] == "Tone consistency assessment completed"
+        tone["result"]["success"] = False
+
+        second = self.response_coordinator.apply_systematic_observation({}, "consistency_check")
+        assert second["observations"]["tone_consistency"]["result"]["success"] is True
+        assert self.response_coordinator._template_checks["consistency_check"][0] == (
+            "tone_consistency", "Tone consistency assessment completed"
+        )
+
+    def test_protocol_plan_compiled_once(self):
+        """Test that protocols are compiled to interned plans and reused"""
+        from src.behavioral_pillar.response_coordinator.manager import ProtocolPlan
+
+        coordinator = self.response_coordinator
+        coordinator.coordinate_response({}, "quality_assured")
+        plan = coordinator._compiled_protocols["quality_assured"]
+
+        assert isinstance(plan, ProtocolPlan)
+        assert plan.steps == tuple(coordinator.response_protocols["quality_assured"]["requirement_steps"])
+        assert plan.gates == ("behavior_consistency_check", "semantic_mapping_check")
+
+        coordinator.coordinate_response({}, "quality_assured")
+        assert coordinator._compiled_protocols["quality_assured"] is plan
+        with pytest.raises(AttributeError):
+            plan.steps = ()
+
+        # A protocol without gates or checkpoints compiles to empty tuples
+        coordinator.register_custom_protocol("bare_protocol", {
+            "name": "Bare", "description": "Steps only", "requirement_steps": ["document_observations"]
+        })
+        result = coordinator.coordinate_response({}, "bare_protocol")
+        assert result["validation_results"] == []
+        assert coordinator._compiled_protocols["bare_protocol"].checkpoints == ()
+
+    def test_coordination_shares_timestamp_with_quality_assessment(self):
+        """Test that a coordination and its quality assessment carry one timestamp"""
+        result = self.response_coordinator.coordinate_response({"structured": True})
+
+        assert result["quality_assessment"]["timestamp"] == result["timestamp"]
+
+    def test_template_checks_resolve_constant_results(self):
+        """Test that constant checks are resolved when a template is registered"""
+        coordinator = self.response_coordinator
+        coordinator.register_observation_template("mixed", {
+            "template": {"accuracy_check": True, "clarity_check": True, "made_up_check": True}
+        })
+
+        compiled = dict(coordinator._template_checks["mixed"])
+        assert compiled["accuracy_check"] is None
+        assert compiled["made_up_check"] is None
+        assert compiled["clarity_check"] == "Clarity assessment completed"
+
+        observations = coordinator.apply_systematic_observation({}, "mixed")["observations"]
+        assert observations["accuracy_check"]["details"] == "Content accuracy validated"
+        assert observations["made_up_check"]["result"]["success"] is False
+        assert observations["clarity_check"] == coordinator._perform_observation_check("clarity_check", {})
@@ -0,0 +1,396 @@
+"""
+Unit tests for the ActivationSystem component
+"""
+import asyncio
+import logging
+import sys
+import time
+from datetime import timedelta
+
+from src.core.activation_system.manager import ActivationSystem, ActivationContext, ActivationProfile
+
+
+class TestActivationSystem:
+    """Test suite for ActivationSystem functionality"""
+
+    def setup_method(self):
+        """Setup method that runs before each test"""
+        self.activation_system = ActivationSystem()
+
+    def test_is_active_tracks_activation_and_deactivation(self):
+        """Test that is_active follows activate/deactivate and ignores unknown ids"""
+        assert not self.activation_system.is_active("sre-specialist")
+        assert not self.activation_system.is_active("no-such-profile")
+
+        assert self.activation_system.activate_profile("sre-specialist")
+        assert self.activation_system.is_active("sre-specialist")
+
+        assert self.activation_system.deactivate_profile("sre-specialist")
+        assert not self.activation_system.is_active("sre-specialist")
+
+    def test_run_cleanup_loop_deactivates_expired_profiles(self):
+        """Test that the async cleanup loop sweeps expired activations"""
+        self.activation_system.activate_profile("sre-specialist", duration=timedelta(microseconds=1))
+
+        async def run_briefly():
+            task = asyncio.create_task(self.activation_system.run_cleanup_loop(interval_seconds=0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        asyncio.run(run_briefly())
+
+        assert not self.activation_system.is_active("sre-specialist")
+
+    def test_activate_by_context_follows_priority_order(self):
+        """Test that context activation only touches that context, highest priority first"""
+        self.activation_system.register_profile(ActivationProfile(
+            id="capacity-planner", name="Capacity Planner",
+            context=ActivationContext.TECHNICAL, priority=10
+        ))
+
+        activated = self.activation_system.activate_by_context(ActivationContext.TECHNICAL)
+
+        assert activated == [
+            "capacity-planner", "sre-specialist", "infrastructure-architect", "validation-engineer"
+        ]
+        assert not self.activation_system.is_active("domain-linguist")
+
+        deactivated = self.activation_system.deactivate_by_context(ActivationContext.TECHNICAL)
+        assert sorted(deactivated) == sorted(activated)
+
+    def test_activation_stats_count_active_profiles_per_context(self):
+        """Test that stats reflect activations and deactivations per context"""
+        self.activation_system.activate_by_context(ActivationContext.TECHNICAL)
+        self.activation_system.activate_profile("domain-linguist")
+        self.activation_system.activate_profile("domain-linguist")  # re-activation is not double counted
+        self.activation_system.deactivate_profile("validation-engineer")
+
+        stats = self.activation_system.get_activation_stats()
+
+        assert stats["active_profiles"] == 3
+        assert stats["activation_counts_by_context"] == {
+            "technical": 2, "behavioral": 0, "semantic": 1, "integration": 0
+        }
+
+    def test_cleanup_expired_skips_superseded_expiry_entries(self):
+        """Test that re-activation without a duration overrides an earlier expiry"""
+        self.activation_system.activate_profile("sre-specialist", duration=timedelta(microseconds=1))
+        self.activation_system.activate_profile("domain-linguist", duration=timedelta(microseconds=1))
+        self.activation_system.activate_profile("sre-specialist")
+
+        self.activation_system.cleanup_expired()
+
+        assert self.activation_system.is_active("sre-specialist")
+        assert not self.activation_system.is_active("domain-linguist")
+        assert self.activation_system._expiry_heap == []
+
+    def test_trigger_contextual_activation_matches_keywords_case_insensitively(self):
+        """Test that only known keywords for the context trigger activation"""
+        assert self.activation_system.trigger_contextual_activation(ActivationContext.SEMANTIC, "unrelated") == []
+        assert self.activation_system.trigger_contextual_activation(ActivationContext.TECHNICAL, "Semantic") == []
+
+        activated = self.activation_system.trigger_contextual_activation(ActivationContext.SEMANTIC, "Ontology")
+
+        assert activated == ["domain-linguist"]
+
+    def test_activation_records_follow_persist_flag(self):
+        """Test that activation records are only stored when persistence is enabled"""
+        self.activation_system.activate_profile("sre-specialist")
+        assert self.activation_system._memory_manager.retrieve("activation_sre-specialist") is not None
+
+        transient = ActivationSystem(persist_activations=False)
+        assert transient.activate_profile("sre-specialist")
+        assert transient.is_active("sre-specialist")
+        assert transient._memory_manager.retrieve("activation_sre-specialist") is None
+
+    def test_activate_by_context_stores_records_in_one_batch(self):
+        """Test that bulk activation hands all tracking records to the memory manager at once"""
+        memory_manager = self.activation_system._memory_manager
+        batches = []
+        original_store_many = memory_manager.store_many
+
+        def recording_store_many(entries):
+            batches.append([entry.id for entry in entries])
+            return original_store_many(entries)
+
+        memory_manager.store_many = recording_store_many
+
+        self.activation_system.activate_by_context(ActivationContext.BEHAVIORAL)
+
+        # response-coordinator is skipped: cognitive-validator is not yet active when it is reached
+        assert batches == [["activation_behavioral-architect", "activation_cognitive-validator"]]
+        assert memory_manager.retrieve("activation_cognitive-validator") is not None
+
+    def test_get_active_profiles_excludes_expired_activations(self):
+        """Test that expired activations are hidden before cleanup runs, keeping wall-clock times"""
+        self.activation_system.activate_profile("sre-specialist", duration=timedelta(microseconds=1))
+        self.activation_system.activate_profile("domain-linguist", duration=timedelta(hours=1))
+
+        active_ids = [profile.id for profile in self.activation_system.get_active_profiles()]
+
+        assert active_ids == ["domain-linguist"]
+        linguist = self.activation_system._profiles["domain-linguist"]
+        assert linguist.expiry_time - linguist.activation_time == timedelta(hours=1)
+
+    def test_activation_profile_defaults_are_independent(self):
+        """Test that profiles get their own dependency and callback lists"""
+        first = ActivationProfile(id="first", name="First", context=ActivationContext.SEMANTIC)
+        second = ActivationProfile(id="second", name="Second", context=ActivationContext.SEMANTIC, priority=3)
+
+        first.dependencies.append("domain-linguist")
+
+        assert second.dependencies == []
+        assert second.deactivation_callbacks == []
+        assert (first.priority, second.priority) == (5, 3)
+        assert not hasattr(first, "__dict__")
+
+    def test_dynamic_profiles_are_evicted_least_recently_used_first(self):
+        """Test that the dynamic registry is bounded while defaults and active profiles are kept"""
+        system = ActivationSystem(max_dynamic_profiles=2)
+
+        def dynamic(profile_id):
+            return ActivationProfile(id=profile_id, name=profile_id, context=ActivationContext.INTEGRATION)
+
+        system.register_profile(dynamic("first"))
+        system.register_profile(dynamic("second"))
+        system.activate_profile("first")
+        system.register_profile(dynamic("third"))
+
+        assert system.activate_profile("first")
+        assert not system.activate_profile("second")  # evicted: oldest inactive dynamic profile
+        assert system.activate_profile("third")
+        assert system.activate_profile("domain-linguist")
+        assert system.activate_by_context(ActivationContext.INTEGRATION) == ["first", "third"]
+
+    def test_activation_requires_transitive_dependencies(self):
+        """Test that activation checks dependencies of dependencies"""
+        self.activation_system.activate_profile("behavioral-architect")
+        self.activation_system.activate_profile("cognitive-validator")
+        self.activation_system.deactivate_profile("behavioral-architect")
+        self.activation_system.register_profile(ActivationProfile(
+            id="drift-monitor", name="Drift Monitor",
+            context=ActivationContext.BEHAVIORAL, dependencies=["cognitive-validator"]
+        ))
+
+        assert not self.activation_system.activate_profile("drift-monitor")
+
+        self.activation_system.activate_profile("behavioral-architect")
+        assert self.activation_system.activate_profile("drift-monitor")
+
+    def test_register_profile_rejects_circular_dependencies(self):
+        """Test that a profile closing a dependency cycle is not registered"""
+        assert self.activation_system.register_profile(ActivationProfile(
+            id="left", name="Left", context=ActivationContext.SEMANTIC, dependencies=["right"]
+        ))
+        assert not self.activation_system.register_profile(ActivationProfile(
+            id="right", name="Right", context=ActivationContext.SEMANTIC, dependencies=["left"]
+        ))
+        assert not self.activation_system.activate_profile("right")
+        assert self.activation_system.register_profile(ActivationProfile(
+            id="right", name="Right", context=ActivationContext.SEMANTIC
+        ))
+
+    def test_eviction_keeps_dependencies_of_registered_profiles(self):
+        """Test that a dynamic profile other profiles depend on is never evicted"""
+        system = ActivationSystem(max_dynamic_profiles=2)
+        system.register_profile(ActivationProfile(id="a", name="A", context=ActivationContext.INTEGRATION))
+        system.register_profile(ActivationProfile(
+            id="b", name="B", context=ActivationContext.INTEGRATION, dependencies=["a"]
+        ))
+        for profile_id in ("a", "b"):
+            system.activate_profile(profile_id)
+        for profile_id in ("b", "a"):
+            system.deactivate_profile(profile_id)
+
+        system.register_profile(ActivationProfile(id="c", name="C", context=ActivationContext.INTEGRATION))
+
+        # b goes instead of a, which b still needs
+        assert "b" not in system._profiles
+        assert list(system._dynamic_profiles) == ["a", "c"]
+        assert "a" not in system._dependents
+
+        # Activating a dependent marks its dependencies as used too
+        assert system.activate_profile("a")
+        assert system.activate_profile("c")
+        system.register_profile(ActivationProfile(
+            id="d", name="D", context=ActivationContext.INTEGRATION, dependencies=["a"]
+        ))
+        assert system.activate_profile("d")
+        assert list(system._dynamic_profiles) == ["c", "a", "d"]
+
+    def test_dependency_closures_extend_when_a_named_profile_registers(self):
+        """Test that closures and cycle checks follow profiles registered after their dependents"""
+        system = ActivationSystem()
+        register = system.register_profile
+        assert register(ActivationProfile(id="top", name="Top", context=ActivationContext.SEMANTIC, dependencies=["mid"]))
+        assert register(ActivationProfile(id="mid", name="Mid", context=ActivationContext.SEMANTIC, dependencies=["low"]))
+        assert system._dependency_closures["top"] == {"mid", "low"}
+
+        assert not register(ActivationProfile(id="low", name="Low", context=ActivationContext.SEMANTIC, dependencies=["top"]))
+        assert not register(ActivationProfile(id="self", name="Self", context=ActivationContext.SEMANTIC, dependencies=["self"]))
+        assert register(ActivationProfile(
+            id="low", name="Low", context=ActivationContext.SEMANTIC, dependencies=["domain-linguist"]
+        ))
+        assert system._dependency_closures["top"] == {"mid", "low", "domain-linguist"}
+        assert system._dependency_closures["mid"] == {"low", "domain-linguist"}
+
+        assert not system.activate_profile("low")
+        for profile_id in ("domain-linguist", "low", "mid", "top"):
+            assert system.activate_profile(profile_id)
+
+    def test_rejected_registration_evicts_nothing(self):
+        """Test that a profile refused for a dependency cycle leaves the dynamic registry intact"""
+        system = ActivationSystem(max_dynamic_profiles=2)
+        system.register_profile(ActivationProfile(
+            id="left", name="Left", context=ActivationContext.INTEGRATION, dependencies=["right"]
+        ))
+        system.register_profile(ActivationProfile(
+            id="middle", name="Middle", context=ActivationContext.INTEGRATION
+        ))
+
+        assert not system.register_profile(ActivationProfile(
+            id="right", name="Right", context=ActivationContext.INTEGRATION, dependencies=["left"]
+        ))
+        assert "left" in system._profiles
+        assert "middle" in system._profiles
+        assert system.activate_profile("middle")
+
+    def test_context_bucket_orders_by_priority_then_registration(self):
+        """Test that context activation order is priority first, registration order among ties"""
+        for profile_id, priority in [("low", 2), ("high-a", 9), ("mid", 5), ("high-b", 9)]:
+            self.activation_system.register_profile(ActivationProfile(
+                id=profile_id, name=profile_id, context=ActivationContext.INTEGRATION, priority=priority
+            ))
+
+        activated = self.activation_system.activate_by_context(ActivationContext.INTEGRATION)
+
+        assert activated == ["high-a", "high-b", "mid", "low"]
+
+    def test_deactivation_deletes_only_stored_records(self):
+        """Test that deactivation removes the tracking record and skips the delete when none was stored"""
+        memory_manager = self.activation_system._memory_manager
+        self.activation_system.activate_profile("sre-specialist")
+        self.activation_system.deactivate_profile("sre-specialist")
+        assert memory_manager.retrieve("activation_sre-specialist") is None
+
+        transient = ActivationSystem(persist_activations=False)
+        deleted = []
+        transient._memory_manager.delete = lambda entry_id, memory_type=None: deleted.append(entry_id)
+        transient.activate_profile("sre-specialist")
+
+        assert transient.deactivate_profile("sre-specialist")
+        assert deleted == []
+
+    def test_deactivation_awaits_async_callbacks_concurrently(self):
+        """Test that sync callbacks run inline and async callbacks overlap, with failures isolated"""
+        calls = []
+
+        async def slow_callback(name):
+            await asyncio.sleep(0.05)
+            calls.append(name)
+
+        async def failing_callback():
+            raise RuntimeError("callback failed")
+
+        profile = self.activation_system._profiles["sre-specialist"]
+        profile.deactivation_callbacks.extend([
+            lambda: calls.append("sync"),
+            lambda: slow_callback("first"),
+            failing_callback,
+            lambda: slow_callback("second"),
+        ])
+        self.activation_system.activate_profile("sre-specialist")
+
+        start = time.monotonic()
+        assert self.activation_system.deactivate_profile("sre-specialist")
+        elapsed = time.monotonic() - start
+
+        assert calls == ["sync", "first", "second"]
+        assert elapsed < 0.1
+        assert not self.activation_system.is_active("sre-specialist")
+
+    def test_get_active_profiles_cache_follows_changes_and_expiry(self):
+        """Test that the cached active list is refreshed on changes and when an activation expires"""
+        def active_ids():
+            return [profile.id for profile in self.activation_system.get_active_profiles()]
+
+        self.activation_system.activate_profile("sre-specialist", duration=timedelta(milliseconds=20))
+        self.activation_system.activate_profile("domain-linguist")
+        assert active_ids() == ["sre-specialist", "domain-linguist"]
+
+        self.activation_system.deactivate_profile("domain-linguist")
+        assert active_ids() == ["sre-specialist"]
+
+        time.sleep(0.03)
+        assert active_ids() == []
+
+    def test_registered_profile_ids_are_interned(self):
+        """Test that registration interns runtime-built ids so lookups still match"""
+        profile_id = "".join(["runtime", "-", "profile"])
+        dependency = "".join(["domain", "-", "linguist"])
+        self.activation_system.register_profile(ActivationProfile(
+            id=profile_id, name="Runtime", context=ActivationContext.SEMANTIC, dependencies=[dependency]
+        ))
+
+        profile = self.activation_system._profiles["runtime-profile"]
+        assert profile.id is sys.intern("runtime-profile")
+        assert profile.dependencies[0] is sys.intern("domain-linguist")
+        self.activation_system.activate_profile("domain-linguist")
+        assert self.activation_system.activate_profile(profile_id)
+
+    def test_registration_leaves_caller_dependency_list_untouched(self):
+        """Test that interning never rewrites the list the caller passed in"""
+        accepted_deps = ["".join(["domain", "-", "linguist"])]
+        accepted = ActivationProfile(
+            id="runtime-profile", name="Runtime", context=ActivationContext.SEMANTIC, dependencies=accepted_deps
+        )
+        assert self.activation_system.register_profile(accepted)
+        assert accepted.dependencies is not accepted_deps
+        assert accepted_deps == ["domain-linguist"]
+
+        rejected_deps = ["".join(["runtime", "-", "profile"])]
+        original_dep = rejected_deps[0]
+        rejected = ActivationProfile(
+            id="domain-linguist", name="Duplicate", context=ActivationContext.SEMANTIC, dependencies=rejected_deps
+        )
+        assert not self.activation_system.register_profile(rejected)
+        assert rejected.dependencies is rejected_deps
+        assert rejected_deps[0] is original_dep
+
+        self.activation_system.register_profile(ActivationProfile(
+            id="left", name="Left", context=ActivationContext.SEMANTIC, dependencies=["right"]
+        ))
+        cyclic_deps = ["".join(["le", "ft"])]
+        original_dep = cyclic_deps[0]
+        cyclic = ActivationProfile(
+            id="right", name="Right", context=ActivationContext.SEMANTIC, dependencies=cyclic_deps
+        )
+        assert not self.activation_system.register_profile(cyclic)
+        assert cyclic.dependencies is cyclic_deps
+        assert cyclic_deps[0] is original_dep
+
+    def test_missing_dependency_is_logged_by_module_logger(self, caplog):
+        """Test that a blocked activation names the missing dependencies"""
+        with caplog.at_level(logging.WARNING, logger="src.core.activation_system.manager"):
+            assert not self.activation_system.activate_profile("response-coordinator")
+
+        assert caplog.messages == [
+            "Cannot activate response-coordinator, dependencies "
+            "['behavioral-architect', 'cognitive-validator'] not active"
+        ]
+
+    def test_lock_free_reads_see_published_snapshots(self):
+        """Test that reads done without the lock see every change and return independent lists"""
+        snapshot_before = self.activation_system._active_snapshot
+        self.activation_system.activate_profile("domain-linguist")
+
+        assert snapshot_before == frozenset()
+        assert self.activation_system._active_snapshot == frozenset({"domain-linguist"})
+
+        first = self.activation_system.get_active_profiles()
+        first.clear()
+        assert [p.id for p in self.activation_system.get_active_profiles()] == ["domain-linguist"]
+
+        self.activation_system.deactivate_profile("domain-linguist")
+        assert not self.activation_system.is_active("domain-linguist")
+        assert self.activation_system.get_active_profiles() == []
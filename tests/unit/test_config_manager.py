@@ -153,4 +153,11 @@ class TestConfigManager:
         finally:
             # Clean up test file
             if os.path.exists(test_config_path):
-                os.remove(test_config_path)
\ No newline at end of file
+                os.remove(test_config_path)
+
+    def test_get_config_returns_loaded_instance(self):
+        """Test that get_config returns the already-loaded global configuration"""
+        from src.core.config import get_config, config_manager
+        
+        assert get_config() is get_config()
+        assert get_config() is config_manager.config
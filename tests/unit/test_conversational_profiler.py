@@ -0,0 +1,387 @@
+"""
+Unit tests for the ConversationalProfiler
+"""
+import pytest
+from collections import Counter
+from src.conversational_profiler import ConversationalProfiler, InteractionRecord, PillarView
+
+
+class TestConversationalProfiler:
+    """Test suite for ConversationalProfiler functionality"""
+
+    def setup_method(self):
+        """Setup method that runs before each test"""
+        self.profiler = ConversationalProfiler()
+
+    def test_framework_config_renders_selected_template(self):
+        """Test that the framework template is rendered with the request details"""
+        config = self.profiler._create_framework_specific_config(
+            "crewai", "plan a {launch}", "crew plan"
+        )
+
+        assert config.startswith("# CrewAI Configuration Template")
+        assert 'description="plan a {launch}"' in config
+        assert "# Translated to: crew plan" in config
+
+        fallback = self.profiler._create_framework_specific_config("unknown", "intent", "plan")
+        assert fallback.startswith("# Universal Configuration Template")
+
+    def test_framework_config_is_memoized(self):
+        """Test that repeated template requests are served from the cache"""
+        create = ConversationalProfiler._create_framework_specific_config
+        first = create("autogen", "memo intent", "memo translation")
+        hits = create.cache_info().hits
+
+        assert create("autogen", "memo intent", "memo translation") is first
+        assert create.cache_info().hits == hits + 1
+
+    def test_analysis_summary_reports_each_pillar(self):
+        """Test the summary lines produced for mixed pillar outcomes"""
+        summary = self.profiler.get_analysis_summary({
+            "technical_pillar": {"validation_tests": [{"status": "pass"}, {"status": "fail"}]},
+            "behavioral_pillar": {
+                "behavioral_consistency": {"status": "pass"},
+                "methodology_adherence": {"status": "fail"}
+            },
+            "semantic_pillar": {
+                "semantic_bridge": {"overall_success": True},
+                "hallucination_prevention": {"success": False}
+            },
+            "integration_score": 0.75
+        })
+
+        assert summary.split("\n") == [
+            "## Project Analysis Summary",
+            "",
+            "### Technical Analysis",
+            "- Validation tests: 1/2 passed",
+            "- ⚠️ Some technical validations failed - specific remediation may be required",
+            "### Behavioral Analysis",
+            "- ✅ Behavioral consistency maintained",
+            "- ⚠️ Methodology adherence issues detected",
+            "### Semantic Analysis",
+            "- ✅ Semantic translation successful",
+            "- ⚠️ Hallucination risks detected",
+            "### Integration Score",
+            "- Overall system coherence: 0.75/1.0"
+        ]
+
+    def test_validation_counts_feed_summary_and_confidence(self):
+        """Test that one status count drives both the summary and the confidence"""
+        tests = [{"status": "pass"}, {"status": "pass"}, {"status": "fail"},
+                 {"status": "warning"}, {}]
+        view = PillarView.from_analysis({"technical_pillar": {"validation_tests": tests}})
+
+        assert view.tech_status_counts == {"pass": 2, "fail": 1, "warning": 1, "unknown": 1}
+        assert self.profiler._summarize_validation_results(view.tech_status_counts) == {
+            "pass": 2, "fail": 1, "skip": 2
+        }
+        assert self.profiler._summarize_validation_results(Counter()) == {
+            "pass": 0, "fail": 0, "skip": 0
+        }
+
+        # 2/5 technical, failed behavioral (0.3) and semantic (0.4) checks
+        assert self.profiler._calculate_configuration_confidence(view) == pytest.approx(
+            0.4 * 0.4 + 0.3 * 0.3 + 0.4 * 0.3
+        )
+        empty_view = PillarView.from_analysis({})
+        assert self.profiler._calculate_configuration_confidence(empty_view) == pytest.approx(0.21)
+
+        technical = self.profiler._extract_all_recommendations(view)[0]
+        assert technical["performance_recommendations"] == [
+            "Address 1 technical validation failures identified in analysis"
+        ]
+
+    def test_pillar_view_flattens_analysis(self):
+        """Test that the view exposes pillar leaves with their defaults"""
+        view = PillarView.from_analysis({
+            "behavioral_pillar": {"methodology_adherence": {"status": "pass"}},
+            "semantic_pillar": {
+                "semantic_bridge": {
+                    "overall_success": True,
+                    "translation_result": {"translated_intent": "group chat", "confidence": 0.8}
+                }
+            },
+            "input": {"user_intent": "agents chatting", "target_framework": "autogen"},
+            "integration_score": 0.9
+        })
+
+        assert view.behav_methodology_pass is True
+        assert view.behav_consistency_pass is False
+        assert view.sem_translated_intent == "group chat"
+        assert view.sem_translation_confidence == 0.8
+        assert view.target_framework == "autogen"
+        assert view.tech_validation_tests == []
+        assert view.integration_score == 0.9
+        with pytest.raises(AttributeError):
+            view.integration_score = 0.0
+
+        configs = self.profiler._extract_all_recommendations(view)[3]
+        assert configs["identified_requirements"] == "group chat"
+        assert configs["configuration_template"].startswith("# Autogen Configuration Template")
+
+    def test_request_timestamps_share_one_clock_read(self):
+        """Test that the response, recommendations and stored interaction agree on time"""
+        response = self.profiler.process_user_request("make the agents talk to each other", "autogen")
+
+        timestamp = response["processing_timestamp"]
+        assert response["recommendations"]["generation_timestamp"] == timestamp
+
+        entry = self.profiler.memory_manager.get_latest(["conversational_profiler", "interaction_log"])
+        assert entry.content.timestamp == timestamp
+        assert entry.creation_time.isoformat() == timestamp
+
+    def test_repeated_request_reuses_recent_response(self, monkeypatch):
+        """Test that repeats within the cooldown skip the three-pillar analysis"""
+        from src import conversational_profiler
+
+        calls = []
+        analyze = self.profiler._analyze_project_requirements
+
+        def counting_analyze(user_input, framework_hint=None):
+            calls.append(user_input)
+            return analyze(user_input, framework_hint)
+
+        monkeypatch.setattr(self.profiler, "_analyze_project_requirements", counting_analyze)
+
+        first = self.profiler.process_user_request("Build a chat crew", "crewai")
+        repeat = self.profiler.process_user_request("  build a CHAT crew ", "CrewAI")
+        assert len(calls) == 1
+        assert repeat["analysis"] == first["analysis"]
+        assert repeat["original_request"] == "  build a CHAT crew "
+
+        # Responses are independent copies; changing one does not affect later hits
+        framework_config = first["recommendations"]["framework_specific_configurations"]
+        delivered_framework = framework_config["target_framework"]
+        framework_config["target_framework"] = "changed"
+        repeat["analysis"].clear()
+        again = self.profiler.process_user_request("Build a chat crew", "crewai")
+        assert again["analysis"] == first["analysis"]
+        assert again["recommendations"]["framework_specific_configurations"]["target_framework"] == delivered_framework
+        assert len(calls) == 1
+
+        # A different framework is a different request
+        self.profiler.process_user_request("Build a chat crew", "autogen")
+        assert len(calls) == 2
+
+        # Once the cooldown has passed the analysis runs again
+        monkeypatch.setattr(conversational_profiler, "RECENT_REQUEST_COOLDOWN_SECONDS", 0.0)
+        self.profiler.process_user_request("Build a chat crew", "crewai")
+        assert len(calls) == 3
+
+    def test_recent_response_cache_is_bounded(self):
+        """Test that the least recently used responses are evicted"""
+        from src import conversational_profiler
+        from src.integration_layer.manager import ExecutionProfile
+
+        self.profiler.execution_profile = ExecutionProfile(pillar_workers=1, response_cache_size=2)
+        for key in ("a", "b", "c"):
+            self.profiler._remember_response(key, conversational_profiler._pack_response({"original_request": key}))
+
+        assert list(self.profiler._recent_responses) == ["b", "c"]
+        assert self.profiler._serve_recent_response("a", "a") is None
+        assert self.profiler._serve_recent_response("b", "B") == {"original_request": "B"}
+
+    def test_backroom_is_built_on_first_use(self):
+        """Test that summaries do not construct the three-pillar backroom"""
+        profiler = ConversationalProfiler()
+        profiler.get_analysis_summary({"integration_score": 1.0})
+        assert "integration_layer" not in vars(profiler)
+        assert "memory_manager" not in vars(profiler)
+
+        linguist = profiler.domain_linguist
+        assert linguist is profiler.integration_layer.domain_linguist
+        assert profiler.integration_layer.memory_manager is profiler.memory_manager
+
+    def test_concurrent_first_use_builds_one_memory_manager(self, monkeypatch):
+        """Test that threads racing on first access share one lazily built memory manager"""
+        import threading
+        import time
+        from src import conversational_profiler
+        from src.core.memory.manager import MemoryManager
+
+        built = []
+
+        class SlowMemoryManager(MemoryManager):
+            def __init__(self):
+                time.sleep(0.02)
+                built.append(self)
+                super().__init__()
+
+        monkeypatch.setattr(conversational_profiler, "MemoryManager", SlowMemoryManager)
+        profiler = ConversationalProfiler()
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(profiler.memory_manager)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(manager is built[0] for manager in seen)
+
+    def test_repeated_interactions_are_stored_once(self, monkeypatch):
+        """Test that repeats of a stored interaction only bump its hit count"""
+        from datetime import datetime
+        from src import conversational_profiler
+
+        memory_manager = self.profiler.memory_manager
+        key = conversational_profiler._request_key("Build a chat crew", "crewai")
+        first = datetime(2030, 1, 1, 12, 0, 0)
+        later = datetime(2030, 1, 1, 12, 5, 0)
+
+        self.profiler._store_interaction("Build a chat crew", {}, now=first, request_key=key)
+        self.profiler._store_interaction("build a chat crew", {}, now=later, request_key=key)
+
+        entries = memory_manager.search(tags=["interaction_log"])
+        assert len(entries) == 1
+        assert entries[0].content.hit_count == 2
+        assert entries[0].content.last_seen == later.isoformat()
+
+        # Once the stored interaction is gone the next repeat is stored afresh
+        memory_manager.delete(entries[0].id)
+        self.profiler._store_interaction("Build a chat crew", {}, now=later, request_key=key)
+        entry = memory_manager.get_latest(["interaction_log"])
+        assert entry.content.hit_count == 1
+
+        # Compaction prunes index entries for interactions that are gone
+        memory_manager.delete(entry.id)
+        monkeypatch.setattr(conversational_profiler, "INTERACTION_COMPACTION_INTERVAL", 1)
+        self.profiler._store_interaction("Other request", {}, now=first, request_key="other")
+        other = memory_manager.get_latest(["interaction_log"])
+        assert self.profiler._interaction_ids == {"other": other.id}
+
+    def test_cached_repeats_count_against_stored_interaction(self):
+        """Test that repeats answered from the recent responses still bump the hit count"""
+        for _ in range(3):
+            self.profiler.process_user_request("Build a chat crew", "crewai")
+
+        entries = self.profiler.memory_manager.search(tags=["interaction_log"])
+        assert len(entries) == 1
+        assert entries[0].content.hit_count == 3
+
+        # A cached repeat whose interaction has expired is logged afresh
+        self.profiler.memory_manager.delete(entries[0].id)
+        self.profiler.process_user_request("Build a chat crew", "crewai")
+        entries = self.profiler.memory_manager.search(tags=["interaction_log"])
+        assert [entry.content.hit_count for entry in entries] == [1]
+
+    def test_repeats_do_not_reserialize_the_response(self, monkeypatch):
+        """Test that a response is serialized once however often it is repeated"""
+        from src import conversational_profiler
+
+        packed = []
+        pack = conversational_profiler._pack_response
+        monkeypatch.setattr(conversational_profiler, "_pack_response",
+                            lambda response: packed.append(response) or pack(response))
+
+        for _ in range(3):
+            self.profiler.process_user_request("Build a chat crew", "crewai")
+
+        assert len(packed) == 1
+        entry = self.profiler.memory_manager.get_latest(["interaction_log"])
+        assert entry.content.response()["original_request"] == "Build a chat crew"
+
+    def test_interactions_in_the_same_second_get_distinct_ids(self):
+        """Test that interaction ids do not collide for simultaneous requests"""
+        from datetime import datetime
+
+        now = datetime(2030, 1, 1, 12, 0, 0)
+        self.profiler._store_interaction("first request", {}, now=now, request_key="first")
+        self.profiler._store_interaction("second request", {}, now=now, request_key="second")
+
+        entries = self.profiler.memory_manager.search(tags=["interaction_log"])
+        assert sorted(entry.content.user_input for entry in entries) == ["first request", "second request"]
+
+    def test_get_configuration_reads_framework_template(self):
+        """Test that the configuration template is exposed through the getter"""
+        recommendations = self.profiler._generate_configurations_from_analysis(
+            {"input": {"user_intent": "agents chatting", "target_framework": "langgraph"}}
+        )
+
+        assert "configurations" not in recommendations
+        template = self.profiler.get_configuration(recommendations)
+        assert template is recommendations["framework_specific_configurations"]["configuration_template"]
+        assert template.startswith("# LangGraph Configuration Template")
+        assert self.profiler.get_configuration(recommendations, "LangGraph") is template
+        assert self.profiler.get_configuration(recommendations, "autogen") is None
+        assert self.profiler.get_configuration({}) is None
+
+    def test_analysis_targets_share_immutable_methodology_steps(self):
+        """Test that targets get their own methodology dict over shared step tuples"""
+        first = self.profiler._build_analysis_target("first request")
+        second = self.profiler._build_analysis_target("second request", "autogen")
+
+        assert type(first["required_methodology"]) is dict
+        assert first["required_methodology"] is not second["required_methodology"]
+        assert first["required_methodology"]["steps"] is second["required_methodology"]["steps"]
+        assert first["required_methodology"]["steps"] == ("analyze", "design", "validate", "recommend")
+        assert second["target_framework"] == "autogen"
+
+        first["required_methodology"]["steps"] = ()
+        assert self.profiler._build_analysis_target("third request")["required_methodology"]["steps"]
+
+    def test_processed_request_is_json_serializable(self):
+        """Test that a full profiler response can be serialized to JSON"""
+        import json
+
+        response = self.profiler.process_user_request("make the agents talk to each other", "autogen")
+
+        assert json.loads(json.dumps(response))["original_request"] == "make the agents talk to each other"
+
+    def test_interaction_memory_keeps_slim_record(self):
+        """Test that stored interactions hold a record with the response compressed"""
+        response = self.profiler.process_user_request("make the agents talk to each other", "autogen")
+
+        record = self.profiler.memory_manager.get_latest(["interaction_log"]).content
+        assert isinstance(record, InteractionRecord)
+        assert not hasattr(record, "__dict__")
+        assert record.user_input == "make the agents talk to each other"
+        assert record.integration_score == response["analysis"]["integration_score"]
+        assert record.confidence == response["recommendations"]["framework_specific_configurations"]["confidence_score"]
+        assert record.hit_count == 1
+
+        restored = record.response()
+        assert restored["original_request"] == response["original_request"]
+        assert restored["processing_timestamp"] == response["processing_timestamp"]
+
+    def test_execution_profile_sizes_backroom(self):
+        """Test that the execution profile reaches the integration layer"""
+        from src.integration_layer.manager import EXECUTION_PROFILES
+
+        assert self.profiler.execution_profile is EXECUTION_PROFILES["balanced"]
+
+        lean = ConversationalProfiler(execution_profile="lean")
+        assert lean.integration_layer.execution_profile is EXECUTION_PROFILES["lean"]
+        response = lean.process_user_request("make the agents talk to each other", "autogen")
+        assert "semantic_bridge" in response["analysis"]["semantic_pillar"]
+
+        with pytest.raises(ValueError):
+            ConversationalProfiler(execution_profile="turbo")
+
+    def test_framework_hints_are_canonicalized_once(self, monkeypatch):
+        """Test that free-form framework hints reach the backroom as canonical ids"""
+        from src.conversational_profiler import _canonical_framework
+
+        assert _canonical_framework(" Semantic-Kernel ") == "semantic_kernel"
+        assert _canonical_framework("AG2") == "autogen"
+        assert _canonical_framework("crew") == "crewai"
+        assert _canonical_framework("unknown") == "universal"
+        assert _canonical_framework(None) == "universal"
+
+        targets = []
+        execute = self.profiler.integration_layer.execute_integrated_profiling
+
+        def recording_execute(target):
+            targets.append(target)
+            return execute(target)
+
+        monkeypatch.setattr(self.profiler.integration_layer, "execute_integrated_profiling", recording_execute)
+        self.profiler.process_user_request("plan a kernel", "SK")
+        assert targets[0]["target_framework"] == "semantic_kernel"
+
+        recommendations = {"framework_specific_configurations": {
+            "target_framework": "semantic_kernel", "configuration_template": "template"
+        }}
+        assert self.profiler.get_configuration(recommendations, "Semantic-Kernel") == "template"
+        assert self.profiler.get_configuration(recommendations, "langgraph") is None
@@ -3,7 +3,7 @@ Unit tests for the MemoryManager component
 """
 import pytest
 from datetime import datetime, timedelta
-from src.core.memory.manager import MemoryManager, MemoryEntry, MemoryType
+from src.core.memory.manager import MemoryManager, MemoryEntry, MemoryType, sequenced_entry_id
 
 
 class TestMemoryManager:
@@ -201,4 +201,58 @@ class TestMemoryManager:
 
         # Verify it's not retrievable
         retrieved_after = self.memory_manager.retrieve("expired_test")
-        assert retrieved_after is None
\ No newline at end of file
+        assert retrieved_after is None
+
+    def test_store_many_and_patch(self):
+        """Test batch storing entries and patching their content in place"""
+        entries = [
+            MemoryEntry(
+                id=f"batch_{i}",
+                content={"index": i, "enabled": True},
+                creation_time=datetime.now(),
+                memory_type=MemoryType.LONG_TERM
+            )
+            for i in range(3)
+        ]
+
+        assert self.memory_manager.store_many(entries) is True
+        assert all(self.memory_manager.retrieve(f"batch_{i}") for i in range(3))
+
+        assert self.memory_manager.patch("batch_1", {"enabled": False}) is True
+        patched = self.memory_manager.retrieve("batch_1")
+        assert patched.content == {"index": 1, "enabled": False}
+
+        # Patching a missing entry fails
+        assert self.memory_manager.patch("missing_entry", {"enabled": False}) is False
+
+    def test_get_latest_by_tags(self):
+        """Test retrieving the newest entry matching any tag"""
+        base_time = datetime.now()
+        for i, tags in enumerate([["behavioral"], ["pattern"], ["behavioral", "pattern"], ["other"]]):
+            self.memory_manager.store(MemoryEntry(
+                id=f"latest_{i}",
+                content={"index": i},
+                creation_time=base_time + timedelta(seconds=i),
+                memory_type=MemoryType.LONG_TERM,
+                tags=tags
+            ))
+
+        latest = self.memory_manager.get_latest(["behavioral", "pattern"], MemoryType.LONG_TERM)
+        assert latest.id == "latest_2"
+        assert self.memory_manager.get_latest(["behavioral"], MemoryType.SHORT_TERM) is None
+        assert self.memory_manager.get_latest(["missing_tag"]) is None
+
+        # Removing or retagging the newest entry falls back to the next newest
+        self.memory_manager.delete("latest_2")
+        assert self.memory_manager.get_latest(["behavioral", "pattern"]).id == "latest_1"
+
+        self.memory_manager.update("latest_1", {"index": 1}, tags=["other"])
+        assert self.memory_manager.get_latest(["behavioral", "pattern"]).id == "latest_0"
+
+    def test_sequenced_entry_ids_are_unique_across_prefixes(self):
+        """Test that sequenced ids keep their prefix and never repeat"""
+        ids = [sequenced_entry_id("drift") for _ in range(3)] + [sequenced_entry_id("interaction")]
+
+        assert len(set(ids)) == 4
+        assert all(entry_id.startswith("drift_") for entry_id in ids[:3])
+        assert ids[3].startswith("interaction_")
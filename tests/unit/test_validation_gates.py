@@ -0,0 +1,33 @@
+"""
+Unit tests for the ValidationGates component
+"""
+import pytest
+from src.core.memory.manager import MemoryManager
+from src.core.validation_gates.manager import ValidationGates, ValidationGate
+
+
+class TestValidationGates:
+    """Test suite for ValidationGates functionality"""
+    
+    def setup_method(self):
+        """Setup method that runs before each test"""
+        self.validation_gates = ValidationGates(memory_manager=MemoryManager())
+    
+    def test_validate_rules_matches_individual_runs(self):
+        """Test that batched rule runs line up with their ids"""
+        self.validation_gates.disable_gate(ValidationGate.VISION_ALIGNMENT)
+        rule_ids = ["tech_implementation_check", "unknown_rule", "vision_alignment_check",
+                    "behavior_consistency_check"]
+        
+        results = self.validation_gates.validate_rules(rule_ids, {"user_intent": "test"})
+        
+        assert len(results) == len(rule_ids)
+        assert results[1] is None
+        assert results[2] is None
+        for rule_id, result in zip(rule_ids, results):
+            if result is not None:
+                expected = self.validation_gates.validate_rule(rule_id, {"user_intent": "test"})
+                assert result.status == expected.status
+                assert result.metadata["rule_id"] == rule_id
+        
+        assert self.validation_gates.validate_rules([]) == []